@@ -2,7 +2,11 @@ import numpy
 from numpy.linalg import inv, eig
 from math import ceil
 from matplotlib import pyplot, ticker, get_backend, rc
-from itertools import cycle
+from matplotlib.animation import FuncAnimation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 # interactive backends
 INTERACTIVE_BACKENDS = ['GTK3Agg', 'GTK3Cairo', 'MacOSX', 'nbAgg',
@@ -31,6 +35,60 @@ quiver_params = {'angles': 'xy',
 grid_params = {'linewidth': 0.5,
                'alpha': 0.8}
 
+def grid_segments(X, Y):
+    """ Segments of a transformed grid for a LineCollection: the row line and the column
+    line through each grid index alternate, so colors=[c_row, c_col] cycles between them.
+    The grid lines are straight, so each segment only keeps its two end points.
+
+    Parameters
+    ----------
+    X, Y : class numpy.ndarray.
+        Grid coordinates of shape (n, n), e.g. from numpy.meshgrid mapped by a matrix.
+
+    """
+    points = numpy.stack((X, Y), axis=-1)
+    rows = points[:, [0, -1]]
+    cols = points[[0, -1], :].transpose(1, 0, 2)
+    return numpy.stack((rows, cols), axis=1).reshape(-1, 2, 2)
+
+def transform_grid(matrix, *coords):
+    """ Apply a matrix to grid coordinate arrays with a single matrix multiply.
+
+    Parameters
+    ----------
+    matrix : class numpy.ndarray.
+        The (d,d) matrix, d being the number of coordinate arrays.
+
+    *coords : class numpy.ndarray.
+        d arrays of the same shape, e.g. from numpy.meshgrid.
+
+    Returns
+    -------
+    class numpy.ndarray of shape (d, *coords[0].shape), the transformed coordinates.
+
+    """
+    points = numpy.stack(coords).reshape(len(coords), -1)
+    return (matrix @ points).reshape(len(coords), *coords[0].shape)
+
+def grid_segments_3d(X, Y, Z):
+    """ Segments of a transformed 3d grid, one (n*n, 2, 3) array per direction of the grid
+    lines (along the first, second and third meshgrid axis), end points only.
+
+    """
+    points = numpy.stack((X, Y, Z), axis=-1)
+    return [numpy.moveaxis(points, axis, 2)[:, :, [0, -1]].reshape(-1, 2, 3) for axis in range(3)]
+
+def stack_vectors(vectors):
+    """ Stack the *vectors arguments of the plotting functions into one (N,2) array. Each
+    argument is a single vector of shape (2,) or (2,1), or an (N,2) array of N vectors.
+    Returns None when there are no vectors.
+
+    """
+    if not len(vectors):
+        return None
+    vectors = numpy.vstack([numpy.asarray(vector, dtype=float).reshape(-1, 2) for vector in vectors])
+    return vectors if len(vectors) else None
+
 def set_rc(func):
     def wrapper(*args, **kwargs):
         fontsize = 4 if get_backend() in INTERACTIVE_BACKENDS else 5
@@ -38,13 +96,17 @@ def set_rc(func):
         rc('figure', dpi=200)
         rc('axes', axisbelow=True, titlesize=5)
         rc('lines', linewidth=1)
-        func(*args, **kwargs)
+        return func(*args, **kwargs)
     return wrapper
 
 @set_rc
-def plot_vector(vectors, tails=None):
+def plot_vector(vectors, tails=None, max_arrows=2000, bins=200):
     ''' Draw 2d vectors based on the values of the vectors and the position of their tails.
 
+    Up to max_arrows vectors are drawn exactly. Beyond that, a fixed-size random subset of
+    max_arrows arrows is drawn over a density raster of all the heads, so the drawing cost
+    stays about the same however many vectors there are.
+
     Parameters
     ----------
     vectors : list.
@@ -56,6 +118,13 @@ def plot_vector(vectors, tails=None):
         origin (0,0). If len(tails) is 1, all tails are set at the same position. Otherwise,
         vectors and tails must have the same length.
 
+    max_arrows : int, optional.
+        Largest number of arrows to draw, default to 2000. More vectors than that switch to
+        decimated arrows plus a head-density raster.
+
+    bins : int, optional.
+        Number of bins per axis of the head-density raster, default to 200.
+
     Examples
     --------
     >>> v = [(1, 3), (3, 3), (4, 6)]
@@ -64,6 +133,7 @@ def plot_vector(vectors, tails=None):
     >>> plot_vector(v, t)   # draw 3 vectors with their tails at (2,2)
     >>> t = [[3, 2], [-1, -2], [3, 5]]
     >>> plot_vector(v, t)   # draw 3 vectors with 3 different tails
+    >>> plot_vector(numpy.random.randn(100000, 2))   # arrows subset over a density raster
 
     '''
     vectors = numpy.array(vectors)
@@ -86,11 +156,19 @@ def plot_vector(vectors, tails=None):
 
     # calculate xlimit & ylimit
     heads = tails + vectors
-    limit = numpy.max(numpy.abs(numpy.hstack((tails, heads))))
+    limit = max(numpy.max(numpy.abs(tails)), numpy.max(numpy.abs(heads)))
     limit = numpy.ceil(limit * 1.2)   # add some margins
 
     figsize = numpy.array([2,2]) * get_figure_scale()
     figure, axis = pyplot.subplots(figsize=figsize)
+    if len(vectors) > max_arrows:
+        density, _, _ = numpy.histogram2d(heads[:,0], heads[:,1], bins=bins,
+                                          range=[[-limit, limit], [-limit, limit]])
+        density = numpy.ma.masked_equal(density.T, 0)
+        axis.imshow(numpy.ma.log(density), origin='lower', extent=(-limit, limit, -limit, limit),
+                    cmap='Blues', alpha=0.8, interpolation='nearest', zorder=0)
+        keep = numpy.random.RandomState(0).choice(len(vectors), max_arrows, replace=False)
+        tails, vectors = tails[keep], vectors[keep]
     axis.quiver(tails[:,0], tails[:,1], vectors[:,0], vectors[:,1], color=darkblue,
                   angles='xy', scale_units='xy', scale=1)
     axis.set_xlim([-limit, limit])
@@ -116,7 +194,8 @@ def plot_vector(vectors, tails=None):
 
 
 @set_rc
-def plot_transformation_helper(axis, matrix, *vectors, unit_vector=True, unit_circle=False, title=None):
+def plot_transformation_helper(axis, matrix, *vectors, unit_vector=True, unit_circle=False, title=None,
+                               grid_range=20):
     """ A helper function to plot the linear transformation defined by a 2x2 matrix.
 
     Parameters
@@ -129,7 +208,8 @@ def plot_transformation_helper(axis, matrix, *vectors, unit_vector=True, unit_ci
 
     *vectors : class numpy.ndarray.
         The vector(s) to plot along with the linear transformation. Each array denotes a vector's
-        coordinates before the transformation and must have a shape of (2,). Accept any number of vectors.
+        coordinates before the transformation and must have a shape of (2,), or be an (N,2) array
+        of N vectors. Accept any number of vectors; all of them are drawn with one quiver.
 
     unit_vector : bool, optional.
         Whether to plot unit vectors of the standard basis, default to True.
@@ -140,57 +220,20 @@ def plot_transformation_helper(axis, matrix, *vectors, unit_vector=True, unit_ci
     title: str, optional.
         Title of the plot.
 
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each basis vector, default to 20.
+
     """
     assert matrix.shape == (2,2), "the input matrix must have a shape of (2,2)"
-    grid_range = 20
-    x = numpy.arange(-grid_range, grid_range+1)
-    X_, Y_ = numpy.meshgrid(x,x)
-    I = matrix[:,0]
-    J = matrix[:,1]
-    X = I[0]*X_ + J[0]*Y_
-    Y = I[1]*X_ + J[1]*Y_
-    origin = numpy.zeros(1)
-
-    # draw grid lines
-    for i in range(x.size):
-        axis.plot(X[i,:], Y[i,:], c=gold, **grid_params)
-        axis.plot(X[:,i], Y[:,i], c=lightblue, **grid_params)
-
-    # draw (transformed) unit vectors
-    if unit_vector:
-        axis.quiver(origin, origin, [I[0]], [I[1]], color=green, **quiver_params)
-        axis.quiver(origin, origin, [J[0]], [J[1]], color=red, **quiver_params)
-
-    # draw optional vectors
-    color_cycle = cycle([pink, darkblue, orange, purple, brown])
-    if vectors:
-        for vector in vectors:
-            color = next(color_cycle)
-            vector_ = matrix @ vector.reshape(-1,1)
-            axis.quiver(origin, origin, [vector_[0]], [vector_[1]], color=color, **quiver_params)
-
-    # draw optional unit circle
-    if unit_circle:
-        alpha =  numpy.linspace(0, 2*numpy.pi, 41)
-        circle = numpy.vstack((numpy.cos(alpha), numpy.sin(alpha)))
-        circle_trans = matrix @ circle
-        axis.plot(circle_trans[0], circle_trans[1], color=red, lw=0.8)
-
-    # hide frames, set xlimit & ylimit, set title
-    limit = 4
-    axis.spines['left'].set_position('center')
-    axis.spines['bottom'].set_position('center')
-    axis.spines['left'].set_linewidth(0.3)
-    axis.spines['bottom'].set_linewidth(0.3)
-    axis.spines['right'].set_color('none')
-    axis.spines['top'].set_color('none')
-    axis.set_xlim([-limit, limit])
-    axis.set_ylim([-limit, limit])
+    # grid, unit vectors, all optional vectors in one quiver, unit circle
+    _, update = transformation_artists(axis, unit_vector, unit_circle,
+                                       vectors=stack_vectors(vectors), grid_range=grid_range)
+    update(matrix)
     if title is not None:
         axis.set_title(title)
 
 @set_rc
-def plot_linear_transformation(matrix, *vectors, unit_vector=True, unit_circle=False):
+def plot_linear_transformation(matrix, *vectors, unit_vector=True, unit_circle=False, grid_range=20):
     """ Plot the linear transformation defined by a 2x2 matrix using the helper
     function plot_transformation_helper(). It will create 2 subplots to visualize some
     vectors before and after the transformation.
@@ -202,7 +245,8 @@ def plot_linear_transformation(matrix, *vectors, unit_vector=True, unit_circle=F
 
     *vectors : class numpy.ndarray.
         The vector(s) to plot along with the linear transformation. Each array denotes a vector's
-        coordinates before the transformation and must have a shape of (2,). Accept any number of vectors.
+        coordinates before the transformation and must have a shape of (2,), or be an (N,2) array
+        of N vectors. Accept any number of vectors; all of them are drawn with one quiver.
 
     unit_vector : bool, optional.
         Whether to plot unit vectors of the standard basis, default to True.
@@ -210,15 +254,18 @@ def plot_linear_transformation(matrix, *vectors, unit_vector=True, unit_circle=F
     unit_circle: bool, optional.
         Whether to plot unit circle, default to False.
 
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each basis vector, default to 20.
+
     """
     figsize = numpy.array([4,2]) * get_figure_scale()
     figure, (axis1, axis2) = pyplot.subplots(1, 2, figsize=figsize)
-    plot_transformation_helper(axis1, numpy.identity(2), *vectors, unit_vector=unit_vector, unit_circle=unit_circle, title='Before transformation')
-    plot_transformation_helper(axis2, matrix, *vectors, unit_vector=unit_vector, unit_circle=unit_circle, title='After transformation')
+    plot_transformation_helper(axis1, numpy.identity(2), *vectors, unit_vector=unit_vector, unit_circle=unit_circle, title='Before transformation', grid_range=grid_range)
+    plot_transformation_helper(axis2, matrix, *vectors, unit_vector=unit_vector, unit_circle=unit_circle, title='After transformation', grid_range=grid_range)
 
 
 @set_rc
-def plot_linear_transformations(*matrices, unit_vector=True, unit_circle=False):
+def plot_linear_transformations(*matrices, unit_vector=True, unit_circle=False, grid_range=20):
     """ Plot the linear transformation defined by a sequence of n 2x2 matrices using the helper
     function plot_transformation_helper(). It will create n+1 subplots to visualize some
     vectors before and after each transformation.
@@ -234,6 +281,9 @@ def plot_linear_transformations(*matrices, unit_vector=True, unit_circle=False):
     unit_circle: bool, optional.
         Whether to plot unit circle, default to False.
 
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each basis vector, default to 20.
+
     """
     nplots = len(matrices) + 1
     nx = 2
@@ -251,7 +301,8 @@ def plot_linear_transformations(*matrices, unit_vector=True, unit_circle=False):
                 title = 'After {} transformation'.format(i)
             else:
                 title = 'After {} transformations'.format(i)
-        plot_transformation_helper(axes[i//nx, i%nx], matrix_trans, unit_vector=unit_vector, unit_circle=unit_circle, title=title)
+        plot_transformation_helper(axes[i//nx, i%nx], matrix_trans, unit_vector=unit_vector, unit_circle=unit_circle, title=title,
+                                   grid_range=grid_range)
     # hide axes of the extra subplot (only when nplots is an odd number)
     if nx*ny > nplots:
         axes[-1,-1].axis('off')
@@ -259,7 +310,7 @@ def plot_linear_transformations(*matrices, unit_vector=True, unit_circle=False):
 
 
 @set_rc
-def plot_3d_transformation_helper(axis, matrix, grid=True, unit_sphere=False, title=None):
+def plot_3d_transformation_helper(axis, matrix, grid=True, unit_sphere=False, title=None, grid_range=2):
     """ A helper function to plot the linear transformation defined by a 3x3 matrix.
 
     Parameters
@@ -279,22 +330,20 @@ def plot_3d_transformation_helper(axis, matrix, grid=True, unit_sphere=False, ti
     title : str, optional.
         Title of the plot.
 
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each axis, default to 2.
+
     """
     assert matrix.shape == (3,3), "the input matrix must have a shape of (3,3)"
     xcolor, ycolor, zcolor = '#0084b6', '#d8a322', '#FF3333'
     linewidth = 0.7
     if grid:
-        grid_range = 2
         x = numpy.arange(-grid_range, grid_range+1)
         X, Y, Z = numpy.meshgrid(x,x,x)
-        X_new = matrix[0,0]*X + matrix[0,1]*Y + matrix[0,2]*Z
-        Y_new = matrix[1,0]*X + matrix[1,1]*Y + matrix[1,2]*Z
-        Z_new = matrix[2,0]*X + matrix[2,1]*Y + matrix[2,2]*Z
-        for i in range(x.size):
-            for j in range(x.size):
-                axis.plot(X_new[:,i,j], Y_new[:,i,j], Z_new[:,i,j], color=xcolor, linewidth=linewidth)
-                axis.plot(X_new[i,:,j], Y_new[i,:,j], Z_new[i,:,j], color=ycolor, linewidth=linewidth)
-                axis.plot(X_new[i,j,:], Y_new[i,j,:], Z_new[i,j,:], color=zcolor, linewidth=linewidth)
+        X_new, Y_new, Z_new = transform_grid(matrix, X, Y, Z)
+        # one collection per color family instead of 3*n^2 line artists
+        for segments, color in zip(grid_segments_3d(X_new, Y_new, Z_new), (xcolor, ycolor, zcolor)):
+            axis.add_collection3d(Line3DCollection(segments, colors=color, linewidths=linewidth))
 
     if unit_sphere:
         u = numpy.linspace(0, 2 * numpy.pi, 100)
@@ -302,9 +351,7 @@ def plot_3d_transformation_helper(axis, matrix, grid=True, unit_sphere=False, ti
         X = 1 * numpy.outer(numpy.cos(u), numpy.sin(v))
         Y = 1 * numpy.outer(numpy.sin(u), numpy.sin(v))
         Z = 1 * numpy.outer(numpy.ones(numpy.size(u)), numpy.cos(v))
-        X_new = matrix[0,0]*X + matrix[0,1]*Y + matrix[0,2]*Z
-        Y_new = matrix[1,0]*X + matrix[1,1]*Y + matrix[1,2]*Z
-        Z_new = matrix[2,0]*X + matrix[2,1]*Y + matrix[2,2]*Z
+        X_new, Y_new, Z_new = transform_grid(matrix, X, Y, Z)
         axis.plot_surface(X_new, Y_new, Z_new, rstride=4, cstride=4, linewidth=0, cmap='ocean', alpha=0.6)
 
     if title is not None:
@@ -325,7 +372,7 @@ def plot_3d_transformation_helper(axis, matrix, grid=True, unit_sphere=False, ti
         axis.tick_params(axis=axis_str, pad=-3)
 
 @set_rc
-def plot_3d_linear_transformation(matrix, grid=True, unit_sphere=False):
+def plot_3d_linear_transformation(matrix, grid=True, unit_sphere=False, grid_range=2):
     """ Plot the linear transformation defined by a 3x3 matrix using the helper
     function plot_3d_transformation_helper(). It will create 2 subplots to visualize some
     vectors before and after the transformation.
@@ -341,18 +388,21 @@ def plot_3d_linear_transformation(matrix, grid=True, unit_sphere=False):
     unit_sphere : bool, optional.
         Whether to plot unit sphere, default to False.
 
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each axis, default to 2.
+
     """
 
     figsize = numpy.array([4,2]) * get_figure_scale()
     figure = pyplot.figure(figsize=figsize)
     axis1 = figure.add_subplot(1, 2, 1, projection='3d')
     axis2 = figure.add_subplot(1, 2, 2, projection='3d')
-    plot_3d_transformation_helper(axis1, numpy.identity(3), grid=grid, unit_sphere=unit_sphere, title='before transformation')
-    plot_3d_transformation_helper(axis2, matrix, grid=grid, unit_sphere=unit_sphere, title='after transformation')
+    plot_3d_transformation_helper(axis1, numpy.identity(3), grid=grid, unit_sphere=unit_sphere, title='before transformation', grid_range=grid_range)
+    plot_3d_transformation_helper(axis2, matrix, grid=grid, unit_sphere=unit_sphere, title='after transformation', grid_range=grid_range)
 
 
 @set_rc
-def plot_3d_linear_transformations(*matrices, grid=False, unit_sphere=False):
+def plot_3d_linear_transformations(*matrices, grid=False, unit_sphere=False, grid_range=2):
     """ Plot the linear transformation defined by a sequence of n 3x3 matrices using the helper
     function plot_3d_transformation_helper(). It will create n+1 subplots to visualize some
     vectors before and after each transformation.
@@ -368,6 +418,9 @@ def plot_3d_linear_transformations(*matrices, grid=False, unit_sphere=False):
     unit_sphere : bool, optional.
         Whether to plot unit sphere, default to False.
 
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each axis, default to 2.
+
     """
     nplots = len(matrices) + 1
     nx = 2                 # number of figures per row
@@ -386,11 +439,12 @@ def plot_3d_linear_transformations(*matrices, grid=False, unit_sphere=False):
                 title = 'After {} transformation'.format(i)
             else:
                 title = 'After {} transformations'.format(i)
-        plot_3d_transformation_helper(axis, matrix_trans, grid=grid, unit_sphere=unit_sphere, title=title)
+        plot_3d_transformation_helper(axis, matrix_trans, grid=grid, unit_sphere=unit_sphere, title=title,
+                                      grid_range=grid_range)
 
 
 @set_rc
-def plot_basis_helper(axis, I, J, *vectors, title=None, I_label='i', J_label='j'):
+def plot_basis_helper(axis, I, J, *vectors, title=None, I_label='i', J_label='j', grid_range=20):
     """ A helper function to plot the 2D coordinate system determined by the basis I,J.
 
     Parameters
@@ -404,7 +458,7 @@ def plot_basis_helper(axis, I, J, *vectors, title=None, I_label='i', J_label='j'
     *vectors : class numpy.ndarray.
         The vector(s) to plot along with the change of basis. Each array denotes a vector's
         coordinates in I-J coordinate system (not in the standard basis). Each vector must have
-        a shape of (2,). Accept any number of vectors.
+        a shape of (2,), or be an (N,2) array of N vectors. Accept any number of vectors.
 
     I_label, J_label : str, optional.
         Label of the new basis, default to 'i' and 'j'.
@@ -412,56 +466,19 @@ def plot_basis_helper(axis, I, J, *vectors, title=None, I_label='i', J_label='j'
     title: str, optional.
         Title of the plot.
 
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each basis vector, default to 20.
+
     """
-    grid_range = 20
-    x = numpy.arange(-grid_range, grid_range+1)
-    X_, Y_ = numpy.meshgrid(x,x)   # grid coordinates on the new basis
-    X = I[0]*X_ + J[0]*Y_   # grid coordinates on the standard basis
-    Y = I[1]*X_ + J[1]*Y_
-
-    # draw origin
-    origin = numpy.zeros(1)
-    axis.scatter(origin, origin, c='black', s=3)
-
-    # draw grid lines of the new coordinate system
-    lw_grid = 0.4
-    for i in range(x.size):
-        axis.plot(X[i,:], Y[i,:], c=grey, lw=lw_grid)
-        axis.plot(X[:,i], Y[:,i], c=grey, lw=lw_grid)
-
-    # highlight new axes (spines)
-    lw_spine = 0.7
-    zero_id = numpy.where(x==0)[0][0]
-    axis.plot(X[zero_id,:], Y[zero_id,:], c=gold, lw=lw_spine)
-    axis.plot(X[:,zero_id], Y[:,zero_id], c=lightblue, lw=lw_spine)
-
-    # draw basis vectors using quiver plot
-    axis.quiver(origin, origin, [I[0]], [I[1]], color=gold, **quiver_params)
-    axis.quiver(origin, origin, [J[0]], [J[1]], color=lightblue, **quiver_params)
-
-    # draw input vector on new coordinate system
-    bound = 5
-    if vectors:
-        for vector in vectors:
-            M = numpy.transpose(numpy.vstack((I,J)))
-            vector = M @ vector.reshape(-1,1)
-            axis.quiver(origin, origin, [vector[0]], [vector[1]], color=red, **quiver_params)
-            bound = max(ceil(numpy.max(numpy.abs(vector))), bound)
-
-    # hide frames, set xlimit & ylimit, set title
-    axis.set_xlim([-bound, bound])
-    axis.set_ylim([-bound, bound])
-    axis.axis('off')
+    # origin, grid and spines of the new coordinate system, basis vectors, all input vectors
+    # in one quiver, basis labels
+    _, update = basis_artists(axis, stack_vectors(vectors), I_label, J_label, grid_range)
+    update(I, J)
     if title is not None:
         axis.set_title(title)
 
-    # add text next to new basis vectors
-    text_params = {'ha': 'center', 'va': 'center', 'size' : 6}
-    axis.text((I[0]-J[0])/2*1.1, (I[1]-J[1])/2*1.1, r'${}$'.format(I_label), color=gold, **text_params)
-    axis.text((J[0]-I[0])/2*1.1, (J[1]-I[1])/2*1.1, r'${}$'.format(J_label), color=lightblue, **text_params)
-
 @set_rc
-def plot_basis(I, J, *vectors):
+def plot_basis(I, J, *vectors, grid_range=20):
     """ Plot 2d vectors on the coordinates system defined by basis I and J using the helper funtion
     plot_basis_helper().
 
@@ -473,16 +490,19 @@ def plot_basis(I, J, *vectors):
     *vectors : class numpy.ndarray.
         The vector(s) to plot along with the change of basis. Each array denotes a vector's
         coordinates in I-J coordinate system (not in the standard basis). Each vector must have
-        a shape of (2,). Accept any number of vectors.
+        a shape of (2,), or be an (N,2) array of N vectors. Accept any number of vectors.
+
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each basis vector, default to 20.
 
     """
     figsize = numpy.array([2,2]) * get_figure_scale()
     figure, axis = pyplot.subplots(figsize=figsize)
-    plot_basis_helper(axis, I, J, *vectors)
+    plot_basis_helper(axis, I, J, *vectors, grid_range=grid_range)
 
 
 @set_rc
-def plot_change_basis(I, J, *vectors):
+def plot_change_basis(I, J, *vectors, grid_range=20):
     """ Create a side-by-side plot of some vectors both on the standard basis and on the new basis
     defined by I and J, using the helper function plot_basis_helper().
 
@@ -494,20 +514,25 @@ def plot_change_basis(I, J, *vectors):
     *vectors : class numpy.ndarray.
         The vector(s) to plot along with the change of basis. Each array denotes a vector's
         coordinates in I-J coordinate system (not in the standard basis). Each vector must have
-        a shape of (2,). Accept any number of vectors.
+        a shape of (2,), or be an (N,2) array of N vectors. Accept any number of vectors.
+
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each basis vector, default to 20.
 
     """
     figsize = numpy.array([4,2]) * get_figure_scale()
     figure, (axis1, axis2) = pyplot.subplots(1, 2, figsize=figsize)
     M = numpy.transpose(numpy.vstack((I,J)))
     M_inv = inv(M)
-    vectors_ = [ M_inv @ vector.reshape(-1, 1) for vector in vectors ]
-    plot_basis_helper(axis1, numpy.array([1,0]), numpy.array([0,1]), *vectors, title='standard basis')
-    plot_basis_helper(axis2, I, J, *vectors_, title='new basis', I_label='a', J_label='b')
+    vectors_ = [stack_vectors(vectors) @ M_inv.T] if vectors else []   # one matmul for all vectors
+    plot_basis_helper(axis1, numpy.array([1,0]), numpy.array([0,1]), *vectors, title='standard basis',
+                      grid_range=grid_range)
+    plot_basis_helper(axis2, I, J, *vectors_, title='new basis', I_label='a', J_label='b',
+                      grid_range=grid_range)
 
 
 @set_rc
-def plot_eigen(matrix):
+def plot_eigen(matrix, grid_range=20):
     """ Visualize the eigendecomposition of a 2x2 matrix as a combination of changing basis
     and scaling transformation, using the helper function plot_basis_helper().
 
@@ -516,6 +541,9 @@ def plot_eigen(matrix):
     matrix : class numpy.ndarray.
         The 2x2 matrix to visualize.
 
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each basis vector, default to 20.
+
     """
     figsize = numpy.array([4,4]) * get_figure_scale()
     figure, axes = pyplot.subplots(2, 2, figsize=figsize)
@@ -528,10 +556,10 @@ def plot_eigen(matrix):
     alpha =  numpy.linspace(0, 2*numpy.pi, 41)
     circle = numpy.vstack((numpy.cos(alpha), numpy.sin(alpha)))
 
-    plot_basis_helper(axes[0,0], numpy.array([1,0]), numpy.array([0,1]), title=r'coords in standard basis $\mathbf{x}$')
-    plot_basis_helper(axes[0,1], C[:,0], C[:,1], title=r'change to new basis $C^{-1}\mathbf{x}$', I_label='a', J_label='b')
-    plot_basis_helper(axes[1,0], C[:,0], C[:,1], title=r'scale along new basis $DC^{-1}\mathbf{x}$', I_label='a', J_label='b')
-    plot_basis_helper(axes[1,1], numpy.array([1,0]), numpy.array([0,1]), title=r'change back to standard basis $CDC^{-1}\mathbf{x}$')
+    plot_basis_helper(axes[0,0], numpy.array([1,0]), numpy.array([0,1]), title=r'coords in standard basis $\mathbf{x}$', grid_range=grid_range)
+    plot_basis_helper(axes[0,1], C[:,0], C[:,1], title=r'change to new basis $C^{-1}\mathbf{x}$', I_label='a', J_label='b', grid_range=grid_range)
+    plot_basis_helper(axes[1,0], C[:,0], C[:,1], title=r'scale along new basis $DC^{-1}\mathbf{x}$', I_label='a', J_label='b', grid_range=grid_range)
+    plot_basis_helper(axes[1,1], numpy.array([1,0]), numpy.array([0,1]), title=r'change back to standard basis $CDC^{-1}\mathbf{x}$', grid_range=grid_range)
 
     circle_trans = matrix @ circle
     for axis in axes[0]:
@@ -541,5 +569,556 @@ def plot_eigen(matrix):
 
 
 
+def interpolate_matrices(matrices, frames):
+    """ Matrices of a continuous animation from the identity through the cumulative products
+    of a sequence of matrices (matrices[0], matrices[1] @ matrices[0], ...), interpolating
+    linearly between consecutive products.
+
+    Parameters
+    ----------
+    matrices : list of class numpy.ndarray.
+        The (d,d) matrices, applied in order.
+
+    frames : int.
+        Number of frames, including the identity and the final product.
+
+    Returns
+    -------
+    class numpy.ndarray of shape (frames, d, d).
+
+    """
+    keys = [numpy.identity(matrices[0].shape[0])]
+    for matrix in matrices:
+        keys.append(matrix @ keys[-1])
+    keys = numpy.array(keys)
+    t = numpy.linspace(0, len(matrices), frames)
+    index = numpy.minimum(t.astype(int), len(matrices) - 1)
+    fraction = (t - index)[:, None, None]
+    return (1 - fraction) * keys[index] + fraction * keys[index + 1]
+
+def transformation_artists(axis, unit_vector=True, unit_circle=False, animated=False, vectors=None,
+                           grid_range=20):
+    """ Create the artists of plot_transformation_helper() once: grid, basis vectors, optional
+    vectors (an (N,2) array, one quiver with cycling colors) and unit circle. Their data is set
+    by the returned update function. The grid spans -grid_range to grid_range.
+
+    Returns
+    -------
+    artists : list of the created artists.
+
+    update : function taking a 2x2 matrix; updates the artists in place and returns them.
+
+    """
+    x = numpy.arange(-grid_range, grid_range+1)
+    segments = grid_segments(*numpy.meshgrid(x,x))
+    grid = LineCollection(segments, colors=[gold, lightblue], zorder=2, animated=animated,
+                          **grid_params)
+    axis.add_collection(grid)
+    artists = [grid]
+
+    if unit_vector:
+        basis = axis.quiver([0, 0], [0, 0], [1, 0], [0, 1], color=[green, red],
+                            animated=animated, **quiver_params)
+        artists.append(basis)
+
+    if vectors is not None:
+        vectors = numpy.asarray(vectors, dtype=float).reshape(-1, 2)
+        zeros = numpy.zeros(len(vectors))
+        colors = numpy.resize([pink, darkblue, orange, purple, brown], len(vectors))
+        arrows = axis.quiver(zeros, zeros, vectors[:,0], vectors[:,1], color=list(colors),
+                             animated=animated, **quiver_params)
+        artists.append(arrows)
+
+    if unit_circle:
+        alpha =  numpy.linspace(0, 2*numpy.pi, 41)
+        circle = numpy.vstack((numpy.cos(alpha), numpy.sin(alpha)))
+        circle_line, = axis.plot(circle[0], circle[1], color=red, lw=0.8, animated=animated)
+        artists.append(circle_line)
+
+    def update(matrix):
+        grid.set_segments(segments @ matrix.T)
+        if unit_vector:
+            basis.set_UVC(matrix[0], matrix[1])
+        if vectors is not None:
+            vectors_ = vectors @ matrix.T
+            arrows.set_UVC(vectors_[:,0], vectors_[:,1])
+        if unit_circle:
+            circle_line.set_data(*(matrix @ circle))
+        return artists
+
+    limit = 4
+    axis.spines['left'].set_position('center')
+    axis.spines['bottom'].set_position('center')
+    axis.spines['left'].set_linewidth(0.3)
+    axis.spines['bottom'].set_linewidth(0.3)
+    axis.spines['right'].set_color('none')
+    axis.spines['top'].set_color('none')
+    axis.set_xlim([-limit, limit])
+    axis.set_ylim([-limit, limit])
+    return artists, update
+
+def basis_artists(axis, vectors=None, I_label='i', J_label='j', grid_range=20):
+    """ Create the artists of plot_basis_helper() once: origin, grid and spines of the I-J
+    coordinate system, basis vectors, optional vectors (an (N,2) array of I-J coordinates) and
+    basis labels. Their data is set by the returned update function. The grid spans -grid_range
+    to grid_range.
+
+    Returns
+    -------
+    artists : list of the created artists.
+
+    update : function taking I, J, optionally new vector coordinates (same N) and hide_vectors;
+        updates the artists in place and returns them. With hide_vectors=True the vectors are
+        hidden and left out of the axis bounds, e.g. while I and J span no plane.
+
+    """
+    x = numpy.arange(-grid_range, grid_range+1)
+    segments = grid_segments(*numpy.meshgrid(x,x))
+    zero_id = numpy.where(x==0)[0][0]
+    spine_segments = segments[2*zero_id:2*zero_id+2]
+
+    axis.scatter(numpy.zeros(1), numpy.zeros(1), c='black', s=3)
+    grid = LineCollection(segments, colors=grey, linewidths=0.4, zorder=2)
+    spines = LineCollection(spine_segments, colors=[gold, lightblue], linewidths=0.7, zorder=2)
+    axis.add_collection(grid)
+    axis.add_collection(spines)
+    basis = axis.quiver([0, 0], [0, 0], [1, 0], [0, 1], color=[gold, lightblue], **quiver_params)
+    artists = [grid, spines, basis]
+
+    state = {'vectors': None}
+    if vectors is not None:
+        state['vectors'] = numpy.asarray(vectors, dtype=float).reshape(-1, 2)
+        zeros = numpy.zeros(len(state['vectors']))
+        arrows = axis.quiver(zeros, zeros, zeros, zeros, color=red, **quiver_params)
+        artists.append(arrows)
+
+    text_params = {'ha': 'center', 'va': 'center', 'size' : 6}
+    I_text = axis.text(0, 0, r'${}$'.format(I_label), color=gold, **text_params)
+    J_text = axis.text(0, 0, r'${}$'.format(J_label), color=lightblue, **text_params)
+    artists += [I_text, J_text]
+    axis.axis('off')
+
+    def update(I, J, vectors=None, hide_vectors=False):
+        M = numpy.column_stack((I, J))
+        grid.set_segments(segments @ M.T)
+        spines.set_segments(spine_segments @ M.T)
+        basis.set_UVC(M[0], M[1])
+        bound = 5
+        if vectors is not None:
+            state['vectors'] = numpy.asarray(vectors, dtype=float).reshape(-1, 2)
+        if state['vectors'] is not None:
+            arrows.set_visible(not hide_vectors)
+        if state['vectors'] is not None and not hide_vectors:
+            vectors_ = state['vectors'] @ M.T
+            arrows.set_UVC(vectors_[:,0], vectors_[:,1])
+            if len(vectors_):
+                bound = max(ceil(numpy.max(numpy.abs(vectors_))), bound)
+        axis.set_xlim([-bound, bound])
+        axis.set_ylim([-bound, bound])
+        I_text.set_position(((I[0]-J[0])/2*1.1, (I[1]-J[1])/2*1.1))
+        J_text.set_position(((J[0]-I[0])/2*1.1, (J[1]-I[1])/2*1.1))
+        return artists
+
+    return artists, update
+
+def transformation_artists_3d(axis, grid=True, unit_sphere=False, animated=False, grid_range=2):
+    """ 3d counterpart of transformation_artists(): grid lines and a unit sphere wireframe
+    as Line3DCollections. The grid spans -grid_range to grid_range along each axis.
+
+    """
+    xcolor, ycolor, zcolor = '#0084b6', '#d8a322', '#FF3333'
+    linewidth = 0.7
+    families = []
+    if grid:
+        x = numpy.arange(-grid_range, grid_range+1)
+        for segments, color in zip(grid_segments_3d(*numpy.meshgrid(x,x,x)), (xcolor, ycolor, zcolor)):
+            families.append((segments, color, linewidth))
+    if unit_sphere:
+        u = numpy.linspace(0, 2 * numpy.pi, 25)
+        v = numpy.linspace(0, numpy.pi, 13)
+        sphere = numpy.stack((numpy.outer(numpy.cos(u), numpy.sin(v)),
+                              numpy.outer(numpy.sin(u), numpy.sin(v)),
+                              numpy.outer(numpy.ones(numpy.size(u)), numpy.cos(v))), axis=-1)
+        families.append((sphere, darkblue, 0.4))                     # meridians
+        families.append((sphere.transpose(1, 0, 2), darkblue, 0.4))  # parallels
+
+    artists = []
+    for segments, color, width in families:
+        collection = Line3DCollection(segments, colors=color, linewidths=width, animated=animated)
+        axis.add_collection3d(collection)
+        artists.append(collection)
+
+    def update(matrix):
+        for collection, (segments, _, _) in zip(artists, families):
+            collection.set_segments(segments @ matrix.T)
+        return artists
+
+    for axis_str in ['x', 'y', 'z']:
+        axis.tick_params(axis=axis_str, pad=-3)
+    return artists, update
+
+def _write_animation(figure, artists, update, matrices, filename, fps, blit):
+    """ Render every frame on an Agg canvas and stream it to imageio. With blit, the static
+    background is drawn once and only the animated artists are redrawn per frame.
+
+    """
+    import imageio
+
+    canvas = FigureCanvasAgg(figure)
+    canvas.draw()
+    background = canvas.copy_from_bbox(figure.bbox) if blit else None
+    # the GIF writer takes a per-frame duration in ms and warns on fps; video writers take fps
+    if str(filename).lower().endswith('.gif'):
+        timing = {'duration': 1000/fps}
+    else:
+        timing = {'fps': fps}
+    with imageio.get_writer(filename, **timing) as writer:
+        for matrix in matrices:
+            update(matrix)
+            if blit:
+                canvas.restore_region(background)
+                for artist in artists:
+                    artist.axes.draw_artist(artist)
+            else:
+                canvas.draw()
+            writer.append_data(numpy.array(canvas.buffer_rgba())[..., :3])
+
+@set_rc
+def animate_linear_transformations(*matrices, frames=300, fps=30, unit_vector=True, unit_circle=True,
+                                   filename=None, grid_range=20):
+    """ Animate the linear transformation defined by a sequence of 2x2 matrices, interpolating
+    continuously from the identity through each cumulative product (see interpolate_matrices()).
+    The grid, basis vectors and unit circle are created once and only their data changes per
+    frame, drawn with blitting.
+
+    Parameters
+    ----------
+    *matrices : class numpy.ndarray.
+        The 2x2 matrices to animate. Accept any number of matrices.
+
+    frames : int, optional.
+        Number of frames, default to 300.
+
+    fps : int, optional.
+        Frames per second, default to 30.
+
+    unit_vector : bool, optional.
+        Whether to plot unit vectors of the standard basis, default to True.
+
+    unit_circle: bool, optional.
+        Whether to plot unit circle, default to True.
+
+    filename : str, optional.
+        If given, write the animation to this file with imageio (.gif, or .mp4 with the
+        imageio-ffmpeg plugin) and return None. Otherwise return a
+        matplotlib.animation.FuncAnimation, e.g. for IPython.display.HTML(anim.to_jshtml()).
+
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each basis vector, default to 20.
+
+    Examples
+    --------
+    >>> shear = numpy.array([[1, 1], [0, 1]])
+    >>> rotation = numpy.array([[0, -1], [1, 0]])
+    >>> animate_linear_transformations(shear, rotation, filename='shear_rotate.gif')
+
+    """
+    for matrix in matrices:
+        assert matrix.shape == (2,2), "the input matrices must have a shape of (2,2)"
+    steps = interpolate_matrices(matrices, frames)
+    figsize = numpy.array([2,2]) * get_figure_scale()
+    if filename is None:
+        figure, axis = pyplot.subplots(figsize=figsize)
+    else:
+        figure = Figure(figsize=figsize)
+        axis = figure.add_subplot(1, 1, 1)
+    artists, update = transformation_artists(axis, unit_vector, unit_circle, animated=True,
+                                             grid_range=grid_range)
+    if filename is not None:
+        _write_animation(figure, artists, update, steps, filename, fps, blit=True)
+        return None
+    return FuncAnimation(figure, update, frames=steps, init_func=lambda: update(steps[0]),
+                         interval=1000/fps, blit=True)
+
+@set_rc
+def animate_3d_linear_transformations(*matrices, frames=300, fps=30, grid=True, unit_sphere=False,
+                                      filename=None, grid_range=2):
+    """ 3d counterpart of animate_linear_transformations() for 3x3 matrices. 3d artists are
+    projected when the whole axes draws, so frames are not blitted; the grid and sphere
+    artists are still created once and only updated per frame.
+
+    Parameters
+    ----------
+    *matrices : class numpy.ndarray.
+        The 3x3 matrices to animate. Accept any number of matrices.
+
+    frames : int, optional.
+        Number of frames, default to 300.
+
+    fps : int, optional.
+        Frames per second, default to 30.
+
+    grid : bool, optional.
+        Whether to plot 3d grid lines, default to True.
+
+    unit_sphere : bool, optional.
+        Whether to plot a unit sphere wireframe, default to False.
+
+    filename : str, optional.
+        Same as in animate_linear_transformations().
+
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each axis, default to 2.
+
+    """
+    for matrix in matrices:
+        assert matrix.shape == (3,3), "the input matrices must have a shape of (3,3)"
+    steps = interpolate_matrices(matrices, frames)
+    figsize = numpy.array([2,2]) * get_figure_scale()
+    if filename is None:
+        figure = pyplot.figure(figsize=figsize)
+    else:
+        figure = Figure(figsize=figsize)
+    axis = figure.add_subplot(1, 1, 1, projection='3d')
+    artists, update = transformation_artists_3d(axis, grid, unit_sphere, grid_range=grid_range)
+
+    # fixed limits that hold every frame: the grid cube's corners, the sphere's extent
+    limit = 1
+    if grid:
+        corners = numpy.array(numpy.meshgrid(*[[-grid_range, grid_range]]*3)).reshape(3, -1)
+        limit = max(limit, numpy.max(numpy.abs(steps @ corners)))
+    if unit_sphere:
+        limit = max(limit, numpy.max(numpy.linalg.norm(steps, axis=2)))
+    axis.set_xlim(-limit, limit)
+    axis.set_ylim(-limit, limit)
+    axis.set_zlim(-limit, limit)
+
+    if filename is not None:
+        _write_animation(figure, artists, update, steps, filename, fps, blit=False)
+        return None
+    return FuncAnimation(figure, update, frames=steps, init_func=lambda: update(steps[0]),
+                         interval=1000/fps, blit=False)
+
+
+class MatrixSession:
+    """ Base of the interactive sessions below: one figure stays alive and its artists are
+    updated in place for each new 2x2 matrix, instead of building a new figure per call. Use
+    an interactive backend (e.g. %matplotlib widget) so the figure redraws in place.
+
+    As in _write_animation(), the updated artists are animated: each full draw saves the static
+    background, and set_matrix() restores it and blits only those artists. A full draw happens
+    when an axes' limits change or the canvas cannot blit.
+
+    """
+    def _blit(self, artists):
+        """ Mark the artists updated by set_matrix() as animated and save the background on
+        every full draw (first show, resize, limit change).
+
+        Parameters
+        ----------
+        artists : list of matplotlib.artist.Artist.
+            The artists updated by _update().
+
+        """
+        self._artists = artists
+        self._background = None
+        for artist in artists:
+            artist.set_animated(True)
+        self.figure.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        self._background = self.figure.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self._artists:
+            artist.axes.draw_artist(artist)
+
+    def _limits(self):
+        return [(axis.get_xlim(), axis.get_ylim()) for axis in self.figure.axes]
+
+    def set_matrix(self, matrix):
+        """ Update the plot for a new 2x2 matrix.
+
+        Parameters
+        ----------
+        matrix : class numpy.ndarray.
+            The new 2x2 matrix.
+
+        """
+        self.matrix = numpy.array(matrix, dtype=float)
+        limits = self._limits()
+        self._update(self.matrix)
+        canvas = self.figure.canvas
+        if (self._background is None or not getattr(canvas, 'supports_blit', False)
+                or self._limits() != limits):
+            canvas.draw_idle()      # the draw event saves a new background
+        else:
+            canvas.restore_region(self._background)
+            self._draw_artists()
+            canvas.blit(self.figure.bbox)
+
+    def sliders(self, low=-3, high=3, step=0.1):
+        """ ipywidgets sliders for the four matrix entries, calling set_matrix() on change.
+
+        Parameters
+        ----------
+        low, high : float, optional.
+            Range of each slider, default to -3 and 3.
+
+        step : float, optional.
+            Step of each slider, default to 0.1.
+
+        Returns
+        -------
+        class ipywidgets.VBox holding the sliders as a 2x2 grid.
+
+        """
+        import ipywidgets
+
+        def on_change(i, j):
+            def observer(change):
+                matrix = self.matrix.copy()
+                matrix[i, j] = change['new']
+                self.set_matrix(matrix)
+            return observer
+
+        sliders = []
+        for (i, j), value in numpy.ndenumerate(self.matrix):
+            slider = ipywidgets.FloatSlider(value=value, min=low, max=high, step=step,
+                                            description='[{},{}]'.format(i, j))
+            slider.observe(on_change(i, j), names='value')
+            sliders.append(slider)
+        return ipywidgets.VBox([ipywidgets.HBox(sliders[:2]), ipywidgets.HBox(sliders[2:])])
+
+
+class LinearTransformationSession(MatrixSession):
+    """ Interactive plot_linear_transformation(): only the 'after' panel is updated.
+
+    Parameters
+    ----------
+    matrix : class numpy.ndarray.
+        The initial 2x2 matrix.
+
+    *vectors : class numpy.ndarray.
+        The vector(s) to plot along with the linear transformation, as in
+        plot_linear_transformation().
+
+    unit_vector : bool, optional.
+        Whether to plot unit vectors of the standard basis, default to True.
+
+    unit_circle: bool, optional.
+        Whether to plot unit circle, default to False.
+
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each basis vector, default to 20.
+
+    Examples
+    --------
+    >>> session = LinearTransformationSession(numpy.array([[1, 1], [0, 1]]), numpy.array([2, 1]))
+    >>> session.sliders()   # display the sliders under the figure
+    >>> session.set_matrix(numpy.array([[0, -1], [1, 0]]))
+
+    """
+    @set_rc
+    def __init__(self, matrix, *vectors, unit_vector=True, unit_circle=False, grid_range=20):
+        figsize = numpy.array([4,2]) * get_figure_scale()
+        self.figure, (axis1, axis2) = pyplot.subplots(1, 2, figsize=figsize)
+        vectors = stack_vectors(vectors)
+        _, before = transformation_artists(axis1, unit_vector, unit_circle, vectors=vectors,
+                                           grid_range=grid_range)
+        before(numpy.identity(2))
+        axis1.set_title('Before transformation')
+        artists, self._update = transformation_artists(axis2, unit_vector, unit_circle, vectors=vectors,
+                                                       grid_range=grid_range)
+        axis2.set_title('After transformation')
+        self._blit(artists)
+        self.set_matrix(matrix)
+
+
+class ChangeBasisSession(MatrixSession):
+    """ Interactive plot_change_basis(): the matrix holds the new basis I, J as its columns,
+    and only the 'new basis' panel is updated. While I and J are (numerically) parallel they
+    span no plane, so the vectors have no coordinates in them and are hidden.
+
+    Parameters
+    ----------
+    I, J: class numpy.ndarray.
+        The initial basis vectors, in the standard basis.
+
+    *vectors : class numpy.ndarray.
+        The vector(s) to plot along with the change of basis, as in plot_change_basis().
+
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each basis vector, default to 20.
+
+    """
+    @set_rc
+    def __init__(self, I, J, *vectors, grid_range=20):
+        figsize = numpy.array([4,2]) * get_figure_scale()
+        self.figure, (axis1, axis2) = pyplot.subplots(1, 2, figsize=figsize)
+        self.vectors = stack_vectors(vectors)
+        _, standard = basis_artists(axis1, self.vectors, grid_range=grid_range)
+        standard(numpy.array([1,0]), numpy.array([0,1]))
+        axis1.set_title('standard basis')
+        artists, self._new_basis = basis_artists(axis2, self.vectors, I_label='a', J_label='b',
+                                                    grid_range=grid_range)
+        axis2.set_title('new basis')
+        self._blit(artists)
+        self.set_matrix(numpy.column_stack((I, J)))
+
+    def _update(self, M):
+        # same rank test as numpy.linalg.matrix_rank: inv() would raise or blow up
+        singular = numpy.linalg.cond(M) > 1 / numpy.finfo(float).eps
+        vectors_ = None if self.vectors is None or singular else self.vectors @ inv(M).T
+        self._new_basis(M[:,0], M[:,1], vectors_, hide_vectors=singular)
+
+
+class EigenSession(MatrixSession):
+    """ Interactive plot_eigen(): the eigenbasis panels and the transformed unit circles are
+    updated. Matrices with complex eigenvalues leave the eigenbasis panels unchanged.
+
+    Parameters
+    ----------
+    matrix : class numpy.ndarray.
+        The initial 2x2 matrix.
+
+    grid_range : int, optional.
+        The grid spans -grid_range to grid_range along each basis vector, default to 20.
+
+    """
+    @set_rc
+    def __init__(self, matrix, grid_range=20):
+        figsize = numpy.array([4,4]) * get_figure_scale()
+        self.figure, axes = pyplot.subplots(2, 2, figsize=figsize)
+        standard = (numpy.array([1,0]), numpy.array([0,1]))
+        basis_artists(axes[0,0], grid_range=grid_range)[1](*standard)
+        upper_artists, upper = basis_artists(axes[0,1], I_label='a', J_label='b', grid_range=grid_range)
+        lower_artists, lower = basis_artists(axes[1,0], I_label='a', J_label='b', grid_range=grid_range)
+        basis_artists(axes[1,1], grid_range=grid_range)[1](*standard)
+        self._eigenbases = (upper, lower)
+        axes[0,0].set_title(r'coords in standard basis $\mathbf{x}$')
+        axes[0,1].set_title(r'change to new basis $C^{-1}\mathbf{x}$')
+        axes[1,0].set_title(r'scale along new basis $DC^{-1}\mathbf{x}$')
+        axes[1,1].set_title(r'change back to standard basis $CDC^{-1}\mathbf{x}$')
+
+        alpha =  numpy.linspace(0, 2*numpy.pi, 41)
+        self._circle = numpy.vstack((numpy.cos(alpha), numpy.sin(alpha)))
+        for axis in axes[0]:
+            axis.plot(self._circle[0], self._circle[1], color=red, lw=0.8)
+        self._circles = [axis.plot(*self._circle, color=red, lw=0.8)[0] for axis in axes[1]]
+        self._blit(upper_artists + lower_artists + self._circles)
+        self.set_matrix(matrix)
+
+    def _update(self, matrix):
+        eigenvalues, C = eig(matrix)
+        if not numpy.iscomplexobj(C):
+            for update in self._eigenbases:
+                update(C[:,0], C[:,1])
+        circle_trans = matrix @ self._circle
+        for line in self._circles:
+            line.set_data(circle_trans[0], circle_trans[1])
+
+
 if __name__ == "__main__":
     pass
@@ -7,6 +7,10 @@ with a rotating Claude logo in the center and words placed in clear zones.
 from manim import *
 import numpy as np
 
+from render_pipeline.layout import fit_layout
+from render_pipeline.scene import PipelineScene
+from render_pipeline.text_cache import CachedText as Text  # glyph outlines cached on disk
+
 # ============================================================
 # COLOR PALETTE — Claude Code Terminal Vibes
 # ============================================================
@@ -68,8 +72,60 @@ BONUS_POSITIONS = [
     (-1.8, 3.2), (1.8, 3.2), (-1.8, -3.2), (1.8, -3.2), (0, -3.5),
 ]
 
-
-class ClaudeCodeWords(Scene):
+# ============================================================
+# AUTO LAYOUT — takes over when CATEGORIES or BONUS_WORDS
+# outgrow the hand-placed positions above
+# ============================================================
+def bounding_box(mob):
+    return (mob.get_left()[0], mob.get_bottom()[1], mob.get_right()[0], mob.get_top()[1])
+
+
+def fit_mobjects(groups, anchors, occupied=()):
+    """Auto-layout mobject groups at one scale that fits them all."""
+    scale, centers = fit_layout(
+        [[(mob.width, mob.height) for mob in group] for group in groups], anchors, occupied,
+    )
+    for group, group_centers in zip(groups, centers):
+        for mob, (cx, cy) in zip(group, group_centers):
+            mob.scale(scale).move_to([cx, cy, 0])
+
+
+def zone_anchors(n, rx=5.0, ry=2.3):
+    """``n`` zone centers on an ellipse around the logo, starting top-left."""
+    angles = PI / 2 + TAU * (np.arange(n) + 0.5) / n
+    return [(rx * np.cos(a), ry * np.sin(a)) for a in angles]
+
+
+def place_category_words(labels, word_rows):
+    """Move category labels and word rows to their zones.
+
+    WORD_POSITIONS is used while it covers every word; beyond that the
+    labels and rows are auto-laid out around zone_anchors.
+    """
+    if len(word_rows) <= len(WORD_POSITIONS) and all(
+        len(rows) <= len(positions) for rows, positions in zip(word_rows, WORD_POSITIONS)
+    ):
+        for label, rows, positions in zip(labels, word_rows, WORD_POSITIONS):
+            label.move_to([positions[0][0] + 0.8, positions[0][1] + 0.5, 0])
+            for row, (tx, ty) in zip(rows, positions):
+                row.move_to([tx + 0.8, ty, 0])
+        return
+    groups = [[label, *rows] for label, rows in zip(labels, word_rows)]
+    fit_mobjects(groups, zone_anchors(len(groups)))
+
+
+def place_bonus_words(words, occupied):
+    """Move bonus words to BONUS_POSITIONS, or auto-layout them around those
+    spots when there are more words than positions."""
+    if len(words) <= len(BONUS_POSITIONS):
+        for word, (bx, by) in zip(words, BONUS_POSITIONS):
+            word.move_to([bx, by, 0])
+        return
+    n = len(BONUS_POSITIONS)
+    fit_mobjects([words[i::n] for i in range(n)], BONUS_POSITIONS, occupied)
+
+
+class ClaudeCodeWords(PipelineScene):
     def construct(self):
         self.camera.background_color = BG_COLOR
 
@@ -173,6 +229,7 @@ class ClaudeCodeWords(Scene):
             Create(orbit_ring2),
             run_time=0.8,
         )
+        self.add_static_layer(orbit_ring, orbit_ring2)  # rasterized once
 
         self.play(
             Rotate(logo_inner, angle=TAU, about_point=logo_inner.get_center()),
@@ -186,19 +243,29 @@ class ClaudeCodeWords(Scene):
         all_word_mobs = []
         all_cat_labels = []
 
-        for cat_idx, cat in enumerate(CATEGORIES):
-            positions = WORD_POSITIONS[cat_idx]
-
-            # Category label at top of its zone
-            is_left = cat_idx % 2 == 0
-            label_x = positions[0][0]
-            label_y = positions[0][1] + 0.5
-
-            cat_label = Text(
+        # Build every label and word row first so they can be laid out
+        # from their measured sizes.
+        cat_label_mobs = []
+        cat_word_rows = []
+        for cat in CATEGORIES:
+            cat_label_mobs.append(Text(
                 f'{cat["icon"]} {cat["label"]}',
                 font_size=16, color=cat["color"], weight=BOLD,
-            )
-            cat_label.move_to([label_x + 0.8, label_y, 0])
+            ))
+            rows = []
+            for word in cat["words"]:
+                # Small dot + word
+                dot = Dot(color=cat["color"], radius=0.04, fill_opacity=0.8)
+                word_text = Text(
+                    word, font_size=20, color=cat["color"], weight=BOLD,
+                )
+                rows.append(VGroup(dot, word_text).arrange(RIGHT, buff=0.12))
+            cat_word_rows.append(rows)
+        place_category_words(cat_label_mobs, cat_word_rows)
+
+        for cat_idx, cat in enumerate(CATEGORIES):
+            # Category label at top of its zone
+            cat_label = cat_label_mobs[cat_idx]
 
             cat_underline = Line(
                 cat_label.get_left() + DOWN * 0.1 + LEFT * 0.1,
@@ -224,16 +291,8 @@ class ClaudeCodeWords(Scene):
 
             # Animate each word
             word_mobs_this_cat = []
-            for w_idx, word in enumerate(cat["words"]):
-                tx, ty = positions[w_idx]
-
-                # Small dot + word
-                dot = Dot(color=cat["color"], radius=0.04, fill_opacity=0.8)
-                word_text = Text(
-                    word, font_size=20, color=cat["color"], weight=BOLD,
-                )
-                word_row = VGroup(dot, word_text).arrange(RIGHT, buff=0.12)
-                word_row.move_to([tx + 0.8, ty, 0])
+            for word_row in cat_word_rows[cat_idx]:
+                word_text = word_row[1]
 
                 # Fly in from center
                 word_row.save_state()
@@ -278,14 +337,15 @@ class ClaudeCodeWords(Scene):
         bonus_label.to_edge(UP, buff=0.3)
         self.play(FadeIn(bonus_label, shift=DOWN * 0.15), run_time=0.3)
 
-        bonus_mob_list = []
-        for i, bw in enumerate(BONUS_WORDS):
-            bx, by = BONUS_POSITIONS[i]
-            bt = Text(bw, font_size=16, color=CLAUDE_TAN, weight=BOLD)
-            bt.move_to([bx, by, 0])
+        bonus_mob_list = [
+            Text(bw, font_size=16, color=CLAUDE_TAN, weight=BOLD) for bw in BONUS_WORDS
+        ]
+        place_bonus_words(bonus_mob_list, occupied=[
+            bounding_box(mob) for mob in [*all_word_mobs, *all_cat_labels, bonus_label]
+        ])
+        for bt in bonus_mob_list:
             bt.save_state()
             bt.move_to(ORIGIN).scale(0.1).set_opacity(0)
-            bonus_mob_list.append(bt)
 
         self.play(
             LaggedStart(
@@ -351,6 +411,7 @@ class ClaudeCodeWords(Scene):
 
         self.wait(2.0)
 
+        self.release_static_layer()
         self.play(
             *[FadeOut(mob) for mob in self.mobjects],
             run_time=0.8,
@@ -7,9 +7,16 @@ Each Scene class produces one animation for embedding into Beamer slides
 via the animate LaTeX package (PNG frame sequences).
 """
 
+import csv
+from array import array
+from pathlib import Path
+
 from manim import *
 import numpy as np
 
+from render_pipeline.scene import PipelineScene
+from render_pipeline.text_cache import CachedText as Text  # glyph outlines cached on disk
+
 # ============================================================
 # GLOBAL COLOR PALETTE — "Blueprint Noir"
 # ============================================================
@@ -31,30 +38,116 @@ HIGHLIGHT_COLOR = "#FFD54F"   # Gold highlight
 # REUSABLE HELPER FUNCTIONS
 # ============================================================
 
+class LineBatch(VMobject):
+    """Many straight segments stored as the subpaths of one VMobject.
+
+    A single mobject to copy, hash and stroke per frame, however many lines
+    it holds. ``starts`` and ``ends`` are ``(n, 3)`` arrays of endpoints.
+    """
+
+    def __init__(self, starts, ends, **kwargs):
+        super().__init__(**kwargs)
+        starts = np.asarray(starts, dtype=float)
+        ends = np.asarray(ends, dtype=float)
+        # Each segment is a degenerate cubic: anchor, 1/3, 2/3, anchor.
+        t = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+        self.set_points((starts[:, None, :] + t * (ends - starts)[:, None, :]).reshape(-1, 3))
+
+
+class ArrowField(VMobject):
+    """Many arrows batched into one shaft path and one tip path per color.
+
+    ``starts`` and ``ends`` are ``(n, 3)`` arrays (``starts`` may be a single
+    point shared by all arrows); ``colors`` is one color or ``n`` of them,
+    default VECTOR_A_COLOR as set when the field is built. Cairo draws two paths per distinct color, however many arrows there are.
+    """
+
+    def __init__(self, starts, ends, colors=None, stroke_width=1.5,
+                 stroke_opacity=1.0, tip_length=0.1, max_tip_length_to_length_ratio=0.25,
+                 **kwargs):
+        super().__init__(**kwargs)
+        ends = np.asarray(ends, dtype=float)
+        starts = np.broadcast_to(np.asarray(starts, dtype=float), ends.shape)
+        if colors is None:
+            colors = VECTOR_A_COLOR     # looked up now, so variants can override it
+        if not isinstance(colors, (list, tuple)):
+            colors = [colors] * len(ends)
+        keys = [str(color) for color in colors]
+
+        vec = ends - starts
+        length = np.linalg.norm(vec, axis=1, keepdims=True)
+        unit = np.divide(vec, length, out=np.zeros_like(vec), where=length > 0)
+        normal = np.column_stack([-unit[:, 1], unit[:, 0], np.zeros(len(unit))])
+        tip = np.minimum(tip_length, max_tip_length_to_length_ratio * length)
+        base = ends - tip * unit
+        left, right = base + 0.5 * tip * normal, base - 0.5 * tip * normal
+
+        # Growth scales every point towards its own arrow's start.
+        self._full_points, self._origins = [], []
+        for key, color in dict(zip(keys, colors)).items():
+            mask = np.array([k == key for k in keys])
+            shafts = LineBatch(starts[mask], base[mask], stroke_color=color,
+                               stroke_width=stroke_width, stroke_opacity=stroke_opacity)
+            tips = LineBatch(
+                np.stack([ends[mask], left[mask], right[mask]], axis=1).reshape(-1, 3),
+                np.stack([left[mask], right[mask], ends[mask]], axis=1).reshape(-1, 3),
+                fill_color=color, fill_opacity=stroke_opacity, stroke_width=0,
+            )
+            self.add(shafts, tips)
+            self._origins += [np.repeat(starts[mask], 4, axis=0),
+                              np.repeat(starts[mask], 12, axis=0)]
+            self._full_points += [shafts.points.copy(), tips.points.copy()]
+
+    def set_progress(self, alpha):
+        """Show every arrow scaled to ``alpha`` of its length, like GrowArrow."""
+        for part, full, origin in zip(self.submobjects, self._full_points, self._origins):
+            part.set_points(origin + alpha * (full - origin))
+        return self
+
+
+class GrowArrowField(Animation):
+    """Grow all arrows of an ``ArrowField`` from their starts in one animation."""
+
+    def __init__(self, field, **kwargs):
+        super().__init__(field, introducer=True, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_progress(self.rate_func(alpha))
+
+
+def load_csv_columns(path, columns):
+    """Stream the numeric ``columns`` of a CSV file into an ``(n, k)`` array."""
+    values = array("d")
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            values.extend(float(row[name]) for name in columns)
+    return np.frombuffer(values, dtype=float).reshape(-1, len(columns))
+
+
 def create_blueprint_grid(x_range=(-7, 7), y_range=(-4, 4), step=1):
     """Create a subtle blueprint-style background grid."""
-    lines = VGroup()
-    for x in np.arange(x_range[0], x_range[1] + step, step):
-        lines.add(Line(
-            start=[x, y_range[0], 0],
-            end=[x, y_range[1], 0],
-            stroke_width=0.5,
-            stroke_color=GRID_COLOR,
-            stroke_opacity=0.4
-        ))
-    for y in np.arange(y_range[0], y_range[1] + step, step):
-        lines.add(Line(
-            start=[x_range[0], y, 0],
-            end=[x_range[1], y, 0],
-            stroke_width=0.5,
-            stroke_color=GRID_COLOR,
-            stroke_opacity=0.4
-        ))
-    return lines
-
-
-def create_glowing_dot(position, color=ACCENT_COLOR, radius=0.07):
-    """Create a dot with a subtle glow effect."""
+    xs = np.arange(x_range[0], x_range[1] + step, step, dtype=float)
+    ys = np.arange(y_range[0], y_range[1] + step, step, dtype=float)
+    starts = np.concatenate([
+        np.column_stack([xs, np.full_like(xs, y_range[0]), np.zeros_like(xs)]),
+        np.column_stack([np.full_like(ys, x_range[0]), ys, np.zeros_like(ys)]),
+    ])
+    ends = np.concatenate([
+        np.column_stack([xs, np.full_like(xs, y_range[1]), np.zeros_like(xs)]),
+        np.column_stack([np.full_like(ys, x_range[1]), ys, np.zeros_like(ys)]),
+    ])
+    return LineBatch(
+        starts, ends,
+        stroke_width=0.5,
+        stroke_color=GRID_COLOR,
+        stroke_opacity=0.4,
+    )
+
+
+def create_glowing_dot(position, color=None, radius=0.07):
+    """Create a dot with a subtle glow effect (default color: ACCENT_COLOR)."""
+    if color is None:
+        color = ACCENT_COLOR
     glow = Dot(position, color=color, radius=radius * 3, fill_opacity=0.15)
     dot = Dot(position, color=color, radius=radius)
     return VGroup(glow, dot)
@@ -67,21 +160,52 @@ def create_glowing_dot(position, color=ACCENT_COLOR, radius=0.07):
 # Playback at 60fps in PDF = snappy
 # ============================================================
 
-class DataToVector(Scene):
+class DataToVector(PipelineScene):
+    # Copy and data; render_pipeline.variants overrides these (and the
+    # palette constants above) per variant.
+    title = "What is a Vector?"
+    subtitle = "A numerical representation of data"
+    dataset_label = "MEDICAL DATASET"
+    headers = ("Patient", "Age", "BP")
+    plot_label = "VECTOR SPACE"
+    closing = "Every data point is a vector"
+    closing_sub = "Each row in your dataset maps to an arrow in vector space"
+    rows_data = [
+        ("Patient 1", "58", "122"),
+        ("Patient 2", "71", "110"),
+        ("Patient 3", "48", "110"),
+        ("Patient 4", "34", "123"),
+        ("Patient 5", "62", "152"),
+    ]
+    # Label direction and plot_patient options per row (cycled); the first
+    # named_labels rows get a \vec{p}_i label.
+    patient_styles = [
+        (UP, dict(font_size=18, stroke_width=3.5,
+                  run_time_arrow=0.7, run_time_label=0.4, wait_after=0.3)),  # flagship
+        (DOWN + RIGHT, dict(run_time_arrow=0.5, wait_after=0.2)),
+        (LEFT, dict(run_time_arrow=0.5, wait_after=0.2)),
+        (UP + LEFT, dict(font_size=14, stroke_width=2.5,
+                         run_time_arrow=0.4, run_time_label=0.3, wait_after=0.15)),
+        (RIGHT, dict(font_size=14, stroke_width=2.5,
+                     run_time_arrow=0.4, run_time_label=0.3, wait_after=0.15)),
+    ]
+    named_labels = 3
+
     def construct(self):
         self.camera.background_color = BG_COLOR
 
         # ── Background grid (sparse for performance) ──
         bg_grid = create_blueprint_grid(x_range=(-8, 8), y_range=(-5, 5), step=2)
         bg_grid.set_opacity(0.12)
-        self.add(bg_grid)
+        self.add_static_layer(bg_grid)  # rasterized once, not per frame
 
         # ═══════════════════════════════════════
         # BEAT 1 — Title Card (~2.5s)
         # ═══════════════════════════════════════
-        title = Text("What is a Vector?", font_size=48, color=TEXT_COLOR, weight=BOLD)
+        self.next_beat("title")
+        title = Text(self.title, font_size=48, color=TEXT_COLOR, weight=BOLD)
         subtitle = Text(
-            "A numerical representation of data",
+            self.subtitle,
             font_size=24, color=LABEL_COLOR,
         )
         subtitle.next_to(title, DOWN, buff=0.4)
@@ -118,7 +242,8 @@ class DataToVector(Scene):
         # ═══════════════════════════════════════
         # BEAT 2 — Patient Data Table
         # ═══════════════════════════════════════
-        section_label = Text("MEDICAL DATASET", font_size=14,
+        self.next_beat("table")
+        section_label = Text(self.dataset_label, font_size=14,
                              color=VECTOR_A_COLOR, weight=BOLD)
         section_label.to_edge(UP, buff=0.35).shift(LEFT * 3)
         underline = Line(
@@ -133,10 +258,9 @@ class DataToVector(Scene):
             run_time=0.4,
         )
 
-        header_texts = ["Patient", "Age", "BP"]
         header = VGroup(*[
             Text(t, font_size=18, color=TABLE_HEADER_COLOR, weight=BOLD)
-            for t in header_texts
+            for t in self.headers
         ])
         header.arrange(RIGHT, buff=1.0)
         header.next_to(section_label, DOWN, buff=0.5)
@@ -147,16 +271,8 @@ class DataToVector(Scene):
             color=VECTOR_A_COLOR, stroke_width=1, stroke_opacity=0.4,
         )
 
-        rows_data = [
-            ("Patient 1", "58", "122"),
-            ("Patient 2", "71", "110"),
-            ("Patient 3", "48", "110"),
-            ("Patient 4", "34", "123"),
-            ("Patient 5", "62", "152"),
-        ]
-
         data_rows = VGroup()
-        for name, age, bp in rows_data:
+        for name, age, bp in self.rows_data:
             cells = VGroup(
                 Text(name, font_size=16, color=TABLE_ROW_COLOR),
                 Text(age, font_size=16, color=TABLE_ROW_COLOR),
@@ -181,6 +297,7 @@ class DataToVector(Scene):
         # ═══════════════════════════════════════
         # BEAT 3 — Highlight Patient 1
         # ═══════════════════════════════════════
+        self.next_beat("highlight")
         highlight_rect = SurroundingRectangle(
             data_rows[0], color=HIGHLIGHT_COLOR,
             stroke_width=2.5, corner_radius=0.08, buff=0.1,
@@ -201,17 +318,19 @@ class DataToVector(Scene):
         # ═══════════════════════════════════════
         # BEAT 4 — Extract into Column Vector
         # ═══════════════════════════════════════
+        self.next_beat("extract")
         extract_arrow = MathTex(r"\Longrightarrow", font_size=32, color=ACCENT_COLOR)
         extract_arrow.next_to(data_rows[0], RIGHT, buff=0.6)
 
+        first_age, first_bp = self.rows_data[0][1:]
         col_vector = Tex(
-            r"$\vec{p}_1 = \begin{bmatrix} 58 \\ 122 \end{bmatrix}$",
+            rf"$\vec{{p}}_1 = \begin{{bmatrix}} {first_age} \\ {first_bp} \end{{bmatrix}}$",
             font_size=34, color=ACCENT_COLOR,
         )
         col_vector.next_to(extract_arrow, RIGHT, buff=0.5)
 
-        age_label = Text("Age", font_size=12, color=VECTOR_A_COLOR)
-        bp_label = Text("BP", font_size=12, color=VECTOR_B_COLOR)
+        age_label = Text(self.headers[1], font_size=12, color=VECTOR_A_COLOR)
+        bp_label = Text(self.headers[2], font_size=12, color=VECTOR_B_COLOR)
         age_label.next_to(col_vector, RIGHT, buff=0.3).shift(UP * 0.15)
         bp_label.next_to(col_vector, RIGHT, buff=0.3).shift(DOWN * 0.15)
 
@@ -238,6 +357,7 @@ class DataToVector(Scene):
         # ═══════════════════════════════════════
         # BEAT 5 — Transition: shrink table, bring in plot
         # ═══════════════════════════════════════
+        self.next_beat("transition")
         table_group = VGroup(
             section_label, underline, header, h_sep, data_rows,
             highlight_rect, glow_rect,
@@ -259,7 +379,8 @@ class DataToVector(Scene):
         # ═══════════════════════════════════════
         # BEAT 6 — Coordinate Plane
         # ═══════════════════════════════════════
-        plot_title = Text("VECTOR SPACE", font_size=14,
+        self.next_beat("plane")
+        plot_title = Text(self.plot_label, font_size=14,
                           color=VECTOR_A_COLOR, weight=BOLD)
         plot_title.move_to(RIGHT * 3.5 + UP * 3.2)
         plot_underline = Line(
@@ -281,25 +402,19 @@ class DataToVector(Scene):
         )
         axes.move_to(RIGHT * 3.5 + DOWN * 0.1)
 
-        x_label = Text("Age", font_size=16, color=LABEL_COLOR)
+        x_label = Text(self.headers[1], font_size=16, color=LABEL_COLOR)
         x_label.next_to(axes.x_axis, DOWN, buff=0.25)
-        y_label = Text("BP", font_size=16, color=LABEL_COLOR)
+        y_label = Text(self.headers[2], font_size=16, color=LABEL_COLOR)
         y_label.next_to(axes.y_axis, LEFT, buff=0.25)
 
         # Subtle solid grid
-        plot_grid = VGroup()
-        for x_val in range(20, 81, 20):
-            plot_grid.add(Line(
-                axes.c2p(x_val, 0), axes.c2p(x_val, 170),
-                color=GRID_COLOR_BRIGHT, stroke_width=0.4,
-                stroke_opacity=0.2,
-            ))
-        for y_val in range(20, 171, 20):
-            plot_grid.add(Line(
-                axes.c2p(0, y_val), axes.c2p(80, y_val),
-                color=GRID_COLOR_BRIGHT, stroke_width=0.4,
-                stroke_opacity=0.2,
-            ))
+        x_vals, y_vals = range(20, 81, 20), range(20, 171, 20)
+        plot_grid = LineBatch(
+            [axes.c2p(x, 0) for x in x_vals] + [axes.c2p(0, y) for y in y_vals],
+            [axes.c2p(x, 170) for x in x_vals] + [axes.c2p(80, y) for y in y_vals],
+            stroke_color=GRID_COLOR_BRIGHT, stroke_width=0.4,
+            stroke_opacity=0.2,
+        )
 
         self.play(
             FadeIn(plot_title, shift=DOWN * 0.1),
@@ -319,6 +434,7 @@ class DataToVector(Scene):
         def plot_patient(age, bp, color, label_tex, label_dir, font_size=16,
                          stroke_width=3, run_time_arrow=0.6, run_time_label=0.3,
                          wait_after=0.2):
+            self.next_beat(f"patient ({age:g}, {bp:g})")
             pt = axes.c2p(age, bp)
             arr = Arrow(
                 start=origin_pt, end=pt,
@@ -337,39 +453,23 @@ class DataToVector(Scene):
             )
             self.wait(wait_after)
 
-        # Patient 1 — Blue — UP (flagship)
-        plot_patient(58, 122, VECTOR_A_COLOR,
-                     r"$\vec{p}_1 = \begin{bmatrix} 58 \\ 122 \end{bmatrix}$",
-                     UP, font_size=18, stroke_width=3.5,
-                     run_time_arrow=0.7, run_time_label=0.4, wait_after=0.3)
-
-        # Patient 2 — Orange — DOWN+RIGHT
-        plot_patient(71, 110, VECTOR_B_COLOR,
-                     r"$\vec{p}_2 = \begin{bmatrix} 71 \\ 110 \end{bmatrix}$",
-                     DOWN + RIGHT, run_time_arrow=0.5, wait_after=0.2)
-
-        # Patient 3 — Green — LEFT
-        plot_patient(48, 110, RESULTANT_COLOR,
-                     r"$\vec{p}_3 = \begin{bmatrix} 48 \\ 110 \end{bmatrix}$",
-                     LEFT, run_time_arrow=0.5, wait_after=0.2)
-
-        # Patient 4 — Purple — UP+LEFT
-        plot_patient(34, 123, PROJECTION_COLOR,
-                     r"$\begin{bmatrix} 34 \\ 123 \end{bmatrix}$",
-                     UP + LEFT, font_size=14, stroke_width=2.5,
-                     run_time_arrow=0.4, run_time_label=0.3, wait_after=0.15)
-
-        # Patient 5 — Gray — RIGHT
-        plot_patient(62, 152, LABEL_COLOR,
-                     r"$\begin{bmatrix} 62 \\ 152 \end{bmatrix}$",
-                     RIGHT, font_size=14, stroke_width=2.5,
-                     run_time_arrow=0.4, run_time_label=0.3, wait_after=0.15)
+        # Blue, orange, green, purple, gray
+        colors = [VECTOR_A_COLOR, VECTOR_B_COLOR, RESULTANT_COLOR,
+                  PROJECTION_COLOR, LABEL_COLOR]
+        for i, (_, age, bp) in enumerate(self.rows_data):
+            label_dir, style = self.patient_styles[i % len(self.patient_styles)]
+            label_tex = rf"\begin{{bmatrix}} {age} \\ {bp} \end{{bmatrix}}"
+            if i < self.named_labels:
+                label_tex = rf"\vec{{p}}_{i + 1} = " + label_tex
+            plot_patient(float(age), float(bp), colors[i % len(colors)],
+                         f"${label_tex}$", label_dir, **style)
 
         self.wait(0.3)
 
         # ═══════════════════════════════════════
         # BEAT 12 — Closing message
         # ═══════════════════════════════════════
+        self.next_beat("closing")
         dim_rect = Rectangle(
             width=14, height=1.4,
             fill_color=BG_COLOR, fill_opacity=0.88,
@@ -378,11 +478,11 @@ class DataToVector(Scene):
         dim_rect.to_edge(DOWN, buff=0)
 
         msg_main = Text(
-            "Every data point is a vector",
+            self.closing,
             font_size=30, color=ACCENT_COLOR, weight=BOLD,
         )
         msg_sub = Text(
-            "Each row in your dataset maps to an arrow in vector space",
+            self.closing_sub,
             font_size=16, color=LABEL_COLOR,
         )
         msg_group = VGroup(msg_main, msg_sub).arrange(DOWN, buff=0.15)
@@ -397,4 +497,107 @@ class DataToVector(Scene):
         self.wait(1.5)
 
         # Final fade
+        self.release_static_layer()
+        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.8)
+
+
+# ============================================================
+# SCENE 2: DatasetToVectors — every CSV row as an arrow
+#
+# Streams a CSV into one batched ArrowField: a single grow
+# animation for all rows, labels only for the highlighted ones.
+# ============================================================
+
+class DatasetToVectors(PipelineScene):
+    csv_path = Path(__file__).parent / "EngComp4_landlinear-master/data/insurance_male_nonsmoker.csv"
+    x_column, y_column, color_column = "age", "bmi", "charges"
+    x_label, y_label = "Age", "BMI"
+    color_buckets = 8
+    highlight_rows = None   # row indices to label; default: min/median/max of color_column
+
+    def construct(self):
+        self.camera.background_color = BG_COLOR
+
+        bg_grid = create_blueprint_grid(x_range=(-8, 8), y_range=(-5, 5), step=2)
+        bg_grid.set_opacity(0.12)
+        self.add_static_layer(bg_grid)
+
+        data = load_csv_columns(self.csv_path, [self.x_column, self.y_column, self.color_column])
+        xs, ys, values = data[:, 0], data[:, 1], data[:, 2]
+        n = len(data)
+
+        # ═══════════════════════════════════════
+        # BEAT 1 — Title + axes
+        # ═══════════════════════════════════════
+        self.next_beat("axes")
+        title = Text(f"{n} ROWS → {n} VECTORS", font_size=14,
+                     color=VECTOR_A_COLOR, weight=BOLD)
+        title.to_edge(UP, buff=0.4)
+        source = Text(Path(self.csv_path).name, font_size=12, color=LABEL_COLOR, font="Consolas")
+        source.next_to(title, DOWN, buff=0.15)
+
+        x_max = 10 * np.ceil(xs.max() / 10)
+        y_max = 10 * np.ceil(ys.max() / 10)
+        axes = Axes(
+            x_range=[0, x_max, 10], y_range=[0, y_max, 10],
+            x_length=9.0, y_length=5.2,
+            axis_config={
+                "color": LABEL_COLOR, "stroke_width": 1.5,
+                "include_ticks": True, "tick_size": 0.04,
+                "include_numbers": True, "font_size": 14,
+            },
+            tips=True,
+        )
+        axes.shift(DOWN * 0.4)
+        x_label = Text(self.x_label, font_size=16, color=LABEL_COLOR)
+        x_label.next_to(axes.x_axis, DOWN, buff=0.25)
+        y_label = Text(self.y_label, font_size=16, color=LABEL_COLOR)
+        y_label.next_to(axes.y_axis, LEFT, buff=0.25)
+
+        self.play(
+            FadeIn(title, shift=DOWN * 0.1), FadeIn(source),
+            Create(axes, lag_ratio=0.02),
+            FadeIn(x_label), FadeIn(y_label),
+            run_time=0.8,
+        )
+
+        # ═══════════════════════════════════════
+        # BEAT 2 — All rows at once
+        # ═══════════════════════════════════════
+        self.next_beat("field")
+        points = axes.c2p(xs, ys).T
+        # Quantile buckets keep the number of Cairo paths fixed.
+        edges = np.quantile(values, np.linspace(0, 1, self.color_buckets + 1)[1:-1])
+        bucket = np.searchsorted(edges, values)
+        ramp = color_gradient([VECTOR_A_COLOR, VECTOR_B_COLOR], self.color_buckets)
+        field = ArrowField(
+            axes.c2p(0, 0), points, colors=[ramp[b] for b in bucket],
+            stroke_width=max(0.4, 2.5 / np.sqrt(n / 25)),
+            stroke_opacity=0.7, tip_length=0.06,
+        )
+        self.play(GrowArrowField(field), run_time=1.5)
+        self.wait(0.3)
+
+        # ═══════════════════════════════════════
+        # BEAT 3 — Label the highlighted rows only
+        # ═══════════════════════════════════════
+        self.next_beat("highlights")
+        highlight = self.highlight_rows
+        if highlight is None:
+            order = np.argsort(values)
+            highlight = [order[0], order[len(order) // 2], order[-1]]
+        marks = []
+        for row in highlight:
+            pt = points[row]
+            lab = Tex(
+                rf"$\begin{{bmatrix}} {xs[row]:g} \\ {ys[row]:g} \end{{bmatrix}}$",
+                font_size=14, color=HIGHLIGHT_COLOR,
+            )
+            lab.next_to(pt, UR, buff=0.08)
+            marks += [create_glowing_dot(pt, HIGHLIGHT_COLOR), lab]
+        self.play(LaggedStart(*[FadeIn(mob, scale=1.5) for mob in marks],
+                              lag_ratio=0.15), run_time=0.8)
+        self.wait(1.5)
+
+        self.release_static_layer()
         self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.8)
@@ -0,0 +1,8 @@
+"""
+Render pipeline for the Blueprint Noir manim scenes.
+
+Tooling that sits between the scene files (``manim_scenes.py``,
+``claude_words_scene.py``) and the Beamer deck (``slides.tex``): rendering
+scenes to the PNG frame sequences loaded by ``\\animategraphics``.
+Each module is runnable with ``python -m render_pipeline.<module>``.
+"""
@@ -0,0 +1,154 @@
+"""
+Per-beat frame cache.
+
+Scenes deriving from ``PipelineScene`` mark their beats with
+``self.next_beat(name)``. Each beat is keyed on a hash of the mobject state
+and animations of its plays (manim's own play-call hash, which covers
+timing and colors) plus the scene module's palette constants and the
+render resolution. Unchanged beats are served from
+``media/beat_cache/<Scene>/<key>/`` and only dirty beats are rasterized.
+
+Usage:
+    python -m render_pipeline.beats manim_scenes.py DataToVector \\
+        -o frames/data_to_vector -j 8
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .common import QUALITIES, module_constants
+from .parallel import (
+    FrameRangeRenderer,
+    plan_ranges,
+    play_costs,
+    render_plays,
+    run_scene,
+    stitch_frames,
+)
+from .texbatch import precompile_scene_tex
+
+CACHE_DIR = Path("media") / "beat_cache"
+
+
+class HashingRenderer(FrameRangeRenderer):
+    """Probe renderer that asks ``PipelineScene`` to hash every play."""
+
+    record_play_hashes = True
+
+
+def palette_constants(scene_file):
+    """Palette and layout constants of the scene module, as hashable text."""
+    return {name: repr(value) for name, value in module_constants(scene_file).items()}
+
+
+def beat_keys(scene, scene_file, quality):
+    """Return ``[(name, plays, key)]`` for every non-empty beat of a probed scene."""
+    num_plays = len(scene.play_hashes)
+    starts = [("setup", 0)] + list(scene.beats)
+    salt = json.dumps({
+        "scene": type(scene).__name__,
+        "quality": QUALITIES[quality],
+        "palette": palette_constants(scene_file),
+    }, sort_keys=True)
+
+    beats = []
+    for i, (name, start) in enumerate(starts):
+        stop = starts[i + 1][1] if i + 1 < len(starts) else num_plays
+        if stop <= start:
+            continue
+        digest = hashlib.sha256(salt.encode())
+        for play_hash in scene.play_hashes[start:stop]:
+            digest.update(play_hash.encode())
+        beats.append((name, range(start, stop), digest.hexdigest()[:16]))
+    return beats
+
+
+def render_beats(scene_file, scene_name, output_dir, quality="high", workers=None,
+                 cache_dir=CACHE_DIR, prune=False):
+    """Render a scene to a PNG sequence, re-rasterizing only dirty beats.
+
+    Returns ``(total_frames, dirty_beat_names)``.
+    """
+    workers = workers or os.cpu_count() or 1
+    scene_cache = Path(cache_dir) / scene_name
+    scene_cache.mkdir(parents=True, exist_ok=True)
+
+    precompile_scene_tex(scene_file, scene_name, quality)
+    scene = run_scene(scene_file, scene_name, quality, HashingRenderer(plays=()))
+    beats = beat_keys(scene, scene_file, quality)
+    dirty = [(name, plays, key) for name, plays, key in beats
+             if not (scene_cache / key).is_dir()]
+
+    if dirty:
+        dirty_plays = {index for _, plays, _ in dirty for index in plays}
+        costs = [cost if index in dirty_plays else 0.0
+                 for index, cost in enumerate(play_costs(scene, QUALITIES[quality][2]))]
+        jobs = [[index for index in r if index in dirty_plays]
+                for r in plan_ranges(costs, workers)]
+        jobs = [job for job in jobs if job]
+
+        staging = Path(tempfile.mkdtemp(prefix=".beats_", dir=scene_cache))
+        try:
+            counts = {}
+            if len(jobs) == 1:
+                counts = render_plays(scene_file, scene_name, quality, jobs[0], staging)
+            else:
+                with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+                    futures = [pool.submit(render_plays, scene_file, scene_name,
+                                           quality, job, staging) for job in jobs]
+                    for future in futures:
+                        counts.update(future.result())
+
+            for _, plays, key in dirty:
+                beat_dir = staging / key
+                stitch_frames([(staging / f"play_{index:04d}", counts.get(index, 0))
+                               for index in plays], beat_dir)
+                os.replace(beat_dir, scene_cache / key)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    beat_dirs = [scene_cache / key for _, _, key in beats]
+    total = stitch_frames(
+        [(beat_dir, len(list(beat_dir.glob("frame_*.png")))) for beat_dir in beat_dirs],
+        output_dir, link=True,
+    )
+
+    if prune:
+        current = {key for _, _, key in beats}
+        for entry in scene_cache.iterdir():
+            if entry.is_dir() and entry.name not in current:
+                shutil.rmtree(entry, ignore_errors=True)
+
+    return total, [name for name, _, _ in dirty]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render a scene to PNG frames, reusing unchanged beats from cache.",
+    )
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-o", "--output", required=True, help="frame directory")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="high")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: all cores)")
+    parser.add_argument("--cache-dir", default=str(CACHE_DIR))
+    parser.add_argument("--prune", action="store_true",
+                        help="delete cached beats no longer used by this scene")
+    args = parser.parse_args(argv)
+
+    total, dirty = render_beats(args.scene_file, args.scene_name, args.output,
+                                quality=args.quality, workers=args.workers,
+                                cache_dir=args.cache_dir, prune=args.prune)
+    print(f"{total} frames written to {args.output} "
+          f"({len(dirty)} beat(s) re-rendered: {', '.join(dirty) or 'none'})")
+
+
+if __name__ == "__main__":
+    main()
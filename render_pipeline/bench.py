@@ -0,0 +1,213 @@
+"""
+Render benchmark suite with a JSON history and regression checks.
+
+Renders the full scenes and the micro-scenes of ``bench_scenes.py`` at
+fixed quality presets, each case in a fresh process so peak RSS and warm
+caches do not leak between cases. Frames/sec, wall time, peak RSS and the
+size of the PNG output are appended to a history file together with the
+git commit. Every case is compared with its most recent earlier result on
+the same machine; a slowdown or memory increase beyond ``--threshold``
+is reported as a regression and makes the command exit with status 1.
+
+Usage:
+    python -m render_pipeline.bench                       # everything, all presets
+    python -m render_pipeline.bench -k grid -k arrow -q low
+    python -m render_pipeline.bench --threshold 0.05 --history output/bench.json
+"""
+
+import argparse
+import json
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .common import QUALITIES
+from .parallel import render_frames
+
+ROOT = Path(__file__).resolve().parent.parent
+BENCH_SCENES = Path(__file__).resolve().parent / "bench_scenes.py"
+DEFAULT_HISTORY = ROOT / "output" / "bench_history.json"
+DEFAULT_THRESHOLD = 0.10
+
+# (case name, scene file, scene class)
+CASES = [
+    ("data_to_vector", ROOT / "manim_scenes.py", "DataToVector"),
+    ("claude_code_words", ROOT / "claude_words_scene.py", "ClaudeCodeWords"),
+    ("blueprint_grid", BENCH_SCENES, "BlueprintGridBench"),
+    ("glowing_dot", BENCH_SCENES, "GlowingDotBench"),
+    ("tex_labels", BENCH_SCENES, "TexLabelsBench"),
+    ("arrow_growth", BENCH_SCENES, "ArrowGrowthBench"),
+]
+
+# Metric name -> True when a larger value is better.
+METRICS = {"fps": True, "wall": False, "peak_rss": False}
+
+
+# ============================================================
+# MEASUREMENT
+# ============================================================
+
+def _peak_rss_mb(who):
+    # ru_maxrss is in KiB on Linux and in bytes on macOS.
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def measure(scene_file, scene_name, quality, workers=1):
+    """Render one case into a temporary directory and return its metrics."""
+    output = Path(tempfile.mkdtemp(prefix="bench_"))
+    try:
+        start = time.perf_counter()
+        frames = render_frames(scene_file, scene_name, output, quality, workers)
+        wall = time.perf_counter() - start
+        size = sum(p.stat().st_size for p in output.glob("frame_*.png"))
+    finally:
+        shutil.rmtree(output, ignore_errors=True)
+    return {
+        "frames": frames,
+        "wall": wall,
+        "fps": frames / wall if wall else 0.0,
+        "peak_rss": max(_peak_rss_mb(resource.RUSAGE_SELF),
+                        _peak_rss_mb(resource.RUSAGE_CHILDREN)),
+        "output_bytes": size,
+    }
+
+
+def run_case(scene_file, scene_name, quality, workers=1, repeat=1):
+    """Measure a case in a fresh interpreter; keep the fastest of ``repeat`` runs."""
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-m", "render_pipeline.bench", "--measure",
+             str(scene_file), scene_name, quality, str(workers)],
+            cwd=ROOT, check=True, capture_output=True, text=True,
+        )
+        metrics = json.loads(result.stdout.strip().splitlines()[-1])
+        if best is None or metrics["wall"] < best["wall"]:
+            best = metrics
+    return best
+
+
+# ============================================================
+# HISTORY
+# ============================================================
+
+def git_commit():
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                check=True, capture_output=True, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                           cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    return result.stdout.strip() + ("-dirty" if dirty else "")
+
+
+def load_history(path):
+    path = Path(path)
+    return json.loads(path.read_text()) if path.exists() else []
+
+
+def previous_results(history, machine):
+    """Most recent earlier result of every case key recorded on ``machine``."""
+    latest = {}
+    for run in history:
+        if run["machine"] == machine:
+            latest.update(run["results"])
+    return latest
+
+
+def find_regressions(results, baseline, threshold):
+    """``(key, metric, old, new)`` for every metric worse than ``threshold``."""
+    regressions = []
+    for key, metrics in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            before, after = old[metric], metrics[metric]
+            if not before:
+                continue
+            change = (after - before) / before
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append((key, metric, before, after))
+    return regressions
+
+
+# ============================================================
+# ENTRY POINTS
+# ============================================================
+
+def run_suite(cases, qualities, history_path=DEFAULT_HISTORY, threshold=DEFAULT_THRESHOLD,
+              workers=1, repeat=1, record=True):
+    """Run ``cases`` at ``qualities``; returns ``(results, regressions)``."""
+    machine = f"{platform.node()} {platform.machine()} {platform.python_version()}"
+    history = load_history(history_path)
+    baseline = previous_results(history, machine)
+
+    results = {}
+    for name, scene_file, scene_name in cases:
+        for quality in qualities:
+            key = f"{name}@{quality}"
+            results[key] = metrics = run_case(scene_file, scene_name, quality, workers, repeat)
+            print(f"{key:<28} {metrics['frames']:>5} frames  {metrics['wall']:>7.2f} s  "
+                  f"{metrics['fps']:>7.1f} fps  {metrics['peak_rss']:>6.0f} MB  "
+                  f"{metrics['output_bytes'] / 2**20:>7.1f} MiB", flush=True)
+
+    if record:
+        history.append({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": git_commit(),
+            "machine": machine,
+            "workers": workers,
+            "results": results,
+        })
+        Path(history_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(history_path).write_text(json.dumps(history, indent=1))
+    return results, find_regressions(results, baseline, threshold)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["--measure"]:
+        scene_file, scene_name, quality, workers = argv[1:5]
+        print(json.dumps(measure(scene_file, scene_name, quality, int(workers))))
+        return
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark scene rendering and flag regressions against history.",
+    )
+    parser.add_argument("-k", "--case", action="append", default=None,
+                        help="only run cases whose name contains this (repeatable)")
+    parser.add_argument("-q", "--quality", action="append", choices=sorted(QUALITIES),
+                        default=None, help="preset(s) to run (default: all)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative change counted as a regression (default: 0.10)")
+    parser.add_argument("--history", default=str(DEFAULT_HISTORY))
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="render processes per case (default: 1)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="runs per case; the fastest is kept")
+    parser.add_argument("--no-record", action="store_true",
+                        help="compare only, do not append to the history")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in CASES
+             if not args.case or any(k in case[0] for k in args.case)]
+    qualities = args.quality or list(QUALITIES)
+    _, regressions = run_suite(cases, qualities, args.history, args.threshold,
+                               args.workers, args.repeat, not args.no_record)
+
+    for key, metric, before, after in regressions:
+        print(f"REGRESSION {key} {metric}: {before:.2f} -> {after:.2f}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
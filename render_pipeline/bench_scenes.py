@@ -0,0 +1,76 @@
+"""
+Micro-scenes for ``render_pipeline.bench``.
+
+Each scene isolates one building block of the Blueprint Noir scenes so its
+rendering cost can be tracked on its own. They import the real helpers from
+``manim_scenes.py`` and are only meant to be rendered by the benchmark.
+"""
+
+from manim import *
+import numpy as np
+
+from manim_scenes import (
+    ACCENT_COLOR,
+    BG_COLOR,
+    LABEL_COLOR,
+    RESULTANT_COLOR,
+    VECTOR_A_COLOR,
+    VECTOR_B_COLOR,
+    create_blueprint_grid,
+    create_glowing_dot,
+)
+
+
+class BlueprintGridBench(Scene):
+    """A dense ``create_blueprint_grid`` drawn in, then panned every frame."""
+
+    def construct(self):
+        self.camera.background_color = BG_COLOR
+        grid = create_blueprint_grid(x_range=(-8, 8), y_range=(-5, 5), step=0.5)
+        self.play(Create(grid), run_time=1.0)
+        self.play(grid.animate.shift(RIGHT * 0.5), run_time=1.0)
+
+
+class GlowingDotBench(Scene):
+    """Forty ``create_glowing_dot`` groups popping in, as in the patient plot."""
+
+    def construct(self):
+        self.camera.background_color = BG_COLOR
+        rng = np.random.default_rng(0)
+        dots = [
+            create_glowing_dot(np.array([x, y, 0.0]), color=ACCENT_COLOR)
+            for x, y in rng.uniform((-6, -3), (6, 3), size=(40, 2))
+        ]
+        self.play(LaggedStart(*[GrowFromCenter(dot) for dot in dots], lag_ratio=0.05),
+                  run_time=1.5)
+        self.play(*[dot.animate.scale(1.5) for dot in dots], run_time=0.5)
+
+
+class TexLabelsBench(Scene):
+    """Tex/MathTex vector labels written in, as in the extract beat."""
+
+    def construct(self):
+        self.camera.background_color = BG_COLOR
+        labels = VGroup(*[
+            MathTex(rf"\vec{{x}}_{{{i}}} = \begin{{bmatrix}} {20 + i} \\ {110 + 3 * i} \end{{bmatrix}}",
+                    font_size=30, color=LABEL_COLOR)
+            for i in range(6)
+        ]).arrange_in_grid(rows=2, buff=0.6)
+        self.play(LaggedStart(*[Write(label) for label in labels], lag_ratio=0.15),
+                  run_time=1.5)
+        self.play(labels.animate.set_color(ACCENT_COLOR), run_time=0.5)
+
+
+class ArrowGrowthBench(Scene):
+    """A fan of ``Arrow`` mobjects grown from the origin."""
+
+    def construct(self):
+        self.camera.background_color = BG_COLOR
+        colors = [VECTOR_A_COLOR, VECTOR_B_COLOR, RESULTANT_COLOR]
+        arrows = [
+            Arrow(ORIGIN, 3 * np.array([np.cos(angle), np.sin(angle), 0.0]), buff=0,
+                  color=colors[i % len(colors)], stroke_width=4)
+            for i, angle in enumerate(np.linspace(0, TAU, 24, endpoint=False))
+        ]
+        self.play(LaggedStart(*[GrowArrow(arrow) for arrow in arrows], lag_ratio=0.1),
+                  run_time=2.0)
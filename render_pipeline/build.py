@@ -0,0 +1,244 @@
+"""
+Incremental build: scene sources → frame sequences → slides PDF.
+
+The graph has one frames node per entry of ``SCENES`` and one PDF node.
+A default build only targets the frames that ``slides.tex`` loads; other
+scenes are rendered with ``--force``.
+
+* a frames node is fingerprinted from the AST of its scene class and of
+  the module-level code around it (palette constants, helpers; sibling
+  scene classes excluded), the ``render_pipeline`` modules the scene file
+  imports, its quality preset and the manim version;
+* the PDF node is fingerprinted from ``slides.tex`` and the fingerprint
+  and frame count of every directory its ``\\animategraphics`` load.
+
+Fingerprints of the last successful build live in
+``output/build_state.json``; only nodes whose fingerprint changed or whose
+outputs are missing are rebuilt and stale scenes render in parallel. The
+frame counts go to the generated ``output/frame_ranges.tex``, which
+``slides.tex`` reads through ``\\lastframe``; the tracked source is never
+rewritten. An up-to-date build only parses and hashes; manim is never
+imported.
+
+Usage:
+    python -m render_pipeline.build
+    python -m render_pipeline.build --dry-run
+    python -m render_pipeline.build --force frames/data_to_vector
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
+from pathlib import Path
+
+from .common import frame_name
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_DIR = Path(__file__).resolve().parent
+SLIDES = ROOT / "slides.tex"
+OUTPUT_DIR = ROOT / "output"
+STATE_FILE = OUTPUT_DIR / "build_state.json"
+FRAME_RANGES = OUTPUT_DIR / "frame_ranges.tex"
+PDF_NODE = "output/slides.pdf"
+
+# Frame directory -> (scene file, scene class, quality preset)
+SCENES = {
+    "frames/data_to_vector": ("manim_scenes.py", "DataToVector", "high"),
+    "frames/claude_code_words": ("claude_words_scene.py", "ClaudeCodeWords", "high"),
+}
+
+# The {frames/<dir>/frame_} path prefix of an \animategraphics.
+_FRAME_PREFIX = re.compile(r"\{(frames/[^}]+)/frame_\}")
+
+
+# ============================================================
+# FINGERPRINTS
+# ============================================================
+
+def _digest(*parts):
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def _is_scene(node):
+    return isinstance(node, ast.ClassDef) and any(
+        isinstance(item, ast.FunctionDef) and item.name == "construct" for item in node.body
+    )
+
+
+def _pipeline_imports(tree, relative):
+    """Files of ``render_pipeline`` modules imported at the top of ``tree``."""
+    for node in tree.body:
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        if node.level == 0 and (node.module or "").startswith("render_pipeline."):
+            yield PACKAGE_DIR / (node.module.split(".", 1)[1].replace(".", "/") + ".py")
+        elif node.level == 1 and relative and node.module:
+            yield PACKAGE_DIR / (node.module.replace(".", "/") + ".py")
+
+
+def _module_digests(paths):
+    """AST digests of ``paths`` and the package modules they import, transitively."""
+    digests, pending = {}, list(paths)
+    while pending:
+        path = pending.pop()
+        if path in digests or not path.exists():
+            continue
+        tree = ast.parse(path.read_text())
+        digests[path] = _digest(ast.dump(tree))
+        pending.extend(_pipeline_imports(tree, relative=True))
+    return [digests[path] for path in sorted(digests)]
+
+
+def _manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def scene_fingerprint(scene_file, scene_name, quality):
+    """Fingerprint of everything that decides a scene's rendered frames."""
+    tree = ast.parse((ROOT / scene_file).read_text())
+    if not any(_is_scene(node) and node.name == scene_name for node in tree.body):
+        raise ValueError(f"{scene_name} is not defined in {scene_file}")
+    # Comments and formatting do not reach the AST; sibling scenes do not
+    # affect this one.
+    own = [ast.dump(node) for node in tree.body if not _is_scene(node) or node.name == scene_name]
+    return _digest(*own, quality, _manim_version(),
+                   *_module_digests(_pipeline_imports(tree, relative=False)))
+
+
+def count_frames(frame_dir):
+    return sum(1 for _ in (ROOT / frame_dir).glob("frame_*.png"))
+
+
+def slides_frame_dirs(text):
+    return list(dict.fromkeys(match.group(1) for match in _FRAME_PREFIX.finditer(text)))
+
+
+def frame_ranges_tex(counts):
+    """``\\lastframe`` definitions for output/frame_ranges.tex."""
+    lines = ["% Generated by render_pipeline.build; do not edit."]
+    for frame_dir, count in sorted(counts.items()):
+        if count:
+            lines.append(f"\\expandafter\\def\\csname lastframe@{frame_dir}\\endcsname{{{count:04d}}}")
+    return "\n".join(lines) + "\n"
+
+
+# ============================================================
+# BUILD STEPS
+# ============================================================
+
+def _render_node(scene_file, scene_name, frame_dir, quality, workers):
+    from .parallel import render_frames  # manim is only imported when rendering
+
+    return render_frames(ROOT / scene_file, scene_name, ROOT / frame_dir, quality, workers)
+
+
+def compile_slides(max_passes=3):
+    """Run pdflatex into output/, repeating while auxiliary files change."""
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    aux_files = [OUTPUT_DIR / f"slides.{ext}" for ext in ("aux", "nav", "toc", "snm", "out")]
+
+    def snapshot():
+        return [path.read_bytes() if path.exists() else b"" for path in aux_files]
+
+    for _ in range(max_passes):
+        before = snapshot()
+        subprocess.run(
+            ["pdflatex", "-interaction=nonstopmode", "-halt-on-error",
+             f"-output-directory={OUTPUT_DIR}", SLIDES.name],
+            cwd=ROOT, check=True, stdout=subprocess.DEVNULL,
+        )
+        if snapshot() == before:
+            break
+
+
+def build(force=(), dry_run=False, workers=None):
+    """Bring frames and the PDF up to date; returns the rebuilt node names."""
+    state = json.loads(STATE_FILE.read_text()) if STATE_FILE.exists() else {}
+    rebuilt = []
+
+    text = SLIDES.read_text()
+    used = slides_frame_dirs(text)
+    fingerprints = {
+        frame_dir: scene_fingerprint(*spec) for frame_dir, spec in SCENES.items()
+        if frame_dir in used or frame_dir in force
+    }
+    stale = [
+        frame_dir for frame_dir, fingerprint in fingerprints.items()
+        if frame_dir in force
+        or state.get(frame_dir, {}).get("fingerprint") != fingerprint
+        or not (ROOT / frame_dir / frame_name(1)).exists()
+    ]
+
+    if stale and not dry_run:
+        per_scene = max(1, (workers or os.cpu_count() or 1) // len(stale))
+        with ProcessPoolExecutor(max_workers=len(stale)) as pool:
+            futures = {
+                frame_dir: pool.submit(_render_node, *SCENES[frame_dir][:2], frame_dir,
+                                       SCENES[frame_dir][2], per_scene)
+                for frame_dir in stale
+            }
+            try:
+                for frame_dir, future in futures.items():
+                    state[frame_dir] = {"fingerprint": fingerprints[frame_dir],
+                                        "frames": future.result()}
+                    rebuilt.append(frame_dir)
+            finally:
+                OUTPUT_DIR.mkdir(exist_ok=True)
+                STATE_FILE.write_text(json.dumps(state, indent=1))
+    elif stale:
+        rebuilt.extend(stale)
+
+    counts = {
+        frame_dir: state[frame_dir]["frames"] if frame_dir in state else count_frames(frame_dir)
+        for frame_dir in used
+    }
+    ranges = frame_ranges_tex(counts)
+    if not dry_run and (not FRAME_RANGES.exists() or FRAME_RANGES.read_text() != ranges):
+        OUTPUT_DIR.mkdir(exist_ok=True)
+        FRAME_RANGES.write_text(ranges)
+
+    pdf_fingerprint = _digest(text, ranges, *(
+        f"{frame_dir}:{state.get(frame_dir, {}).get('fingerprint', '')}:{counts[frame_dir]}"
+        for frame_dir in sorted(counts)
+    ))
+    if (PDF_NODE in force or any(frame_dir in stale for frame_dir in counts)
+            or state.get(PDF_NODE, {}).get("fingerprint") != pdf_fingerprint
+            or not (ROOT / PDF_NODE).exists()):
+        rebuilt.append(PDF_NODE)
+        if not dry_run:
+            compile_slides()
+            state[PDF_NODE] = {"fingerprint": pdf_fingerprint}
+            STATE_FILE.write_text(json.dumps(state, indent=1))
+    return rebuilt
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Rebuild stale scene frames and the slides PDF.",
+    )
+    parser.add_argument("--force", action="append", default=[], metavar="NODE",
+                        help=f"rebuild a node regardless of its fingerprint "
+                             f"({', '.join([*SCENES, PDF_NODE])})")
+    parser.add_argument("--dry-run", action="store_true", help="only list stale nodes")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="render processes shared by all stale scenes")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rebuilt = build(args.force, args.dry_run, args.workers)
+    verb = "stale" if args.dry_run else "rebuilt"
+    print(f"{verb}: {', '.join(rebuilt) or 'nothing'} ({time.perf_counter() - start:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Shared helpers: scene loading, quality presets and the frame naming used by
+the ``\\animategraphics`` sequences under ``frames/``.
+"""
+
+import ast
+import importlib.util
+import sys
+from pathlib import Path
+
+# ============================================================
+# QUALITY PRESETS — (pixel_width, pixel_height, frame_rate)
+# ============================================================
+QUALITIES = {
+    "low": (854, 480, 15),
+    "medium": (1280, 720, 30),
+    "high": (1920, 1080, 60),
+}
+
+FRAME_PREFIX = "frame_"
+
+
+def frame_name(index, digits=4):
+    """File name of the 1-based frame ``index``, e.g. ``frame_0001.png``."""
+    return f"{FRAME_PREFIX}{index:0{digits}d}.png"
+
+
+def load_scene_module(scene_file):
+    """Import a scene file by path, the way the manim CLI does."""
+    path = Path(scene_file).resolve()
+    module = sys.modules.get(path.stem)
+    if module is not None and getattr(module, "__file__", None) == str(path):
+        return module
+
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[path.stem] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_scene_class(scene_file, scene_name):
+    """Return the Scene subclass ``scene_name`` defined in ``scene_file``."""
+    module = load_scene_module(scene_file)
+    try:
+        return getattr(module, scene_name)
+    except AttributeError:
+        raise ValueError(f"{scene_name} is not defined in {scene_file}") from None
+
+
+def module_constants(scene_file):
+    """Module-level UPPER_CASE constants assigned in ``scene_file`` itself.
+
+    Names pulled in by ``from manim import *`` are left out.
+    """
+    module = load_scene_module(scene_file)
+    tree = ast.parse(Path(scene_file).read_text())
+    names = {
+        target.id
+        for node in tree.body if isinstance(node, ast.Assign)
+        for target in node.targets
+        if isinstance(target, ast.Name) and target.id.isupper()
+    }
+    return {name: getattr(module, name) for name in sorted(names)}
+
+
+def render_config(quality, **overrides):
+    """Manim config values for a quality preset, suitable for ``tempconfig``."""
+    width, height, fps = QUALITIES[quality]
+    options = {"pixel_width": width, "pixel_height": height, "frame_rate": fps}
+    options.update(overrides)
+    return options
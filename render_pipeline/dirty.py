@@ -0,0 +1,160 @@
+"""
+Dirty-rectangle rasterization.
+
+Most frames of the Blueprint Noir scenes change in a small area: an arrow
+growing in ``plot_patient``, one word pulsing in ``ClaudeCodeWords``.
+``DirtyRectRenderer`` compares each moving mobject's points and style with
+the previous frame. It restores the static image only inside the
+pixel-aligned boxes around what changed (old and new extent), and redraws
+the moving mobjects that touch those boxes through a matching Cairo clip.
+Pixels outside the boxes keep their previous value, which is what a full
+redraw would produce there, so per-frame cost follows the changed area.
+The renderer falls back to a full redraw on the first frame of every
+play, when the set of moving mobjects changes, when anything but
+VMobjects moves, or when the changed area is large.
+
+Usage:
+    python -m render_pipeline.parallel manim_scenes.py DataToVector \\
+        -o frames/data_to_vector --dirty-rects
+"""
+
+import math
+
+from manim import VMobject
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+
+from .parallel import FrameRangeRenderer
+
+MAX_DIRTY_FRACTION = 0.6
+MAX_RECTS = 8
+MITER_LIMIT = 10        # cairo's default: joins reach 10 half-widths out
+ANTIALIAS_PAD = 2
+
+
+def _state(mob):
+    """Everything about a VMobject that affects its pixels."""
+    return (
+        mob.points.tobytes(),
+        mob.fill_rgbas.tobytes(),
+        mob.stroke_rgbas.tobytes(),
+        mob.background_stroke_rgbas.tobytes(),
+        repr((mob.stroke_width, mob.background_stroke_width, mob.sheen_factor,
+              tuple(mob.sheen_direction), mob.z_index, getattr(mob, "joint_type", None))),
+    )
+
+
+def _overlap(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def merge_rects(rects, limit=MAX_RECTS):
+    """Merge overlapping ``(x0, y0, x1, y1)`` boxes; at most ``limit`` remain."""
+    merged = []
+    for rect in sorted(rects):
+        for i, other in enumerate(merged):
+            if _overlap(rect, other):
+                merged[i] = (min(rect[0], other[0]), min(rect[1], other[1]),
+                             max(rect[2], other[2]), max(rect[3], other[3]))
+                break
+        else:
+            merged.append(rect)
+    if len(merged) < len(rects):
+        return merge_rects(merged, limit)
+    if len(merged) > limit:
+        return [(min(r[0] for r in merged), min(r[1] for r in merged),
+                 max(r[2] for r in merged), max(r[3] for r in merged))]
+    return merged
+
+
+class DirtyRectRenderer(FrameRangeRenderer):
+    """``FrameRangeRenderer`` that only re-rasterizes the regions that changed.
+
+    ``stats`` counts ``full`` and ``partial`` frames and the summed fraction
+    of the frame area that was redrawn.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = {"full": 0, "partial": 0, "area": 0.0}
+        self._previous = None
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self._previous = None
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def _pixel_box(self, mob):
+        camera = self.camera
+        if not len(mob.points):
+            return None
+        scale_x = camera.pixel_width / camera.frame_width
+        scale_y = camera.pixel_height / camera.frame_height
+        center = camera.frame_center
+        width = max(mob.get_stroke_width(), mob.get_stroke_width(background=True))
+        pad = MITER_LIMIT * 0.5 * width * camera.cairo_line_width_multiple * scale_x + ANTIALIAS_PAD
+        low, high = mob.points.min(axis=0), mob.points.max(axis=0)
+        x0 = max(0, math.floor((low[0] - center[0]) * scale_x + camera.pixel_width / 2 - pad))
+        x1 = min(camera.pixel_width, math.ceil((high[0] - center[0]) * scale_x + camera.pixel_width / 2 + pad))
+        y0 = max(0, math.floor((center[1] - high[1]) * scale_y + camera.pixel_height / 2 - pad))
+        y1 = min(camera.pixel_height, math.ceil((center[1] - low[1]) * scale_y + camera.pixel_height / 2 + pad))
+        return (x0, y0, x1, y1) if x0 < x1 and y0 < y1 else None
+
+    def _redraw(self, members, boxes, rects):
+        camera = self.camera
+        base = self.static_image if self.static_image is not None else camera.background
+        for x0, y0, x1, y1 in rects:
+            camera.pixel_array[y0:y1, x0:x1] = base[y0:y1, x0:x1]
+
+        ctx = camera.get_cairo_context(camera.pixel_array)
+        ctx.save()
+        matrix = ctx.get_matrix()
+        ctx.identity_matrix()
+        for x0, y0, x1, y1 in rects:
+            ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.clip()
+        ctx.set_matrix(matrix)
+        try:
+            touched = [mob for mob, box in zip(members, boxes)
+                       if box is not None and any(_overlap(box, rect) for rect in rects)]
+            camera.capture_mobjects(touched, include_submobjects=False)
+        finally:
+            ctx.restore()
+
+    def render(self, scene, time, moving_mobjects):
+        mobjects = moving_mobjects or list_update(scene.mobjects, scene.foreground_mobjects)
+        members = extract_mobject_family_members(
+            mobjects, use_z_index=self.camera.use_z_index, only_those_with_points=True,
+        )
+        if not all(isinstance(mob, VMobject) for mob in members):
+            self._previous = None
+            self.stats["full"] += 1
+            return super().render(scene, time, moving_mobjects)
+
+        states = [_state(mob) for mob in members]
+        boxes = [self._pixel_box(mob) for mob in members]
+        previous, self._previous = self._previous, (members, states, boxes)
+
+        rects = None
+        if previous is not None and len(previous[0]) == len(members) and all(
+            a is b for a, b in zip(previous[0], members)
+        ):
+            dirty = [
+                box
+                for i, state in enumerate(states) if state != previous[1][i]
+                for box in (previous[2][i], boxes[i]) if box is not None
+            ]
+            rects = merge_rects(dirty)
+            area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in rects)
+            fraction = area / (self.camera.pixel_width * self.camera.pixel_height)
+            if fraction > MAX_DIRTY_FRACTION:
+                rects = None
+
+        if rects is None:
+            self.stats["full"] += 1
+            self.update_frame(scene, moving_mobjects)
+        else:
+            self.stats["partial"] += 1
+            self.stats["area"] += fraction
+            if rects:
+                self._redraw(members, boxes, rects)
+        self.add_frame(self.get_frame())
@@ -0,0 +1,138 @@
+"""
+Single-pass dual output: the mp4 movie and the PNG sequence from one render.
+
+``DualOutputRenderer`` hands every rasterized frame to manim's movie
+writer and, as the very same array, to ``PngSequenceWriter``, which
+encodes PNGs on a thread pool. ``get_frame`` returns a fresh buffer for
+every frame that nothing mutates afterwards, so no copy is made for the
+second consumer. The PNG queue is bounded: when encoding falls behind,
+rasterization waits instead of piling frames up in memory.
+
+Usage:
+    python -m render_pipeline.dual manim_scenes.py DataToVector \\
+        -o frames/data_to_vector -j 4
+"""
+
+import argparse
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from manim.renderer.cairo_renderer import CairoRenderer
+from PIL import Image
+
+from .common import QUALITIES, frame_name
+from .parallel import run_scene
+
+DEFAULT_QUEUE_SIZE = 32
+
+
+# ============================================================
+# PNG SINK
+# ============================================================
+
+class PngSequenceWriter:
+    """Write frames as ``frame_0001.png …`` on a thread pool with a bounded queue.
+
+    Any existing ``frame_*.png`` in ``directory`` is removed first. Encoding
+    errors are raised from the next ``write`` or from ``close``.
+    """
+
+    def __init__(self, directory, workers=None, queue_size=DEFAULT_QUEUE_SIZE, digits=4):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for stale in self.directory.glob("frame_*.png"):
+            stale.unlink()
+        self.digits = digits
+        self.count = 0
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._slots = threading.BoundedSemaphore(queue_size)
+        self._errors = []
+
+    def write(self, frame, num_frames=1):
+        """Queue ``frame`` as the next ``num_frames`` frames of the sequence."""
+        if self._errors:
+            raise self._errors[0]
+        self._slots.acquire()
+        first = self.count + 1
+        self.count += num_frames
+        future = self._pool.submit(self._encode, frame, first, num_frames)
+        future.add_done_callback(self._done)
+
+    def _encode(self, frame, first, num_frames):
+        # Held frames (self.wait) are encoded once and copied.
+        path = self.directory / frame_name(first, self.digits)
+        Image.fromarray(frame).save(path)
+        for index in range(first + 1, first + num_frames):
+            shutil.copyfile(path, self.directory / frame_name(index, self.digits))
+
+    def _done(self, future):
+        self._slots.release()
+        if future.exception() is not None:
+            self._errors.append(future.exception())
+
+    def close(self):
+        """Wait for every queued frame to be written."""
+        self._pool.shutdown(wait=True)
+        if self._errors:
+            raise self._errors[0]
+
+
+# ============================================================
+# RENDERER
+# ============================================================
+
+class DualOutputRenderer(CairoRenderer):
+    """Cairo renderer feeding the movie writer and a PNG sequence together."""
+
+    def __init__(self, frame_dir, workers=None, queue_size=DEFAULT_QUEUE_SIZE, **kwargs):
+        super().__init__(**kwargs)
+        self.png_writer = PngSequenceWriter(frame_dir, workers, queue_size)
+
+    def add_frame(self, frame, num_frames=1):
+        super().add_frame(frame, num_frames)
+        if not self.skip_animations:
+            self.png_writer.write(frame, num_frames)
+
+    def scene_finished(self, scene):
+        try:
+            super().scene_finished(scene)
+        finally:
+            self.png_writer.close()
+
+
+def render_both(scene_file, scene_name, frame_dir, quality="high", workers=None,
+                queue_size=DEFAULT_QUEUE_SIZE):
+    """Render the movie and the PNG sequence in one pass.
+
+    Returns ``(frames, movie_path)``. Caching is disabled: a play served
+    from manim's partial-movie cache would produce no frames for the PNGs.
+    """
+    renderer = DualOutputRenderer(frame_dir, workers, queue_size)
+    run_scene(scene_file, scene_name, quality, renderer,
+              write_to_movie=True, disable_caching=True)
+    return renderer.png_writer.count, renderer.file_writer.movie_file_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render a scene to an mp4 and a PNG frame sequence in one pass.",
+    )
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-o", "--output", required=True, help="frame directory")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="high")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="PNG encoder threads (default: Python's thread pool default)")
+    parser.add_argument("--queue", type=int, default=DEFAULT_QUEUE_SIZE,
+                        help="frames allowed in flight before rendering waits")
+    args = parser.parse_args(argv)
+
+    frames, movie = render_both(args.scene_file, args.scene_name, args.output,
+                                args.quality, args.workers, args.queue)
+    print(f"{frames} frames written to {args.output}, movie at {movie}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Beamer export: duplicate-frame elimination and ``animate`` timelines.
+
+``self.wait(...)`` holds produce runs of pixel-identical frames that
+``\\animategraphics`` still embeds and decodes one by one. This stage keeps
+each run's first frame once and writes an ``animate`` timeline in which the
+held frame's frame rate is divided by the run length, so playback timing is
+unchanged while the frame count drops.
+
+Usage:
+    python -m render_pipeline.export frames/data_to_vector \\
+        frames/data_to_vector_unique --fps 60
+
+and in slides.tex (first/last frame arguments stay empty with a timeline):
+    \\animategraphics[timeline=frames/data_to_vector_unique/timeline.txt, ...]
+        {60}{frames/data_to_vector_unique/}{}{}
+"""
+
+import argparse
+import hashlib
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from .common import frame_name
+
+TIMELINE_NAME = "timeline.txt"
+
+
+def _load(path):
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGBA"), dtype=np.int16)
+
+
+def _digest(path):
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).digest()
+
+
+def find_holds(paths, tolerance=0, workers=None):
+    """Group consecutive frames into holds of (near-)identical frames.
+
+    A frame joins the current hold when it is byte-identical to the hold's
+    first frame or no channel of any pixel differs from it by more than
+    ``tolerance``. Comparing against the first frame (not the previous one)
+    keeps slow fades from drifting into a single hold. Returns an ordered
+    list of ``(path, count)``.
+    """
+    paths = [Path(p) for p in paths]
+    if not paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = list(pool.map(_digest, paths))
+
+    holds = [[paths[0], 1]]
+    key_digest, key_pixels = digests[0], None
+    for path, digest in zip(paths[1:], digests[1:]):
+        if digest == key_digest:
+            holds[-1][1] += 1
+            continue
+        if key_pixels is None:
+            key_pixels = _load(holds[-1][0])
+        pixels = _load(path)
+        if pixels.shape == key_pixels.shape and np.abs(pixels - key_pixels).max() <= tolerance:
+            holds[-1][1] += 1
+            continue
+        holds.append([path, 1])
+        key_digest, key_pixels = digest, pixels
+    return [tuple(hold) for hold in holds]
+
+
+def write_timeline(holds, path, fps, digits=4):
+    """Write an ``animate`` timeline: one line per unique frame.
+
+    A hold of ``n`` frames is shown at ``fps / n`` frames per second; the
+    rate is only written when it changes, as ``animate`` keeps the last
+    rate in effect.
+    """
+    lines = [f"% animate timeline: {len(holds)} unique frames, "
+             f"{sum(count for _, count in holds)} at {fps} fps"]
+    current = None
+    for index, (_, count) in enumerate(holds, start=1):
+        rate = fps / count
+        rate_field = f"{rate:g}" if rate != current else ""
+        current = rate
+        lines.append(f":{rate_field}:{Path(frame_name(index, digits)).stem}")
+    Path(path).write_text("\n".join(lines) + "\n")
+
+
+def export_unique(source_dir, output_dir, fps, tolerance=0, workers=None):
+    """Copy each unique frame of ``source_dir`` once and write the timeline.
+
+    Returns ``(unique_frames, total_frames)``.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for stale in output_dir.glob("frame_*.png"):
+        stale.unlink()
+
+    holds = find_holds(sorted(Path(source_dir).glob("frame_*.png")), tolerance, workers)
+    digits = max(4, len(str(len(holds))))
+    for index, (path, _) in enumerate(holds, start=1):
+        shutil.copyfile(path, output_dir / frame_name(index, digits))
+    write_timeline(holds, output_dir / TIMELINE_NAME, fps, digits)
+    return len(holds), sum(count for _, count in holds)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Drop duplicate frames and write an animate timeline.",
+    )
+    parser.add_argument("source", help="frame directory (frame_0001.png …)")
+    parser.add_argument("output", help="directory for unique frames + timeline")
+    parser.add_argument("--fps", type=float, default=60)
+    parser.add_argument("--tolerance", type=int, default=0,
+                        help="max per-channel difference for near-identical frames")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    unique, total = export_unique(args.source, args.output, args.fps,
+                                  args.tolerance, args.workers)
+    print(f"{unique} unique frames out of {total} written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Overlap-free word layout around a keep-out disc.
+
+``auto_layout`` places boxes near their group's anchor. A uniform-grid
+spatial index keeps the overlap tests at about O(n). ``fit_layout`` picks
+one scale for every box. It starts from an area estimate: the total box
+area is compared with the free area of LAYOUT_BOUNDS, so hundreds of
+words do not pay for a dozen failed layouts first. The gap between boxes
+and the search step shrink with the boxes, so small words are packed by
+their own size and not by a fixed margin.
+
+Usage:
+    from render_pipeline.layout import fit_layout
+    scale, centers = fit_layout([[(1.8, 0.3)] * 200] * 6, anchors)
+"""
+
+import math
+
+import numpy as np
+
+KEEP_OUT_RADIUS = 2.7                   # logo + orbit rings
+LAYOUT_BOUNDS = (-7.0, -3.3, 7.0, 3.6)  # x0, y0, x1, y1 — clear of the prompt line
+LAYOUT_GAP = 0.12
+LAYOUT_STEP = 0.1
+LAYOUT_SEED = 7
+LAYOUT_PACKING = 0.55   # fraction of the free area the greedy search fills
+LAYOUT_RETRY = 0.9
+MIN_LAYOUT_SCALE = 0.1
+
+
+class SpatialGrid:
+    """Uniform-grid index of boxes ``(x0, y0, x1, y1)`` for overlap tests.
+
+    A query only looks at boxes in the cells it touches, so placing n
+    words costs about O(n) instead of O(n²).
+    """
+
+    def __init__(self, cell=0.5):
+        self.cell = cell
+        self.cells = {}
+
+    def _keys(self, box):
+        x0, y0, x1, y1 = (int(np.floor(v / self.cell)) for v in box)
+        return [(i, j) for i in range(x0, x1 + 1) for j in range(y0, y1 + 1)]
+
+    def overlaps(self, box):
+        for key in self._keys(box):
+            for other in self.cells.get(key, ()):
+                if box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]:
+                    return True
+        return False
+
+    def insert(self, box):
+        for key in self._keys(box):
+            self.cells.setdefault(key, []).append(box)
+
+
+def _candidate_offsets(seed, step):
+    """Lattice offsets nearest-first, x distance counted double so groups
+    grow into columns; seeded jitter breaks ties deterministically."""
+    x0, y0, x1, y1 = LAYOUT_BOUNDS
+    xs = np.arange(x0 - x1, x1 - x0 + step, step)
+    ys = np.arange(y0 - y1, y1 - y0 + step, step)
+    offsets = np.array(np.meshgrid(xs, ys)).reshape(2, -1).T
+    jitter = np.random.default_rng(seed).random(len(offsets)) * step
+    return offsets[np.argsort(np.hypot(2 * offsets[:, 0], offsets[:, 1]) + jitter)]
+
+
+def auto_layout(groups, anchors, occupied=(), seed=LAYOUT_SEED, gap=LAYOUT_GAP, step=LAYOUT_STEP):
+    """Place boxes near their group's anchor with no overlaps.
+
+    ``groups`` is a list of lists of ``(width, height)``, ``anchors`` one
+    ``(x, y)`` per group and ``occupied`` boxes already on screen. Boxes
+    stay inside LAYOUT_BOUNDS and off the KEEP_OUT_RADIUS disc. Groups take
+    turns so none crowds out its neighbours, and each group's search
+    resumes where its last one succeeded. Returns box centers shaped like
+    ``groups``; raises ValueError when a box does not fit.
+    """
+    offsets = _candidate_offsets(seed, step)
+    index = SpatialGrid(cell=max(0.5 * step / LAYOUT_STEP, 0.05))
+    for box in occupied:
+        index.insert(box)
+    x_min, y_min, x_max, y_max = LAYOUT_BOUNDS
+    centers = [[None] * len(sizes) for sizes in groups]
+    cursors = [0] * len(groups)
+
+    for slot in range(max(map(len, groups), default=0)):
+        for g, sizes in enumerate(groups):
+            if slot >= len(sizes):
+                continue
+            half_w, half_h = (sizes[slot][0] + gap) / 2, (sizes[slot][1] + gap) / 2
+            for k in range(cursors[g], len(offsets)):
+                cx, cy = anchors[g][0] + offsets[k, 0], anchors[g][1] + offsets[k, 1]
+                box = (cx - half_w, cy - half_h, cx + half_w, cy + half_h)
+                if box[0] < x_min or box[2] > x_max or box[1] < y_min or box[3] > y_max:
+                    continue
+                # Closest point of the box to the logo center
+                nx, ny = min(max(0.0, box[0]), box[2]), min(max(0.0, box[1]), box[3])
+                if nx * nx + ny * ny < KEEP_OUT_RADIUS ** 2 or index.overlaps(box):
+                    continue
+                index.insert(box)
+                centers[g][slot] = (cx, cy)
+                cursors[g] = k + 1
+                break
+            else:
+                raise ValueError(f"no room for box {slot} of group {g}")
+    return centers
+
+
+def estimate_scale(groups, occupied=()):
+    """Largest scale at which the boxes, grown by the scaled gap, could
+    cover LAYOUT_PACKING of the free area; never above 1."""
+    x0, y0, x1, y1 = LAYOUT_BOUNDS
+    free = (x1 - x0) * (y1 - y0) - math.pi * KEEP_OUT_RADIUS ** 2
+    free -= sum(
+        max(0.0, min(b[2], x1) - max(b[0], x0)) * max(0.0, min(b[3], y1) - max(b[1], y0))
+        for b in occupied
+    )
+    need = sum((w + LAYOUT_GAP) * (h + LAYOUT_GAP) for sizes in groups for w, h in sizes)
+    if need <= 0:
+        return 1.0
+    return min(1.0, math.sqrt(max(free, 0.0) * LAYOUT_PACKING / need))
+
+
+def fit_layout(groups, anchors, occupied=()):
+    """Auto-layout ``(width, height)`` groups at the largest scale that fits.
+
+    The search starts at estimate_scale() and shrinks by LAYOUT_RETRY per
+    failed attempt; gap and step scale with the boxes. Returns
+    ``(scale, centers)``; raises ValueError below MIN_LAYOUT_SCALE.
+    """
+    scale = estimate_scale(groups, occupied)
+    while scale >= MIN_LAYOUT_SCALE:
+        try:
+            centers = auto_layout(
+                [[(w * scale, h * scale) for w, h in sizes] for sizes in groups],
+                anchors, occupied, gap=LAYOUT_GAP * scale, step=LAYOUT_STEP * scale,
+            )
+            return scale, centers
+        except ValueError:
+            scale *= LAYOUT_RETRY
+    raise ValueError(f"layout does not fit even at scale {MIN_LAYOUT_SCALE}")
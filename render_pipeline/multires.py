@@ -0,0 +1,163 @@
+"""
+Render once, rasterize at several resolutions.
+
+``MultiResolutionRenderer`` runs scene construction, animation
+interpolation and updaters once per frame, then rasterizes the resulting
+mobject state with one Cairo camera per target size. The extra cameras
+draw on worker threads while the primary camera draws on the main one:
+they only read mobject state, and pycairo releases the GIL while it fills
+and strokes. Static mobjects of each play and the scene's static layer are
+pre-rendered per camera, the same as manim does for its own camera.
+Each target gets its own ``frame_0001.png …`` sequence, encoded by a
+``PngSequenceWriter``.
+
+Usage:
+    python -m render_pipeline.multires manim_scenes.py DataToVector \\
+        -t media/frames/data_to_vector_1080p:1920x1080 \\
+        -t frames/data_to_vector:1280x720
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from manim import Camera
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.iterables import list_update
+
+from .common import QUALITIES
+from .dual import DEFAULT_QUEUE_SIZE, PngSequenceWriter
+from .parallel import run_scene
+
+
+def parse_target(spec):
+    """``"dir:1280x720"`` -> ``("dir", (1280, 720))``."""
+    directory, _, size = spec.rpartition(":")
+    width, _, height = size.partition("x")
+    return directory, (int(width), int(height))
+
+
+class MultiResolutionRenderer(CairoRenderer):
+    """Cairo renderer writing one PNG sequence per ``(directory, (w, h))`` target.
+
+    The first target is drawn by the regular camera, so the scene must be
+    rendered with the config at that size; the others must share its
+    aspect ratio.
+    """
+
+    def __init__(self, targets, workers=None, queue_size=DEFAULT_QUEUE_SIZE, **kwargs):
+        super().__init__(**kwargs)
+        (_, (width, height)), *extras = targets
+        for _, (w, h) in extras:
+            if w * height != h * width:
+                raise ValueError(f"{w}x{h} does not match the aspect ratio of {width}x{height}")
+        self.targets = targets
+        self.workers = workers
+        self.queue_size = queue_size
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.extra_cameras = [Camera(pixel_width=w, pixel_height=h) for _, (w, h) in self.targets[1:]]
+        self.extra_frames = [None] * len(self.extra_cameras)
+        self.extra_static = [None] * len(self.extra_cameras)
+        self.writers = [PngSequenceWriter(directory, self.workers, self.queue_size)
+                        for directory, _ in self.targets]
+        self._pool = ThreadPoolExecutor(max_workers=max(len(self.extra_cameras), 1))
+        self._background_key = None
+
+    def _sync_backgrounds(self, scene):
+        # Follow the primary camera's background color and baked static layer.
+        key = (str(self.camera.background_color), getattr(self.camera, "static_layer_key", None))
+        if key == self._background_key:
+            return
+        self._background_key = key
+        layer = getattr(scene, "static_layer", [])
+        for camera in self.extra_cameras:
+            camera.background_color = self.camera.background_color
+            if layer:
+                camera.reset()
+                camera.capture_mobjects(layer)
+                camera.set_background(camera.pixel_array.copy())
+
+    def _capture(self, index, mobjects, include_submobjects):
+        camera = self.extra_cameras[index]
+        if self.extra_static[index] is not None:
+            camera.set_frame_to_background(self.extra_static[index])
+        else:
+            camera.reset()
+        camera.capture_mobjects(mobjects, include_submobjects=include_submobjects)
+        self.extra_frames[index] = np.array(camera.pixel_array)
+
+    def update_frame(self, scene, mobjects=None, include_submobjects=True,
+                     ignore_skipping=True, **kwargs):
+        if self.skip_animations and not ignore_skipping:
+            return
+        self._sync_backgrounds(scene)
+        if not mobjects:
+            mobjects = list_update(scene.mobjects, scene.foreground_mobjects)
+        futures = [
+            self._pool.submit(self._capture, index, mobjects, include_submobjects)
+            for index in range(len(self.extra_cameras))
+        ]
+        super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+        for future in futures:
+            future.result()
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.extra_static = [None] * len(self.extra_cameras)
+        image = super().save_static_frame_data(scene, static_mobjects)
+        if image is not None:
+            self.extra_static = list(self.extra_frames)
+        return image
+
+    def add_frame(self, frame, num_frames=1):
+        super().add_frame(frame, num_frames)
+        if self.skip_animations:
+            return
+        self.writers[0].write(frame, num_frames)
+        for writer, extra in zip(self.writers[1:], self.extra_frames):
+            writer.write(extra, num_frames)
+
+    def scene_finished(self, scene):
+        try:
+            super().scene_finished(scene)
+        finally:
+            self._pool.shutdown()
+            for writer in self.writers:
+                writer.close()
+
+
+def render_resolutions(scene_file, scene_name, targets, quality="high", workers=None):
+    """Render a scene once into every ``(directory, (w, h))`` target.
+
+    ``quality`` only sets the frame rate. Returns the frame count.
+    """
+    renderer = MultiResolutionRenderer(targets, workers)
+    width, height = targets[0][1]
+    run_scene(scene_file, scene_name, quality, renderer,
+              pixel_width=width, pixel_height=height)
+    return renderer.writers[0].count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render a scene once and rasterize it at several resolutions.",
+    )
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-t", "--target", action="append", required=True, type=parse_target,
+                        help="DIR:WIDTHxHEIGHT (repeatable; the first sets the main camera)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="high",
+                        help="preset whose frame rate is used")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="PNG encoder threads per target")
+    args = parser.parse_args(argv)
+
+    frames = render_resolutions(args.scene_file, args.scene_name, args.target,
+                                args.quality, args.workers)
+    for directory, (width, height) in args.target:
+        print(f"{frames} frames at {width}x{height} written to {directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+Parallel frame-range rendering.
+
+Splits a scene's timeline (its ``self.play``/``self.wait`` calls) into
+contiguous ranges, rasterizes each range on its own process and stitches
+the results into one ``frame_0001.png … frame_NNNN.png`` sequence.
+
+Every worker replays the whole scene but only rasterizes the plays it owns
+(the same mechanism as ``manim -n``), so mobject state at the start of each
+range is exactly what a serial render would see and the stitched sequence is
+byte-identical to ``--workers 1``.
+
+Usage:
+    python -m render_pipeline.parallel manim_scenes.py DataToVector \\
+        -o frames/data_to_vector -j 8
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.exceptions import EndSceneEarlyException
+from PIL import Image
+
+from .common import QUALITIES, frame_name, load_scene_class, render_config
+
+# Frames are written by FrameRangeRenderer, never by manim's movie writer.
+PIPELINE_CONFIG = {
+    "write_to_movie": False,
+    "save_last_frame": False,
+    "disable_caching": True,
+    "preview": False,
+}
+
+
+# ============================================================
+# RENDERER
+# ============================================================
+
+class FrameRangeRenderer(CairoRenderer):
+    """Cairo renderer that only rasterizes a selection of plays.
+
+    ``plays`` is an iterable of play indices to rasterize (``None`` for all
+    of them). Unselected plays are skipped: mobject state still advances but
+    no frames are produced, and the scene ends early after the last selected
+    play. Frames of play ``i`` are written to ``<frame_dir>/play_<i>/``
+    numbered from 1; with ``frame_dir=None`` nothing is written.
+    """
+
+    def __init__(self, plays=None, frame_dir=None, **kwargs):
+        super().__init__(**kwargs)
+        self.plays = None if plays is None else frozenset(plays)
+        self.stop = max(self.plays) + 1 if self.plays else None
+        self.frame_dir = Path(frame_dir) if frame_dir is not None else None
+        self.play_log = []
+        self.frame_counts = {}
+
+    def update_skipping_status(self):
+        super().update_skipping_status()
+        if self.stop is not None and self.num_plays >= self.stop:
+            raise EndSceneEarlyException()
+        if self.plays is not None and self.num_plays not in self.plays:
+            self.skip_animations = True
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        self.play_log.append((scene.duration, scene.is_current_animation_frozen_frame()))
+
+    def add_frame(self, frame, num_frames=1):
+        if self.skip_animations:
+            return
+        super().add_frame(frame, num_frames)
+        if self.frame_dir is None:
+            return
+
+        index = self.num_plays
+        play_dir = self.frame_dir / f"play_{index:04d}"
+        play_dir.mkdir(parents=True, exist_ok=True)
+        count = self.frame_counts.get(index, 0)
+
+        # Frozen frames (self.wait) arrive as one frame repeated num_frames
+        # times: encode it once and copy the bytes for the rest.
+        first = play_dir / frame_name(count + 1)
+        Image.fromarray(frame).save(first)
+        for offset in range(2, num_frames + 1):
+            shutil.copyfile(first, play_dir / frame_name(count + offset))
+        self.frame_counts[index] = count + num_frames
+
+
+# ============================================================
+# PLANNING & STITCHING
+# ============================================================
+
+def run_scene(scene_file, scene_name, quality, renderer, **config_overrides):
+    """Render ``scene_name`` with ``renderer`` under the pipeline config."""
+    scene_cls = load_scene_class(scene_file, scene_name)
+    return run_scene_class(scene_cls, quality, renderer, **config_overrides)
+
+
+def run_scene_class(scene_cls, quality, renderer, **config_overrides):
+    """``run_scene`` for a Scene class that is already loaded."""
+    options = render_config(quality, **PIPELINE_CONFIG)
+    options.update(config_overrides)
+    with tempconfig(options):
+        # CairoRenderer builds its camera from the config in effect when it is
+        # constructed, which is before the preset above applies.
+        renderer.camera = type(renderer.camera)()
+        scene = scene_cls(renderer=renderer)
+        scene.render()
+    return scene
+
+
+def probe_scene(scene_file, scene_name, quality="high"):
+    """Replay a scene without rasterizing any play; return the scene."""
+    return run_scene(scene_file, scene_name, quality, FrameRangeRenderer(plays=()))
+
+
+def play_costs(scene, frame_rate):
+    """Estimated rasterization cost (in frames) of each play of a probed scene."""
+    return [
+        1.0 if frozen else max(1.0, duration * frame_rate)
+        for duration, frozen in scene.renderer.play_log
+    ]
+
+
+def plan_ranges(costs, jobs):
+    """Split play indices into at most ``jobs`` contiguous, cost-balanced ranges."""
+    target = sum(costs) / max(jobs, 1)
+    ranges = []
+    start, acc = 0, 0.0
+    for index, cost in enumerate(costs):
+        acc += cost
+        if acc >= target and len(ranges) < jobs - 1 and index + 1 < len(costs):
+            ranges.append(range(start, index + 1))
+            start, acc = index + 1, 0.0
+    ranges.append(range(start, len(costs)))
+    return ranges
+
+
+def stitch_frames(play_frames, output_dir, digits=None, link=False):
+    """Move per-play frames into one contiguous sequence in ``output_dir``.
+
+    ``play_frames`` is an ordered list of ``(play_dir, count)`` pairs. Any
+    existing ``frame_*.png`` in ``output_dir`` is removed first. With
+    ``link=True`` the sources are kept and hard-linked (or copied, across
+    filesystems) instead of moved. Returns the number of frames written.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for stale in output_dir.glob("frame_*.png"):
+        stale.unlink()
+
+    total = sum(count for _, count in play_frames)
+    digits = digits or max(4, len(str(total)))
+    index = 0
+    for play_dir, count in play_frames:
+        for local in range(1, count + 1):
+            index += 1
+            source = Path(play_dir) / frame_name(local)
+            target = output_dir / frame_name(index, digits)
+            if not link:
+                os.replace(source, target)
+                continue
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copyfile(source, target)
+    return total
+
+
+def render_plays(scene_file, scene_name, quality, plays, frame_dir,
+                 renderer_class=FrameRangeRenderer):
+    renderer = renderer_class(plays=plays, frame_dir=frame_dir)
+    run_scene(scene_file, scene_name, quality, renderer)
+    return renderer.frame_counts
+
+
+# ============================================================
+# ENTRY POINTS
+# ============================================================
+
+def render_frames(scene_file, scene_name, output_dir, quality="high", workers=None,
+                  renderer_class=FrameRangeRenderer):
+    """Render a scene to a PNG sequence on ``workers`` processes.
+
+    ``renderer_class`` is a ``FrameRangeRenderer`` subclass, e.g.
+    ``dirty.DirtyRectRenderer``. Returns the number of frames written to
+    ``output_dir``.
+    """
+    from .texbatch import precompile_scene_tex  # texbatch builds on this module
+
+    # Typeset every Tex string once, before any process constructs the scene.
+    precompile_scene_tex(scene_file, scene_name, quality)
+    workers = workers or os.cpu_count() or 1
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".render_", dir=output_dir.parent))
+    try:
+        if workers == 1:
+            counts = render_plays(scene_file, scene_name, quality, None, staging,
+                                  renderer_class)
+        else:
+            scene = probe_scene(scene_file, scene_name, quality)
+            costs = play_costs(scene, QUALITIES[quality][2])
+            ranges = plan_ranges(costs, workers)
+            counts = {}
+            with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+                futures = [
+                    pool.submit(render_plays, scene_file, scene_name, quality, list(r), staging,
+                                renderer_class)
+                    for r in ranges
+                ]
+                for future in futures:
+                    counts.update(future.result())
+
+        play_frames = [
+            (staging / f"play_{index:04d}", counts[index]) for index in sorted(counts)
+        ]
+        return stitch_frames(play_frames, output_dir)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render a scene to a PNG frame sequence on a process pool.",
+    )
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-o", "--output", required=True, help="frame directory")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="high")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: all cores)")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only re-rasterize the regions that changed between frames")
+    args = parser.parse_args(argv)
+
+    renderer_class = FrameRangeRenderer
+    if args.dirty_rects:
+        from .dirty import DirtyRectRenderer  # dirty builds on this module
+
+        renderer_class = DirtyRectRenderer
+    total = render_frames(args.scene_file, args.scene_name, args.output,
+                          quality=args.quality, workers=args.workers,
+                          renderer_class=renderer_class)
+    print(f"{total} frames written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Fast low-resolution preview with a keyframe contact sheet.
+
+Renders a scene at 480x270 and 15 fps, without writing any PNG sequence
+and without the TeX batch pre-pass (cached Tex SVGs and ``CachedText``
+glyphs are reused, anything new is typeset on demand). Two artifacts come
+out of the single pass:
+
+* ``contact_sheet.png`` — the last frame of every ``self.play``, labelled
+  with its play index and beat, for checking layout at a glance;
+* ``proxy.mp4`` — a low-bitrate H.264 proxy for checking timing.
+
+Usage:
+    python -m render_pipeline.preview claude_words_scene.py ClaudeCodeWords
+    python -m render_pipeline.preview manim_scenes.py DataToVector --watch
+"""
+
+import argparse
+import math
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+from .parallel import FrameRangeRenderer, run_scene
+
+PREVIEW_WIDTH = 480
+PREVIEW_HEIGHT = 270
+PREVIEW_FPS = 15
+PROXY_CRF = 35
+LABEL_HEIGHT = 14
+
+
+# ============================================================
+# RENDERER
+# ============================================================
+
+class PreviewRenderer(FrameRangeRenderer):
+    """Renderer that keeps one keyframe per play and streams a proxy video.
+
+    ``proxy`` is a writable binary stream (an ffmpeg stdin) receiving raw
+    RGBA frames, or ``None``.
+    """
+
+    def __init__(self, proxy=None, **kwargs):
+        super().__init__(**kwargs)
+        self.proxy = proxy
+        self.keyframes = []
+        self._last_frame = None
+
+    def add_frame(self, frame, num_frames=1):
+        super().add_frame(frame, num_frames)
+        if self.skip_animations:
+            return
+        self._last_frame = frame
+        if self.proxy is not None:
+            data = frame.tobytes()
+            for _ in range(num_frames):
+                self.proxy.write(data)
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        # Waits only repeat the previous play's last frame.
+        _, frozen = self.play_log[-1]
+        if self._last_frame is not None and not frozen:
+            self.keyframes.append((self.num_plays - 1, self._last_frame))
+
+
+def _open_proxy(path, width, height, fps):
+    if shutil.which("ffmpeg") is None:
+        print("ffmpeg not found, skipping the proxy video", file=sys.stderr)
+        return None
+    return subprocess.Popen([
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(fps),
+        "-i", "-",
+        "-c:v", "libx264", "-preset", "ultrafast", "-crf", str(PROXY_CRF),
+        "-pix_fmt", "yuv420p", "-movflags", "+faststart", str(path),
+    ], stdin=subprocess.PIPE)
+
+
+# ============================================================
+# CONTACT SHEET
+# ============================================================
+
+def contact_sheet(keyframes, labels, columns=6, pad=4):
+    """Tile ``keyframes`` (RGBA arrays) into one labelled RGB image."""
+    height, width = keyframes[0].shape[:2]
+    rows = math.ceil(len(keyframes) / columns)
+    cell_height = LABEL_HEIGHT + height
+    sheet = Image.new("RGB", (pad + columns * (width + pad), pad + rows * (cell_height + pad)))
+    draw = ImageDraw.Draw(sheet)
+    for i, (frame, label) in enumerate(zip(keyframes, labels)):
+        x = pad + (i % columns) * (width + pad)
+        y = pad + (i // columns) * (cell_height + pad)
+        draw.text((x, y), label, fill=(200, 200, 200))
+        sheet.paste(Image.fromarray(frame).convert("RGB"), (x, y + LABEL_HEIGHT))
+    return sheet
+
+
+# ============================================================
+# ENTRY POINTS
+# ============================================================
+
+def render_preview(scene_file, scene_name, output_dir, columns=6, proxy=True):
+    """Render a preview; returns the list of files written."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    proxy_path = output_dir / "proxy.mp4"
+    encoder = _open_proxy(proxy_path, PREVIEW_WIDTH, PREVIEW_HEIGHT, PREVIEW_FPS) if proxy else None
+
+    renderer = PreviewRenderer(proxy=encoder.stdin if encoder else None)
+    try:
+        scene = run_scene(scene_file, scene_name, "low", renderer,
+                          pixel_width=PREVIEW_WIDTH, pixel_height=PREVIEW_HEIGHT,
+                          frame_rate=PREVIEW_FPS)
+    finally:
+        if encoder is not None:
+            encoder.stdin.close()
+            encoder.wait()
+
+    written = [proxy_path] if encoder is not None and encoder.returncode == 0 else []
+    if renderer.keyframes:
+        beats = getattr(scene, "beats", [])
+        labels = []
+        for index, _ in renderer.keyframes:
+            beat = ""
+            for name, first_play in beats:
+                if first_play <= index:
+                    beat = name
+            labels.append(f"{index} {beat}".strip())
+        sheet_path = output_dir / "contact_sheet.png"
+        contact_sheet([frame for _, frame in renderer.keyframes], labels, columns).save(sheet_path)
+        written.insert(0, sheet_path)
+    return written
+
+
+def watch(argv, scene_file, interval=0.5):
+    """Re-run the preview in a fresh interpreter whenever ``scene_file`` changes."""
+    last = None
+    while True:
+        mtime = Path(scene_file).stat().st_mtime
+        if mtime != last:
+            last = mtime
+            subprocess.run([sys.executable, "-m", "render_pipeline.preview", *argv])
+        time.sleep(interval)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(
+        description="Low-resolution preview: keyframe contact sheet and proxy video.",
+    )
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-o", "--output", default=None,
+                        help="output directory (default: media/preview/<Scene>)")
+    parser.add_argument("--columns", type=int, default=6)
+    parser.add_argument("--no-proxy", action="store_true", help="skip the proxy video")
+    parser.add_argument("--watch", action="store_true",
+                        help="re-render whenever the scene file is saved")
+    args = parser.parse_args(argv)
+
+    if args.watch:
+        watch([a for a in argv if a != "--watch"], args.scene_file)
+        return
+
+    start = time.perf_counter()
+    output = args.output or Path("media") / "preview" / args.scene_name
+    written = render_preview(args.scene_file, args.scene_name, output,
+                             args.columns, not args.no_proxy)
+    print(f"preview in {time.perf_counter() - start:.1f} s: "
+          + ", ".join(str(path) for path in written))
+
+
+if __name__ == "__main__":
+    main()
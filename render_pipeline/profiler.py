@@ -0,0 +1,274 @@
+"""
+Per-play render profiler.
+
+Renders a scene once with ``ProfilingRenderer``, which times every
+``self.play``/``self.wait`` call and splits its wall time into
+
+* rasterize   — Cairo drawing (``update_frame``/``get_frame``),
+* encode      — writing the frames out as PNG (``add_frame``),
+* interpolate — the rest of the play: animation setup, ``interpolate``
+  and updaters,
+
+next to its frame count, mobject count and the peak resident memory
+sampled while it ran (per frame, from ``/proc/self/statm``). The
+report can be sorted by any column and saved as JSON, and the per-frame
+phases can be written as a Chrome trace (open it in ui.perfetto.dev or
+chrome://tracing) for a flame-style timeline of beats, plays and frames.
+
+Usage:
+    python -m render_pipeline.profiler claude_words_scene.py ClaudeCodeWords \\
+        -q medium --sort rasterize --top 15 --json profile.json --trace trace.json
+"""
+
+import argparse
+import inspect
+import json
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from .common import QUALITIES
+from .parallel import FrameRangeRenderer, run_scene
+
+SORT_KEYS = ("index", "wall", "interpolate", "rasterize", "encode",
+             "frames", "mobjects", "peak_rss")
+
+
+def _peak_rss_mb():
+    """High-water mark of the process's RSS over its whole lifetime."""
+    # ru_maxrss is in KiB on Linux and in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _current_rss_mb():
+    """RSS right now; falls back to the lifetime peak where /proc is missing."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / 2**20
+    except OSError:
+        return _peak_rss_mb()
+
+
+def _call_site(scene):
+    """``file:line`` of the ``self.play``/``self.wait`` in the scene source."""
+    source = inspect.getsourcefile(type(scene))
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_code.co_filename == source:
+            return f"{Path(source).name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return ""
+
+
+def _label(animations):
+    counts = Counter(type(animation).__name__ for animation in animations)
+    return ", ".join(name if n == 1 else f"{name}×{n}" for name, n in counts.items())
+
+
+# ============================================================
+# RENDERER
+# ============================================================
+
+class ProfilingRenderer(FrameRangeRenderer):
+    """Frame renderer that records a timing breakdown of every play.
+
+    ``records`` holds one dict per play; ``events`` holds every
+    ``(phase, start, end)`` interval measured inside a play, on the
+    ``time.perf_counter`` clock starting at ``origin``.
+    """
+
+    def __init__(self, frame_dir=None, **kwargs):
+        super().__init__(frame_dir=frame_dir, **kwargs)
+        self.records = []
+        self.events = []
+        self.origin = time.perf_counter()
+        self._phases = None
+        self._play_rss = 0.0
+
+    def _sample_rss(self):
+        self._play_rss = max(self._play_rss, _current_rss_mb())
+
+    def _timed(self, phase, call, *args, **kwargs):
+        if self._phases is None:
+            return call(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return call(*args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            self._phases[phase] += end - start
+            self.events.append((phase, start - self.origin, end - self.origin))
+
+    def update_frame(self, *args, **kwargs):
+        return self._timed("rasterize", super().update_frame, *args, **kwargs)
+
+    def get_frame(self):
+        return self._timed("rasterize", super().get_frame)
+
+    def add_frame(self, frame, num_frames=1):
+        if self._phases is not None and not self.skip_animations:
+            self._phases["frames"] += num_frames
+            self._sample_rss()
+        return self._timed("encode", super().add_frame, frame, num_frames)
+
+    def play(self, scene, *args, **kwargs):
+        index = self.num_plays
+        line = _call_site(scene)
+        self._phases = {"rasterize": 0.0, "encode": 0.0, "frames": 0}
+        self._play_rss = 0.0
+        self._sample_rss()
+        start = time.perf_counter()
+        try:
+            super().play(scene, *args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            self._sample_rss()
+            phases, self._phases = self._phases, None
+
+        beat = ""
+        for name, first_play in getattr(scene, "beats", []):
+            if first_play <= index:
+                beat = name
+        wall = end - start
+        self.records.append({
+            "index": index,
+            "beat": beat,
+            "line": line,
+            "animations": _label(scene.animations or []),
+            "duration": scene.duration,
+            "frames": phases["frames"],
+            "mobjects": len(scene.get_mobject_family_members()),
+            "moving": sum(len(mob.get_family()) for mob in scene.moving_mobjects),
+            "wall": wall,
+            "interpolate": wall - phases["rasterize"] - phases["encode"],
+            "rasterize": phases["rasterize"],
+            "encode": phases["encode"],
+            "peak_rss": self._play_rss,
+            "start": start - self.origin,
+            "end": end - self.origin,
+        })
+
+
+# ============================================================
+# REPORTS
+# ============================================================
+
+def summarize(records, total_wall):
+    plays_wall = sum(r["wall"] for r in records)
+    return {
+        "plays": len(records),
+        "frames": sum(r["frames"] for r in records),
+        "wall": total_wall,
+        "outside_plays": total_wall - plays_wall,
+        "interpolate": sum(r["interpolate"] for r in records),
+        "rasterize": sum(r["rasterize"] for r in records),
+        "encode": sum(r["encode"] for r in records),
+        "peak_rss": _peak_rss_mb(),
+    }
+
+
+def format_report(records, totals, sort="wall", top=None):
+    """Plain-text table of ``records``, largest ``sort`` value first."""
+    rows = sorted(records, key=lambda r: r[sort], reverse=sort != "index")[:top]
+    wall = totals["wall"] or 1.0
+    lines = [
+        f"{'#':>4} {'wall s':>7} {'%':>5} {'interp':>7} {'raster':>7} {'encode':>7} "
+        f"{'frames':>6} {'mobj':>5} {'move':>5} {'rss MB':>7}  {'beat':<18} {'line':<22} animations",
+    ]
+    for r in rows:
+        lines.append(
+            f"{r['index']:>4} {r['wall']:>7.3f} {100 * r['wall'] / wall:>5.1f} "
+            f"{r['interpolate']:>7.3f} {r['rasterize']:>7.3f} {r['encode']:>7.3f} "
+            f"{r['frames']:>6} {r['mobjects']:>5} {r['moving']:>5} {r['peak_rss']:>7.0f}  "
+            f"{r['beat'][:18]:<18} {r['line']:<22} {r['animations']}"
+        )
+    lines.append(
+        f"total {totals['wall']:.2f} s for {totals['frames']} frames in {totals['plays']} plays: "
+        f"interpolate {totals['interpolate']:.2f} s, rasterize {totals['rasterize']:.2f} s, "
+        f"encode {totals['encode']:.2f} s, outside plays {totals['outside_plays']:.2f} s; "
+        f"process peak RSS {totals['peak_rss']:.0f} MB"
+    )
+    return "\n".join(lines)
+
+
+def write_trace(records, events, path):
+    """Write beats, plays and frame phases as Chrome trace ``X`` events."""
+    def event(name, start, end, **args):
+        return {"name": name, "ph": "X", "pid": 1, "tid": 1,
+                "ts": start * 1e6, "dur": (end - start) * 1e6, "args": args}
+
+    trace = []
+    beats = {}
+    for r in records:
+        if r["beat"]:
+            first, _ = beats.get(r["beat"], (r["start"], None))
+            beats[r["beat"]] = (first, r["end"])
+        trace.append(event(r["animations"] or f"play {r['index']}", r["start"], r["end"],
+                           index=r["index"], line=r["line"], frames=r["frames"]))
+    trace.extend(event(name, start, end) for name, (start, end) in beats.items())
+    trace.extend(event(phase, start, end) for phase, start, end in events)
+    Path(path).write_text(json.dumps({"traceEvents": trace, "displayTimeUnit": "ms"}))
+
+
+# ============================================================
+# ENTRY POINTS
+# ============================================================
+
+def profile_scene(scene_file, scene_name, quality="high", frame_dir=None):
+    """Render a scene with profiling; returns ``(renderer, totals)``.
+
+    Frames are encoded into ``frame_dir`` (a temporary directory, removed
+    afterwards, when ``None``) so the encode phase measures real work.
+    """
+    staging = Path(frame_dir or tempfile.mkdtemp(prefix="profile_"))
+    renderer = ProfilingRenderer(frame_dir=staging)
+    try:
+        start = time.perf_counter()
+        run_scene(scene_file, scene_name, quality, renderer)
+        total_wall = time.perf_counter() - start
+    finally:
+        if frame_dir is None:
+            shutil.rmtree(staging, ignore_errors=True)
+    return renderer, summarize(renderer.records, total_wall)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Profile every play of a scene: frames, mobjects, time split, memory.",
+    )
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="high")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="wall")
+    parser.add_argument("--top", type=int, default=None, help="only show the top N plays")
+    parser.add_argument("--json", default=None, help="write the full report as JSON")
+    parser.add_argument("--trace", default=None, help="write a Chrome trace timeline")
+    parser.add_argument("--frames", default=None,
+                        help="keep the rendered per-play frames in this directory")
+    args = parser.parse_args(argv)
+
+    renderer, totals = profile_scene(args.scene_file, args.scene_name,
+                                     args.quality, args.frames)
+    print(format_report(renderer.records, totals, args.sort, args.top))
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            "scene": args.scene_name,
+            "quality": args.quality,
+            "totals": totals,
+            "plays": renderer.records,
+        }, indent=1))
+    if args.trace:
+        write_trace(renderer.records, renderer.events, args.trace)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Palette-quantized PNG encoding for Blueprint Noir frames.
+
+The scenes draw with a handful of theme colors over a dark background, so
+almost every pixel is a theme color, the background, or an antialiasing
+blend between the two. Frames are mapped onto an indexed palette built from
+those ramps, topped up per frame with its most frequent colors that the
+ramps miss. A frame is only written indexed when every pixel lands within
+``max_error`` (CIE76 ΔE) of its palette entry; otherwise it is kept
+truecolor, so quantization never introduces visible banding.
+
+Usage:
+    python -m render_pipeline.quantize frames/data_to_vector \\
+        --scene manim_scenes.py -j 8
+"""
+
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from .common import module_constants
+
+PALETTE_SIZE = 256
+RAMP_STEPS = 16
+DEFAULT_MAX_ERROR = 2.3   # ΔE76 just-noticeable difference
+
+_RGB_TO_XYZ = np.array([
+    [0.4124, 0.3576, 0.1805],
+    [0.2126, 0.7152, 0.0722],
+    [0.0193, 0.1192, 0.9505],
+])
+_D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+
+
+# ============================================================
+# COLOR SPACE
+# ============================================================
+
+def hex_to_rgb(color):
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def rgb_to_lab(rgb):
+    """Convert ``(..., 3)`` sRGB values in 0–255 to CIELAB."""
+    c = np.asarray(rgb, dtype=np.float64) / 255.0
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ _RGB_TO_XYZ.T / _D65_WHITE
+    delta = 6 / 29
+    f = np.where(xyz > delta ** 3, np.cbrt(xyz), xyz / (3 * delta ** 2) + 4 / 29)
+    return np.stack([
+        116 * f[..., 1] - 16,
+        500 * (f[..., 0] - f[..., 1]),
+        200 * (f[..., 1] - f[..., 2]),
+    ], axis=-1)
+
+
+def _nearest(lab, palette_lab, chunk=4096):
+    """Index of and ΔE to the nearest palette entry for each color."""
+    index = np.empty(len(lab), dtype=np.intp)
+    error = np.empty(len(lab))
+    for start in range(0, len(lab), chunk):
+        block = lab[start:start + chunk]
+        d2 = ((block[:, None, :] - palette_lab[None, :, :]) ** 2).sum(axis=-1)
+        index[start:start + chunk] = d2.argmin(axis=1)
+        error[start:start + chunk] = np.sqrt(d2.min(axis=1))
+    return index, error
+
+
+# ============================================================
+# PALETTE
+# ============================================================
+
+def theme_palette(colors, background, steps=RAMP_STEPS):
+    """Antialiasing ramps from ``background`` to each theme color.
+
+    Cairo blends in sRGB, so the ramps interpolate sRGB values directly.
+    Returns a ``(n, 3)`` uint8 array of unique colors.
+    """
+    bg = np.array(hex_to_rgb(background), dtype=np.float64)
+    t = np.linspace(0.0, 1.0, steps)[:, None]
+    ramps = [bg[None, :]]
+    for color in colors:
+        ramps.append(bg + t * (np.array(hex_to_rgb(color)) - bg))
+    ramps.append(bg + t * (255.0 - bg))   # plain white text and highlights
+    palette = np.unique(np.rint(np.vstack(ramps)).astype(np.uint8), axis=0)
+    return palette[:PALETTE_SIZE]
+
+
+def scene_palette(scene_file, steps=RAMP_STEPS):
+    """Theme palette from the ``#RRGGBB`` constants of a scene module."""
+    constants = module_constants(scene_file)
+    colors = [value for value in constants.values()
+              if isinstance(value, str) and value.startswith("#") and len(value) == 7]
+    background = constants.get("BG_COLOR", colors[0] if colors else "#000000")
+    return theme_palette(colors, background, steps)
+
+
+# ============================================================
+# ENCODING
+# ============================================================
+
+def quantize_frame(pixels, palette, max_error=DEFAULT_MAX_ERROR):
+    """Map an RGB(A) frame onto ``palette`` plus adaptive entries.
+
+    Returns a mode ``P`` image, or ``None`` when the frame has transparency
+    or cannot be represented within ``max_error``.
+    """
+    if pixels.shape[-1] == 4:
+        if (pixels[..., 3] != 255).any():
+            return None
+        pixels = pixels[..., :3]
+
+    packed = (pixels[..., 0].astype(np.uint32) << 16
+              | pixels[..., 1].astype(np.uint32) << 8
+              | pixels[..., 2])
+    colors, inverse, counts = np.unique(packed.ravel(), return_inverse=True,
+                                        return_counts=True)
+    rgb = np.stack([(colors >> 16) & 255, (colors >> 8) & 255, colors & 255], axis=-1)
+    lab = rgb_to_lab(rgb)
+
+    entries = list(palette)
+    index, error = _nearest(lab, rgb_to_lab(palette))
+
+    # Top up the palette with the most frequent colors the ramps miss.
+    while True:
+        misses = np.flatnonzero(error > max_error)
+        if not len(misses):
+            break
+        if len(entries) >= PALETTE_SIZE:
+            return None
+        worst = misses[counts[misses].argmax()]
+        entries.append(rgb[worst].astype(np.uint8))
+        d = np.sqrt(((lab[misses] - lab[worst]) ** 2).sum(axis=-1))
+        closer = d < error[misses]
+        index[misses[closer]] = len(entries) - 1
+        error[misses[closer]] = d[closer]
+
+    # putpalette turns the mode "L" index image into mode "P".
+    image = Image.fromarray(index[inverse].reshape(pixels.shape[:2]).astype(np.uint8))
+    image.putpalette(np.asarray(entries, dtype=np.uint8).ravel().tolist())
+    return image
+
+
+def encode_frame(source, target, palette, max_error=DEFAULT_MAX_ERROR):
+    """Re-encode one PNG; returns True when it was written indexed."""
+    with Image.open(source) as image:
+        pixels = np.asarray(image.convert("RGBA"))
+    quantized = quantize_frame(pixels, palette, max_error)
+    output = quantized if quantized is not None else Image.fromarray(pixels)
+
+    # Write next to the target and swap in, so in-place runs are atomic.
+    target = Path(target)
+    partial = target.with_name(f".{target.name}.partial")
+    output.save(partial, format="PNG", optimize=True)
+    os.replace(partial, target)
+    return quantized is not None
+
+
+def quantize_directory(source_dir, palette, output_dir=None,
+                       max_error=DEFAULT_MAX_ERROR, workers=None):
+    """Quantize every ``frame_*.png`` of ``source_dir`` on a thread pool.
+
+    Writes in place unless ``output_dir`` is given. Returns
+    ``(indexed_frames, total_frames)``.
+    """
+    source_dir = Path(source_dir)
+    output_dir = Path(output_dir) if output_dir is not None else source_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+    frames = sorted(source_dir.glob("frame_*.png"))
+
+    # Pillow's decoder/zlib and numpy release the GIL, so threads scale.
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        indexed = list(pool.map(
+            lambda path: encode_frame(path, output_dir / path.name, palette, max_error),
+            frames,
+        ))
+    return sum(indexed), len(frames)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Re-encode a frame directory as palette-indexed PNGs.",
+    )
+    parser.add_argument("frames", help="frame directory (frame_0001.png …)")
+    parser.add_argument("--scene", required=True,
+                        help="scene module whose #RRGGBB constants seed the palette")
+    parser.add_argument("-o", "--output", default=None,
+                        help="output directory (default: rewrite in place)")
+    parser.add_argument("--max-error", type=float, default=DEFAULT_MAX_ERROR,
+                        help="largest allowed ΔE76 per pixel")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    before = sum(p.stat().st_size for p in Path(args.frames).glob("frame_*.png"))
+    indexed, total = quantize_directory(args.frames, scene_palette(args.scene),
+                                        args.output, args.max_error, args.workers)
+    after = sum(p.stat().st_size
+                for p in Path(args.output or args.frames).glob("frame_*.png"))
+    print(f"{indexed}/{total} frames indexed, "
+          f"{before / 2**20:.1f} MiB -> {after / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Scene base class for the render pipeline.
+
+Scenes that derive from ``PipelineScene`` still render normally with the
+manim CLI; the extra hooks only matter to the pipeline tools.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+from manim import Camera, Scene, config
+from manim.constants import RendererType
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.hashing import get_hash_from_play_call
+
+from .segments import SegmentCacheWriter
+
+# Baked static layers, keyed on resolution, background and layer content.
+_STATIC_LAYERS = OrderedDict()
+_MAX_STATIC_LAYERS = 8
+
+
+def layer_fingerprint(mobjects):
+    """Hash of the geometry and style of ``mobjects`` and their families."""
+    digest = hashlib.sha1()
+    for mobject in mobjects:
+        for member in mobject.get_family():
+            digest.update(np.ascontiguousarray(member.points).tobytes())
+            for attr in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+                value = getattr(member, attr, None)
+                if value is not None:
+                    digest.update(np.ascontiguousarray(value).tobytes())
+            digest.update(repr(getattr(member, "stroke_width", None)).encode())
+    return digest.hexdigest()
+
+
+class PipelineScene(Scene):
+    """Scene with beat markers, a cached static background layer and a
+    managed partial-movie cache."""
+
+    def __init__(self, renderer=None, camera_class=Camera, skip_animations=False, **kwargs):
+        # Plain ``manim`` CLI renders get the indexed, size-bounded segment
+        # cache; pipeline tools pass their own renderer.
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = CairoRenderer(
+                file_writer_class=SegmentCacheWriter,
+                camera_class=camera_class,
+                skip_animations=skip_animations,
+            )
+        super().__init__(renderer=renderer, camera_class=camera_class,
+                         skip_animations=skip_animations, **kwargs)
+        self.beats = []
+        self.play_hashes = []
+        self.static_layer = []
+
+    def next_beat(self, name):
+        """Start a new beat; following plays belong to it until the next call."""
+        self.beats.append((name, self.renderer.num_plays))
+
+    # ── Static layer ──
+
+    def add_static_layer(self, *mobjects):
+        """Rasterize ``mobjects`` once into the camera background.
+
+        They are taken out of ``self.mobjects``, so Cairo no longer redraws
+        them for every play (or every frame, when something below them
+        moves). They come back as ordinary mobjects, at the bottom of the
+        stack, when an animation touches them or on
+        ``release_static_layer()``.
+        """
+        self.remove(*mobjects)
+        self.static_layer.extend(mobjects)
+        self._bake_static_layer()
+
+    def release_static_layer(self, *mobjects):
+        """Return ``mobjects`` (default: the whole layer) to the scene."""
+        released = [mob for mob in self.static_layer if not mobjects or mob in mobjects]
+        if not released:
+            return
+        self.static_layer = [mob for mob in self.static_layer if mob not in released]
+        self.add_to_back(*released)
+        self._bake_static_layer()
+
+    def _bake_static_layer(self):
+        camera = self.camera
+        camera.init_background()
+        if not self.static_layer:
+            camera.static_layer_key = None
+            return
+
+        # The key is a plain camera attribute so manim's play-call hash (and
+        # the beat cache built on it) sees changes to the layer.
+        fingerprint = layer_fingerprint(self.static_layer)
+        key = (camera.pixel_width, camera.pixel_height, str(camera.background_color), fingerprint)
+        background = _STATIC_LAYERS.get(key)
+        if background is None:
+            camera.reset()
+            camera.capture_mobjects(self.static_layer)
+            background = camera.pixel_array.copy()
+            _STATIC_LAYERS[key] = background
+            while len(_STATIC_LAYERS) > _MAX_STATIC_LAYERS:
+                _STATIC_LAYERS.popitem(last=False)
+        _STATIC_LAYERS.move_to_end(key)
+        camera.set_background(background)
+        camera.static_layer_key = fingerprint
+
+    # ── Play hooks ──
+
+    def compile_animation_data(self, *args, **kwargs):
+        result = super().compile_animation_data(*args, **kwargs)
+
+        # Animating a static-layer mobject added it back on top of the
+        # stack; move it to the bottom and drop it from the baked layer.
+        # super() already split moving from static mobjects in the old
+        # order and against the old background, so split again.
+        touched = [mob for mob in self.static_layer if mob in self.mobjects]
+        if touched:
+            self.remove(*touched)
+            self.release_static_layer(*touched)
+            split = self.get_moving_and_static_mobjects(self.animations)
+            self.moving_mobjects, self.static_mobjects = split
+            self.renderer.save_static_frame_data(self, self.static_mobjects)
+
+        # Only the beat cache asks for hashes: they cost a JSON dump of
+        # every mobject on screen.
+        if getattr(self.renderer, "record_play_hashes", False):
+            self.play_hashes.append(get_hash_from_play_call(
+                self, self.renderer.camera, self.animations, self.mobjects,
+            ))
+        return result
@@ -0,0 +1,205 @@
+"""
+Managed cache of manim's partial-movie segments.
+
+manim writes one ``<play hash>.mp4`` per ``self.play`` under
+``media/videos/<file>/<quality>/partial_movie_files/<Scene>`` and only ever
+trims that directory by file count, ordered by access time (which
+``noatime`` mounts never update). ``SegmentCacheWriter`` keeps a
+``segment_index.json`` next to the segments recording each one's size,
+use count and last use. It evicts least recently used segments until the
+directory is under ``max_bytes`` (and manim's ``max_files_cached``),
+never touching the segments of the render that just finished. When
+caching is on (segments named by play hash) it also skips the final
+concatenation entirely when the ordered segment list matches the one the
+existing movie was built from. The skip is all or nothing: when any
+segment changed, manim's concatenation stream-copies every segment into
+a new movie again, untouched ones included. Only the changed plays are
+re-rendered.
+
+``PipelineScene`` installs the writer for ordinary ``manim`` CLI renders.
+
+Usage:
+    python -m render_pipeline.segments stats media/videos
+    python -m render_pipeline.segments gc media/videos --max-mb 512
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from manim import config, logger
+from manim.scene.scene_file_writer import SceneFileWriter
+
+INDEX_NAME = "segment_index.json"
+DEFAULT_MAX_BYTES = 2**30
+SEGMENT_SUFFIXES = (".mp4", ".mov", ".webm")
+
+
+# ============================================================
+# INDEX & EVICTION
+# ============================================================
+
+def load_index(directory):
+    try:
+        return json.loads((Path(directory) / INDEX_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_index(directory, index):
+    fd, partial = tempfile.mkstemp(suffix=".partial", dir=directory)
+    with os.fdopen(fd, "w") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(partial, Path(directory) / INDEX_NAME)
+
+
+def collect_segments(directory, max_bytes=DEFAULT_MAX_BYTES, max_files=None,
+                     used=(), extension=".mp4"):
+    """Sync the index of ``directory`` and evict least recently used segments.
+
+    ``used`` names the segments of the current render: they are marked as
+    used now and are never evicted. Returns ``(kept_bytes, evicted_count)``.
+    """
+    directory = Path(directory)
+    index = load_index(directory)
+    used = {Path(name).name for name in used}
+    now = time.time()
+
+    entries = {}
+    for path in directory.glob(f"*{extension}"):
+        stat = path.stat()
+        entry = index.get(path.name, {"last_used": stat.st_mtime, "uses": 0})
+        entry["size"] = stat.st_size
+        if path.name in used:
+            entry["last_used"] = now
+            entry["uses"] += 1
+        entries[path.name] = entry
+
+    total = sum(entry["size"] for entry in entries.values())
+    evicted = 0
+    for name, entry in sorted(entries.items(), key=lambda item: item[1]["last_used"]):
+        over_count = max_files is not None and len(entries) > max_files
+        if total <= max_bytes and not over_count:
+            break
+        if name in used:
+            continue
+        (directory / name).unlink(missing_ok=True)
+        total -= entry["size"]
+        del entries[name]
+        evicted += 1
+
+    save_index(directory, entries)
+    return total, evicted
+
+
+def segment_list_key(segments):
+    """Fingerprint of an ordered segment list, as concatenated into a movie.
+
+    Covers each segment's name, size and modification time, so a segment
+    rewritten under the same name changes the key.
+    """
+    digest = hashlib.sha256()
+    for segment in segments:
+        path = Path(segment)
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _named_by_hash(segments):
+    # With caching disabled manim names segments uncached_00000, … on every run.
+    return not config.disable_caching and not any(
+        Path(segment).name.startswith("uncached_") for segment in segments
+    )
+
+
+# ============================================================
+# FILE WRITER
+# ============================================================
+
+class SegmentCacheWriter(SceneFileWriter):
+    """``SceneFileWriter`` with an indexed, size-bounded segment cache."""
+
+    max_bytes = DEFAULT_MAX_BYTES
+
+    def combine_to_movie(self):
+        segments = [path for path in self.partial_movie_files if path is not None]
+        movie = Path(self.gif_file_path if config.format == "gif" else self.movie_file_path)
+        stamp = movie.with_name(f".{movie.name}.segments")
+        if not segments:
+            return super().combine_to_movie()
+
+        # Segments named by play hash: an unchanged ordered list means the
+        # existing movie is exactly what concatenation would produce. Any
+        # change re-joins the whole list (stream copy, no re-encode).
+        if not _named_by_hash(segments):
+            stamp.unlink(missing_ok=True)
+            return super().combine_to_movie()
+        key = segment_list_key(segments)
+        if (not self.includes_sound and movie.exists() and stamp.exists()
+                and stamp.read_text() == key):
+            logger.info("Segments unchanged, keeping %s", movie)
+            self.print_file_ready_message(movie)
+            return
+
+        stamp.unlink(missing_ok=True)
+        super().combine_to_movie()
+        if movie.exists() and not self.includes_sound:
+            stamp.write_text(key)
+
+    def clean_cache(self):
+        _, evicted = collect_segments(
+            self.partial_movie_directory,
+            max_bytes=self.max_bytes,
+            max_files=config["max_files_cached"],
+            used=[path for path in self.partial_movie_files if path is not None],
+            extension=config["movie_file_extension"],
+        )
+        if evicted:
+            logger.info("Evicted %d cached partial movie file(s)", evicted)
+
+
+# ============================================================
+# COMMAND LINE
+# ============================================================
+
+def _segment_dirs(root):
+    """Segment directories under ``root``, mapped to their movie extension."""
+    found = {}
+    for path in sorted(Path(root).rglob("*")):
+        if path.suffix in SEGMENT_SUFFIXES and path.parent.parent.name == "partial_movie_files":
+            found.setdefault(path.parent, path.suffix)
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Inspect or trim manim's partial-movie segment caches.",
+    )
+    parser.add_argument("command", choices=("stats", "gc"))
+    parser.add_argument("root", nargs="?", default="media/videos",
+                        help="a segment directory or any directory above them")
+    parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_BYTES / 2**20,
+                        help="size cap per scene for gc (default: 1024)")
+    args = parser.parse_args(argv)
+
+    for directory, extension in _segment_dirs(args.root).items():
+        if args.command == "gc":
+            total, evicted = collect_segments(directory, args.max_mb * 2**20,
+                                              extension=extension)
+            print(f"{directory}: {total / 2**20:.1f} MiB kept, {evicted} evicted")
+            continue
+        index = load_index(directory)
+        segments = list(directory.glob(f"*{extension}"))
+        size = sum(path.stat().st_size for path in segments)
+        uses = sum(entry.get("uses", 0) for entry in index.values())
+        print(f"{directory}: {len(segments)} segments, {size / 2**20:.1f} MiB, "
+              f"{len(index)} indexed, {uses} uses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Batched LaTeX compilation for Tex/MathTex mobjects.
+
+manim compiles every Tex/MathTex string with its own ``latex`` + ``dvisvgm``
+run, and on a cold ``media/Tex`` cache process startup dominates. This
+pre-pass replays the scene with a placeholder SVG to collect every TeX
+string it will request, typesets all missing ones as pages of a single
+document and splits the pages into manim's per-hash ``media/Tex/<hash>.svg``
+cache entries. Scene construction then finds every SVG already cached.
+
+Usage:
+    python -m render_pipeline.texbatch manim_scenes.py DataToVector
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import config
+from manim.utils.tex_file_writing import generate_tex_file
+
+from .common import QUALITIES
+from .parallel import FrameRangeRenderer, run_scene
+
+STANDALONE_PREVIEW = r"\documentclass[preview]{standalone}"
+
+# standalone's preview option is the preview package in active, tightpage
+# mode on top of article; spelling it out lets each preview be its own page.
+BATCH_HEADER = "\\documentclass{article}\n\\usepackage[active,tightpage]{preview}\n"
+
+PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="10pt" height="10pt" '
+    'viewBox="0 0 10 10"><path d="M0 0h10v10H0z"/></svg>\n'
+)
+
+_DOCUMENT_BODY = re.compile(r"\\begin\{document\}(.*)\\end\{document\}", re.S)
+
+
+# ============================================================
+# COLLECTION
+# ============================================================
+
+def _collect(scene_file, scene_name, quality):
+    """Replay the scene, answering every Tex request with a placeholder SVG."""
+    from manim.mobject.text import tex_mobject
+
+    default_body = config.tex_template.body
+    placeholder = Path(tempfile.mkdtemp(prefix="texbatch_")) / "placeholder.svg"
+    placeholder.write_text(PLACEHOLDER_SVG)
+    requests = []
+
+    def record(expression, environment=None, tex_template=None):
+        # Custom templates are left to manim's own per-string compilation.
+        if tex_template is None or tex_template.body == default_body:
+            requests.append((expression, environment))
+        return placeholder
+
+    tex_mobject.tex_to_svg_file = record
+    complete = True
+    try:
+        run_scene(scene_file, scene_name, quality, FrameRangeRenderer(plays=()))
+    except Exception:
+        # Placeholder geometry can trip scene code that inspects Tex parts;
+        # whatever was collected up to that point is still worth batching.
+        complete = False
+    return list(dict.fromkeys(requests)), complete
+
+
+def collect_tex(scene_file, scene_name, quality="high"):
+    """Every ``(expression, environment)`` pair a scene asks manim to typeset.
+
+    Returns ``(requests, complete)``; ``complete`` is False when the replay
+    stopped early. Runs in a child process so the patched
+    ``tex_to_svg_file`` and the placeholder mobjects never leak into the
+    caller.
+    """
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(_collect, scene_file, scene_name, quality).result()
+
+
+# ============================================================
+# COMPILATION
+# ============================================================
+
+def _compile_command(tex_template, tex_file):
+    compiler = tex_template.tex_compiler
+    command = [compiler, "-interaction=batchmode", "-halt-on-error",
+               f"-output-directory={tex_file.parent}"]
+    if compiler == "xelatex":
+        command.append("-no-pdf")
+    else:
+        command.append(f"-output-format={tex_template.output_format[1:]}")
+    return command + [str(tex_file)]
+
+
+def compile_batch(requests, tex_template=None):
+    """Typeset all uncached ``(expression, environment)`` pairs in one run.
+
+    Returns the number of SVG cache entries written. Templates other than
+    manim's standalone preview default, and batches that fail to compile,
+    are left alone; manim then compiles those strings one by one as usual
+    and reports any LaTeX error itself.
+    """
+    tex_template = tex_template or config.tex_template
+    if tex_template.documentclass.strip() != STANDALONE_PREVIEW:
+        return 0
+
+    pending = []
+    for expression, environment in requests:
+        tex_file = Path(generate_tex_file(expression, environment, tex_template))
+        if not tex_file.with_suffix(".svg").exists():
+            pending.append(tex_file)
+    if not pending:
+        return 0
+
+    pages = [
+        "\\begin{preview}" + _DOCUMENT_BODY.search(f.read_text()).group(1) + "\\end{preview}"
+        for f in pending
+    ]
+    source = (BATCH_HEADER + tex_template.preamble + "\n\\begin{document}\n"
+              + "\n".join(pages) + "\n\\end{document}\n")
+    stem = "batch_" + hashlib.sha256(source.encode()).hexdigest()[:16]
+    tex_dir = pending[0].parent
+    batch_file = tex_dir / f"{stem}.tex"
+    batch_file.write_text(source)
+
+    try:
+        subprocess.run(_compile_command(tex_template, batch_file), check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        dvi_file = batch_file.with_suffix(tex_template.output_format)
+        command = ["dvisvgm", "-p", "1-", "-n", "-v", "0",
+                   "-o", str(tex_dir / f"{stem}-%p.svg"), str(dvi_file)]
+        if tex_template.output_format == ".pdf":
+            command.insert(1, "--pdf")
+        subprocess.run(command, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return 0
+    finally:
+        for leftover in tex_dir.glob(f"{stem}.*"):
+            leftover.unlink()
+
+    written = 0
+    for page_file in tex_dir.glob(f"{stem}-*.svg"):
+        page = int(page_file.stem.rsplit("-", 1)[1])
+        page_file.replace(pending[page - 1].with_suffix(".svg"))
+        written += 1
+    return written
+
+
+def precompile_scene_tex(scene_file, scene_name, quality="high"):
+    """Batch-compile a scene's TeX strings before it is constructed.
+
+    The collected strings are remembered per scene source in
+    ``media/Tex/<Scene>.batch.json``, so a warm cache with an unchanged
+    scene file costs one hash and a few ``stat`` calls.
+    """
+    tex_template = config.tex_template
+    tex_dir = Path(config.get_dir("tex_dir"))
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    manifest = tex_dir / f"{scene_name}.batch.json"
+    source_hash = hashlib.sha256(
+        Path(scene_file).read_bytes() + tex_template.body.encode()
+    ).hexdigest()
+
+    if manifest.exists():
+        cached = json.loads(manifest.read_text())
+        if cached["source"] == source_hash and all(
+            Path(svg).exists() for svg in cached["svgs"]
+        ):
+            return 0
+
+    requests, complete = collect_tex(scene_file, scene_name, quality)
+    written = compile_batch(requests, tex_template)
+    if complete:
+        svgs = [str(Path(generate_tex_file(e, env, tex_template)).with_suffix(".svg"))
+                for e, env in requests]
+        manifest.write_text(json.dumps({"source": source_hash, "svgs": svgs}, indent=1))
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compile all TeX strings of a scene in a single LaTeX run.",
+    )
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="high")
+    args = parser.parse_args(argv)
+
+    written = precompile_scene_tex(args.scene_file, args.scene_name, args.quality)
+    print(f"{written} TeX string(s) compiled in one batch")
+
+
+if __name__ == "__main__":
+    main()
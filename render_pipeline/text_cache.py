@@ -0,0 +1,173 @@
+"""
+Persistent glyph cache for Text mobjects.
+
+Every ``Text`` is shaped by Pango and parsed back from SVG on each run,
+even though the scenes reuse the same strings, fonts and sizes over and over
+(and ``DataToVector`` builds its patient table cell by cell). ``CachedText``
+keys the parsed outlines on everything that affects geometry — string,
+font, size, slant, weight, spacing — but not on color, and keeps them in an
+in-memory LRU backed by ``.npz`` files under ``media/glyph_cache``. The disk
+cache is shared by every scene and run, and is trimmed by least-recent use
+when it grows past ``max_bytes``.
+
+Usage, right after ``from manim import *`` in a scene file:
+    from render_pipeline.text_cache import CachedText as Text
+"""
+
+import hashlib
+import os
+import tempfile
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+
+import manimpango
+import numpy as np
+from manim import Text, VMobject, config
+
+PLACEHOLDER_SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1"/>\n'
+
+
+class GlyphCache:
+    """Two-level LRU cache of glyph outlines: memory first, then disk."""
+
+    def __init__(self, directory=None, max_bytes=64 * 2**20, max_entries=1024):
+        self._directory = Path(directory) if directory is not None else None
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self._disk_bytes = None
+
+    @property
+    def directory(self):
+        if self._directory is None:
+            self._directory = Path(config.media_dir) / "glyph_cache"
+        return self._directory
+
+    def placeholder(self, key):
+        """A fresh SVG file to hand to manim when the outlines of ``key`` come
+        from the cache.
+
+        Text rewrites the file it is given (``remove_last_M``), so every Text
+        gets its own file rather than sharing one across threads and worker
+        processes; the caller deletes it once the Text is built.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix=f"placeholder_{key}_", suffix=".svg", dir=self.directory)
+        with os.fdopen(fd, "w") as f:
+            f.write(PLACEHOLDER_SVG)
+        return path
+
+    def get(self, key):
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        path = self.directory / f"{key}.npz"
+        try:
+            with np.load(path) as data:
+                outlines = [data[f"arr_{i}"] for i in range(len(data.files))]
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return None
+        os.utime(path)   # disk eviction goes by mtime
+        self._remember(key, outlines)
+        return outlines
+
+    def put(self, key, outlines):
+        self._remember(key, outlines)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, partial = tempfile.mkstemp(suffix=".partial", dir=self.directory)
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, *outlines)
+        path = self.directory / f"{key}.npz"
+        os.replace(partial, path)
+
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(p.stat().st_size for p in self.directory.glob("*.npz"))
+        else:
+            self._disk_bytes += path.stat().st_size
+        if self._disk_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Drop least recently used files until the disk cache is under 90% of the cap."""
+        entries = sorted(
+            ((p.stat().st_mtime, p.stat().st_size, p) for p in self.directory.glob("*.npz")),
+            key=lambda entry: entry[0],
+        )
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= 0.9 * self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._disk_bytes = total
+
+    def _remember(self, key, outlines):
+        self._memory[key] = outlines
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+GLYPH_CACHE = GlyphCache()
+
+
+def glyph_key(text):
+    """Color-independent cache key of a Text being built, or None if uncacheable.
+
+    Per-substring colors and gradients are baked into Pango's SVG, so texts
+    using them always take manim's normal path.
+    """
+    if text.t2c or text.t2g or text.gradient:
+        return None
+    fields = (
+        text.text, text.font, text._font_size, text.slant, text.weight,
+        text.line_spacing, text.disable_ligatures,
+        sorted(text.t2f.items()), sorted(text.t2s.items()), sorted(text.t2w.items()),
+        config.pixel_width, config.pixel_height, manimpango.__version__,
+    )
+    return hashlib.sha1(repr(fields).encode()).hexdigest()
+
+
+class CachedText(Text):
+    """Drop-in ``Text`` that reuses glyph outlines across scenes and runs.
+
+    Cache hits and misses build the same mobjects: plain ``VMobject`` glyphs
+    from the outline points, under the file name manim would have used. The
+    mobject's ``__dict__`` and therefore manim's play hashes (and the beat
+    keys built on them) do not depend on the state of the glyph cache.
+    """
+
+    def _text2svg(self, color):
+        self._glyph_color = color
+        self._glyph_key = glyph_key(self)
+        self._glyph_outlines = None
+        if self._glyph_key is not None:
+            self._glyph_outlines = GLYPH_CACHE.get(self._glyph_key)
+            if self._glyph_outlines is not None:
+                return GLYPH_CACHE.placeholder(self._glyph_key)
+        return super()._text2svg(color)
+
+    def init_svg_mobject(self, use_svg_cache):
+        color, key, outlines = self._glyph_color, self._glyph_key, self._glyph_outlines
+        del self._glyph_color, self._glyph_key, self._glyph_outlines
+
+        if outlines is not None:
+            Path(self.file_name).unlink(missing_ok=True)
+            text_dir = Path(config.get_dir("text_dir"))
+            self.file_name = (text_dir / f"{self._text2hash(color)}.svg").resolve()
+        else:
+            super().init_svg_mobject(use_svg_cache)
+            if key is None or any(mob.submobjects for mob in self.submobjects):
+                return
+            outlines = [mob.points.copy() for mob in self.submobjects]
+            GLYPH_CACHE.put(key, outlines)
+            self.remove(*self.submobjects)
+
+        glyphs = []
+        for points in outlines:
+            glyph = VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0)
+            glyph.set_points(points)
+            glyphs.append(glyph)
+        self.add(*glyphs)
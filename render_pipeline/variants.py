@@ -0,0 +1,136 @@
+"""
+Batch variant rendering: palettes, locales and data sets of one scene.
+
+A variant is a name plus overrides for the scene file's module constants
+(the ``BG_COLOR``/``VECTOR_*`` palette) and for attributes of the scene
+class (``DataToVector.title``, ``rows_data``, …). All variants of a batch
+render in one warm process, one after another: manim and the scene module
+are imported once, and what the variants share stays cached in memory
+between them — glyph outlines (``CachedText`` keys them without color),
+parsed Tex/MathTex SVGs, and baked static layers for each background.
+With ``workers`` > 1 the variants are dealt round-robin to a process pool,
+each worker rendering its share warm.
+
+Variants file (JSON):
+    [
+      {"name": "light", "constants": {"BG_COLOR": "#F5F5F0", "TEXT_COLOR": "#111122"}},
+      {"name": "es", "attributes": {"title": "¿Qué es un vector?"}},
+      {"name": "cohort_b", "attributes": {"rows_data": [["Patient 1", "44", "131"]]}}
+    ]
+
+Usage:
+    python -m render_pipeline.variants manim_scenes.py DataToVector \\
+        variants.json -o frames/variants -j 2
+"""
+
+import argparse
+import json
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from .common import QUALITIES, load_scene_class, load_scene_module, module_constants
+from .parallel import FrameRangeRenderer, run_scene_class, stitch_frames
+
+
+@contextmanager
+def applied(scene_file, scene_name, variant):
+    """Patch the scene module for ``variant``; yields the variant's scene class."""
+    module = load_scene_module(scene_file)
+    scene_cls = load_scene_class(scene_file, scene_name)
+    constants = variant.get("constants", {})
+    attributes = variant.get("attributes", {})
+
+    unknown = set(constants) - set(module_constants(scene_file))
+    unknown |= {f"{scene_name}.{name}" for name in attributes if not hasattr(scene_cls, name)}
+    if unknown:
+        raise ValueError(f"variant {variant['name']!r} overrides unknown names: "
+                         f"{', '.join(sorted(unknown))}")
+
+    saved = {name: getattr(module, name) for name in constants}
+    try:
+        for name, value in constants.items():
+            setattr(module, name, value)
+        # A subclass keeps the scene's own class attributes untouched.
+        yield type(scene_name, (scene_cls,), dict(attributes))
+    finally:
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+
+def render_variant(scene_file, scene_name, variant, output_dir, quality="high"):
+    """Render one variant to a PNG sequence; returns the frame count."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".variant_", dir=output_dir.parent))
+    try:
+        renderer = FrameRangeRenderer(frame_dir=staging)
+        with applied(scene_file, scene_name, variant) as scene_cls:
+            run_scene_class(scene_cls, quality, renderer)
+        counts = renderer.frame_counts
+        play_frames = [
+            (staging / f"play_{index:04d}", counts[index]) for index in sorted(counts)
+        ]
+        return stitch_frames(play_frames, output_dir)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _render_batch(scene_file, scene_name, variants, output_root, quality):
+    return {
+        variant["name"]: render_variant(scene_file, scene_name, variant,
+                                        Path(output_root) / variant["name"], quality)
+        for variant in variants
+    }
+
+
+def render_variants(scene_file, scene_name, variants, output_root, quality="high", workers=1):
+    """Render every variant into ``output_root/<name>``.
+
+    Returns ``{name: frame count}`` in the order of ``variants``.
+    """
+    names = [variant["name"] for variant in variants]
+    if len(set(names)) != len(names):
+        raise ValueError("variant names must be unique")
+
+    workers = max(1, min(workers or 1, len(variants)))
+    if workers == 1:
+        counts = _render_batch(scene_file, scene_name, variants, output_root, quality)
+    else:
+        counts = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_render_batch, scene_file, scene_name, variants[i::workers],
+                            output_root, quality)
+                for i in range(workers)
+            ]
+            for future in futures:
+                counts.update(future.result())
+    return {name: counts[name] for name in names}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render theme, locale and data variants of a scene in warm processes.",
+    )
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("variants", help="JSON list of {name, constants, attributes}")
+    parser.add_argument("-o", "--output", required=True,
+                        help="root directory; each variant gets a subdirectory")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="high")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="worker processes, each rendering its variants in turn")
+    args = parser.parse_args(argv)
+
+    variants = json.loads(Path(args.variants).read_text())
+    counts = render_variants(args.scene_file, args.scene_name, variants, args.output,
+                             args.quality, args.workers)
+    for name, frames in counts.items():
+        print(f"{name}: {frames} frames written to {Path(args.output) / name}")
+
+
+if __name__ == "__main__":
+    main()
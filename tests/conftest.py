@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# render_pipeline is imported from the repository root, not installed
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
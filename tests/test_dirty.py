@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from render_pipeline.dirty import merge_rects
+
+
+def test_disjoint_rects_are_kept():
+    rects = [(0, 0, 10, 10), (20, 0, 30, 10)]
+    assert sorted(merge_rects(rects)) == rects
+
+
+def test_touching_edges_do_not_merge():
+    rects = [(0, 0, 10, 10), (10, 0, 20, 10)]
+    assert sorted(merge_rects(rects)) == rects
+
+
+def test_overlapping_rects_merge():
+    assert merge_rects([(0, 0, 10, 10), (5, 5, 15, 15)]) == [(0, 0, 15, 15)]
+
+
+def test_merges_cascade():
+    # (0..10) and (20..30) only overlap once (8..22) has joined the first
+    rects = [(0, 0, 10, 10), (20, 0, 30, 10), (8, 0, 22, 10)]
+    assert merge_rects(rects) == [(0, 0, 30, 10)]
+
+
+def test_too_many_rects_collapse_to_their_bounds():
+    rects = [(x, 0, x + 1, 1) for x in range(0, 20, 2)]
+    assert merge_rects(rects, limit=4) == [(0, 0, 19, 1)]
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from render_pipeline.export import find_holds, write_timeline
+
+
+def write_frames(directory, values):
+    paths = []
+    for index, value in enumerate(values, start=1):
+        path = directory / f"frame_{index:04d}.png"
+        Image.fromarray(np.full((4, 6, 3), value, dtype=np.uint8)).save(path)
+        paths.append(path)
+    return paths
+
+
+def test_no_frames_no_holds():
+    assert find_holds([]) == []
+
+
+def test_identical_frames_form_one_hold(tmp_path):
+    paths = write_frames(tmp_path, [10, 10, 10, 200, 200, 10])
+    assert find_holds(paths) == [(paths[0], 3), (paths[3], 2), (paths[5], 1)]
+
+
+def test_tolerance_joins_near_identical_frames(tmp_path):
+    paths = write_frames(tmp_path, [10, 11, 10])
+    assert find_holds(paths) == [(paths[0], 1), (paths[1], 1), (paths[2], 1)]
+    assert find_holds(paths, tolerance=1) == [(paths[0], 3)]
+
+
+def test_slow_fade_is_compared_against_the_first_frame(tmp_path):
+    paths = write_frames(tmp_path, [10, 11, 12, 13])
+    assert find_holds(paths, tolerance=1) == [(paths[0], 2), (paths[2], 2)]
+
+
+def test_timeline_writes_rate_only_when_it_changes(tmp_path):
+    holds = [("a.png", 3), ("b.png", 3), ("c.png", 1)]
+    path = tmp_path / "timeline.txt"
+    write_timeline(holds, path, fps=30)
+    assert path.read_text().splitlines() == [
+        "% animate timeline: 3 unique frames, 7 at 30 fps",
+        ":10:frame_0001",
+        "::frame_0002",
+        ":30:frame_0003",
+    ]
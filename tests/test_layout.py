@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from render_pipeline.layout import (
+    KEEP_OUT_RADIUS, LAYOUT_BOUNDS, MIN_LAYOUT_SCALE, auto_layout, estimate_scale, fit_layout,
+)
+
+ANCHORS = [(5.0 * np.cos(a), 2.3 * np.sin(a))
+           for a in np.pi / 2 + 2 * np.pi * (np.arange(6) + 0.5) / 6]
+
+
+def word_groups(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [[(1.0, 0.25)] + [(rng.uniform(1.2, 2.2), 0.3) for _ in range(n)] for _ in range(6)]
+
+
+def placed_boxes(groups, centers, scale):
+    return [(cx - w * scale / 2, cy - h * scale / 2, cx + w * scale / 2, cy + h * scale / 2)
+            for sizes, group_centers in zip(groups, centers)
+            for (w, h), (cx, cy) in zip(sizes, group_centers)]
+
+
+def assert_valid(boxes):
+    x0, y0, x1, y1 = LAYOUT_BOUNDS
+    for box in boxes:
+        assert x0 <= box[0] and box[2] <= x1 and y0 <= box[1] and box[3] <= y1
+        nx, ny = min(max(0.0, box[0]), box[2]), min(max(0.0, box[1]), box[3])
+        assert nx * nx + ny * ny >= KEEP_OUT_RADIUS ** 2
+    for i, a in enumerate(boxes):
+        for b in boxes[i + 1:]:
+            assert not (a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3])
+
+
+def test_few_words_keep_full_size():
+    groups = word_groups(3)
+    scale, centers = fit_layout(groups, ANCHORS)
+    assert scale == 1.0
+    assert_valid(placed_boxes(groups, centers, scale))
+
+
+def test_hundreds_of_words_per_category_fit():
+    groups = word_groups(200)
+    scale, centers = fit_layout(groups, ANCHORS)
+    assert MIN_LAYOUT_SCALE <= scale < 0.5
+    assert all(c is not None for group in centers for c in group)
+    assert_valid(placed_boxes(groups, centers, scale))
+
+
+def test_estimate_is_capped_at_full_size():
+    assert estimate_scale([[(0.5, 0.2)]]) == 1.0
+    assert estimate_scale(word_groups(400)) < estimate_scale(word_groups(200)) < 1.0
+
+
+def test_auto_layout_raises_when_a_box_cannot_fit():
+    with pytest.raises(ValueError):
+        auto_layout([[(20.0, 0.3)]], ANCHORS[:1])
+
+
+def test_fit_layout_raises_when_nothing_fits():
+    full_screen = [LAYOUT_BOUNDS]
+    with pytest.raises(ValueError):
+        fit_layout(word_groups(3), ANCHORS, occupied=full_screen)
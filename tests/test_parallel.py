@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from render_pipeline.parallel import plan_ranges, stitch_frames
+
+
+def test_ranges_are_contiguous_and_balanced():
+    ranges = plan_ranges([1.0] * 9, 3)
+    assert ranges == [range(0, 3), range(3, 6), range(6, 9)]
+
+
+def test_split_follows_cumulative_cost():
+    # target 14/3: the expensive play closes the first range
+    assert plan_ranges([1.0, 1.0, 10.0, 1.0, 1.0], 3) == [range(0, 3), range(3, 5)]
+
+
+def test_more_jobs_than_plays_leaves_no_empty_range():
+    ranges = plan_ranges([5.0, 1.0], 4)
+    assert ranges == [range(0, 1), range(1, 2)]
+    assert all(len(r) for r in ranges)
+
+
+def test_single_job_takes_everything():
+    assert plan_ranges([3.0, 1.0, 2.0], 1) == [range(0, 3)]
+
+
+def make_play(directory, name, contents):
+    play_dir = directory / name
+    play_dir.mkdir()
+    for index, content in enumerate(contents, start=1):
+        (play_dir / f"frame_{index:04d}.png").write_text(content)
+    return play_dir
+
+
+def test_stitch_renumbers_and_removes_stale_frames(tmp_path):
+    first = make_play(tmp_path, "play_0", ["a", "b"])
+    second = make_play(tmp_path, "play_1", ["c"])
+    output = tmp_path / "out"
+    output.mkdir()
+    (output / "frame_0009.png").write_text("stale")
+
+    assert stitch_frames([(first, 2), (second, 1)], output) == 3
+    assert sorted(p.name for p in output.iterdir()) == [
+        "frame_0001.png", "frame_0002.png", "frame_0003.png",
+    ]
+    assert [(output / f"frame_000{i}.png").read_text() for i in (1, 2, 3)] == ["a", "b", "c"]
+    assert not (first / "frame_0001.png").exists()
+
+
+def test_stitch_link_keeps_sources(tmp_path):
+    play = make_play(tmp_path, "play_0", ["a"])
+    stitch_frames([(play, 1)], tmp_path / "out", digits=6, link=True)
+    assert (play / "frame_0001.png").exists()
+    assert (tmp_path / "out" / "frame_000001.png").read_text() == "a"
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("PIL")
+
+from render_pipeline.quantize import PALETTE_SIZE, quantize_frame, rgb_to_lab, theme_palette
+
+PALETTE = theme_palette(["#00FFFF", "#FF6EC7"], "#0D1117")
+
+
+def decoded(image):
+    return np.asarray(image.convert("RGB"))
+
+
+def test_lab_of_white_and_black():
+    np.testing.assert_allclose(rgb_to_lab([255, 255, 255]), [100, 0, 0], atol=0.1)
+    np.testing.assert_allclose(rgb_to_lab([0, 0, 0]), [0, 0, 0], atol=1e-9)
+
+
+def test_theme_palette_ramps_from_background():
+    colors = {tuple(c) for c in PALETTE}
+    assert PALETTE.dtype == np.uint8
+    assert len(colors) == len(PALETTE) <= PALETTE_SIZE
+    for color in [(0x0D, 0x11, 0x17), (0x00, 0xFF, 0xFF), (0xFF, 0x6E, 0xC7), (255, 255, 255)]:
+        assert color in colors
+
+
+def test_palette_colors_are_encoded_exactly():
+    pixels = PALETTE[np.arange(24) % len(PALETTE)].reshape(4, 6, 3)
+    image = quantize_frame(pixels, PALETTE)
+    assert image.mode == "P"
+    np.testing.assert_array_equal(decoded(image), pixels)
+
+
+def test_missing_colors_top_up_the_palette():
+    pixels = np.tile(PALETTE[0], (4, 6, 1))
+    pixels[0, :3] = (200, 30, 30)
+    image = quantize_frame(pixels, PALETTE)
+    assert image is not None
+    assert len(image.getpalette()) // 3 == len(PALETTE) + 1
+    np.testing.assert_array_equal(decoded(image), pixels)
+
+
+def test_transparent_frames_are_left_alone():
+    pixels = np.zeros((2, 2, 4), dtype=np.uint8)
+    pixels[..., 3] = 255
+    pixels[0, 0, 3] = 128
+    assert quantize_frame(pixels, PALETTE) is None
+
+
+def test_too_many_distinct_colors_give_up():
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, size=(64, 64, 3), dtype=np.uint8)
+    assert quantize_frame(pixels, PALETTE) is None